@@ -2,18 +2,25 @@ DefineUsage[PyECLRequest,
 	{
 		BasicDefinitions -> {
 			{"PyECLRequest[endpoint]", "response", "Makes a request to the PyECL server at the given 'endpoint' and returns the response."},
-			{"PyECLRequest[endpoint, body]", "response", "Makes a request to the PyECL server at the given 'endpoint' with the given 'body' and returns the response."}
+			{"PyECLRequest[endpoint, body]", "response", "Makes a request to the PyECL server at the given 'endpoint' with the given 'body' and returns the response."},
+			{"PyECLRequest[requests]", "responses", "Makes all of the 'requests' to the PyECL server at once and returns their responses in the same order."}
 		},
 		MoreInformation -> {
 			"The PyECLRequest function is used to make requests to the PyECL server. It uses Mathematica's built-in URLRead and HTTPRequest functions.",
-			"When the body contains File[] objects, the request will be sent as multipart form data. Otherwise, it defaults to JSON content."
+			"When the body contains File[] objects, the request will be sent as multipart form data. Otherwise, it defaults to JSON content.",
+			"When a list of requests is given, they are all sent together in a single parallel URLRead instead of one round trip after another. Only the requests which failed are re-sent on retry, and any request which still fails is returned as $Failed in its position.",
+			"When a list of requests is given, they are sent in groups of BatchSize, each group in one parallel URLRead. URLRead does not reuse connections between calls, so every request makes its own connection to the server.",
+			"$PyECLRequestStatistics holds the number of calls, HTTP requests (including retries) and failures, and the total time spent waiting on the server, for each host contacted in this kernel session.",
+			"The WireFormat option negotiates a binary encoding with the server. Bodies sent as WXF are compressed and store numeric arrays as raw machine numbers, and WXF responses are decoded with BinaryDeserialize. A server which does not accept WXF answers with 415 Unsupported Media Type; the request is then re-sent as JSON and that host is only sent JSON for the rest of the session. With WireFormat -> Automatic, WXF responses are only asked for from a host which has already accepted a WXF body or replied in WXF."
 		},
 		Input :> {
 			{"endpoint", "String", "The endpoint to make the request to."},
-			{"body", "Association", "The body of the HTTP request. If no body is provided, a GET request will be made, otherwise a POST request will be made. File[] objects in the body will trigger multipart form data."}
+			{"body", "Association", "The body of the HTTP request. If no body is provided, a GET request will be made, otherwise a POST request will be made. File[] objects in the body will trigger multipart form data."},
+			{"requests", "{(endpoint|{endpoint, body})..}", "The requests to make, each given either as an endpoint (for a GET request) or as an endpoint and body."}
 		},
 		Output :> {
-			{"response", "Association", "The response from the server."}
+			{"response", "Association", "The response from the server."},
+			{"responses", "{(Association|$Failed)..}", "The response from the server for each request, in the order the requests were given."}
 		},
 		SeeAlso -> {"HTTPRequestJSON"},
 		Author -> {"robert"}
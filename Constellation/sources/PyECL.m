@@ -1,91 +1,290 @@
 DefineOptions[PyECLRequest,
 	Options :> {
 		{BaseURL -> Automatic, Automatic|_String, "The server's URL to use for the request. This can be set to localhost for development purposes."},
-		{Retries -> 3, _Integer, "The number of times to retry the HTTP request if it fails."}
+		{Retries -> 3, _Integer, "The number of times to retry the HTTP request if it fails."},
+		{BatchSize -> 16, _Integer?Positive, "The number of requests which are sent together in one parallel URLRead when a list of requests is given. Larger lists are sent in consecutive groups of this size."},
+		{WireFormat -> Automatic, Automatic|"JSON"|"WXF", "The encoding used for request bodies and asked for in responses. \"WXF\" sends bodies as compressed Wolfram Exchange Format, which stores numeric arrays as raw machine numbers, and asks the server to reply in WXF. \"JSON\" always uses JSON. Automatic sends bodies larger than a megabyte as WXF, and only asks for WXF responses from a server which has already accepted WXF in this session. Whenever the server does not accept WXF, the request is re-sent as JSON, which uses up one of its Retries."}
 	}
 ];
 
+(* Running totals of the requests made by PyECLRequest in this kernel session, keyed by host. Each entry counts the calls
+which were made, the HTTP requests which were sent (including retries), the calls which failed after all retries and the
+total seconds spent waiting on the server. *)
+If[Not[ValueQ[$PyECLRequestStatistics]],
+	$PyECLRequestStatistics=<||>;
+];
+
+(* hosts which have rejected a WXF body in this session, which are only sent JSON from then on *)
+If[Not[ValueQ[$pyECLJSONOnlyHosts]],
+	$pyECLJSONOnlyHosts=<||>;
+];
+
+(* hosts which have accepted a WXF body or replied in WXF in this session, which Automatic WireFormat asks for WXF responses from *)
+If[Not[ValueQ[$pyECLWXFHosts]],
+	$pyECLWXFHosts=<||>;
+];
+
+(* Automatic WireFormat sends bodies larger than this many bytes as WXF *)
+$pyECLWXFThreshold=10^6;
+
 PyECLRequest::HTTPRequestFailed = "The server returned an error when attempting to perform the HTTP requests. Request: `1`. Response `2`.";
+PyECLRequest::BatchRequestFailed = "The server returned an error for the batched requests at positions `1` (endpoints `2`). These entries have been returned as $Failed.";
 PyECLRequest[endpoint_String,ops:OptionsPattern[]]:=PyECLRequest[endpoint, Null, ops];
 PyECLRequest[endpoint_String, body:(Null|_Association), ops:OptionsPattern[]]:=Module[
-	{response, fullEndpoint, baseEndpoint, retryCount, maxRetries, requestAssoc, contentType, requestBody},
-
-	(* resolve the endpoint based on the database *)
-	baseEndpoint = Which[
-		!MatchQ[OptionValue[BaseURL], Automatic],
-			OptionValue[BaseURL],
-		ProductionQ[],
-			"https://api.emeraldcloudlab.com/",
-		True,
-			"https://api-stage.emeraldcloudlab.com/"
-	];
+	{response, fullEndpoint, retryCount, maxRetries, httpRequest, wireFormat, bodyFormat},
 
 	(* create the full endpoint *)
-	fullEndpoint = StringJoin[baseEndpoint, endpoint];
+	fullEndpoint = StringJoin[pyECLBaseEndpoint[OptionValue[BaseURL]], endpoint];
 
-	(* determine content type and body format based on body content *)
-	{contentType, requestBody} = Which[
-		MatchQ[body, Null],
-			{"application/json", ""},
-		(* Check if body contains File[] objects for multipart *)
-		!FreeQ[body, _File],
-			{"multipart/form-data", body},
-		(* Default to JSON *)
-		True,
-			{"application/json", ExportJSON[body]}
-	];
-
-	(* prepare the request association *)
-	requestAssoc = Association[
-		"Method" -> If[MatchQ[body, Null], "GET", "POST"],
-		"Headers" -> <|
-			"Authorization" -> "Bearer " <> GoLink`Private`stashedJwt,
-			"Content-Type" -> contentType,
-			(* If we are not using the default production or test URL, we need to send the X-Constellation-Host header
-			such that the python server knows which database to use, otherwise it will use the stage database or prod *)
-			If[!MemberQ[Join[productionObjStoreURLs, testObjStoreURLs], Global`$ConstellationDomain],
-				"X-Constellation-Host" -> Global`$ConstellationDomain,
-				Nothing
-			]
-		|>,
-		If[!MatchQ[requestBody, ""],
-			"Body" -> requestBody,
-			Nothing
-		]
-	];
+	wireFormat = OptionValue[WireFormat];
+	bodyFormat = pyECLBodyFormat[fullEndpoint, body, wireFormat];
+	httpRequest = pyECLHTTPRequest[fullEndpoint, body, bodyFormat, wireFormat];
 
 	(* implement retry logic *)
 	maxRetries = OptionValue[Retries];
 	retryCount = 0;
-	
+
 	While[retryCount <= maxRetries,
-		response = URLRead[HTTPRequest[fullEndpoint, requestAssoc]];
+		response = pyECLRead[httpRequest];
+
+		(* If the server does not accept WXF, re-send the body as JSON; this counts as a retry like any other re-send *)
+		If[pyECLWXFRejectedQ[response, bodyFormat],
+			pyECLFallBackToJSON[fullEndpoint];
+			bodyFormat = "JSON";
+			httpRequest = pyECLHTTPRequest[fullEndpoint, body, bodyFormat, wireFormat];
+			retryCount++;
+			Continue[]
+		];
+
 		(* Check if request was successful *)
-		If[MatchQ[response, _HTTPResponse] && response["StatusCode"] < 400,
+		If[pyECLSuccessQ[response],
 			(* Success - return the body *)
-			(* Weirdly mathematica renames Content-Type to ContentType in the response,
-			despite our server using/sending Content-Type *)
-			formattedResponse = If[MatchQ[response["ContentType"], "application/json"],
-				importJSONToAssociation[response["Body"]],
-				response["Body"]
-			];
-			Return[formattedResponse],
+			recordPyECLCalls[fullEndpoint, 1, 0];
+			recordPyECLWXFSupport[fullEndpoint, response, bodyFormat];
+			Return[pyECLFormatResponse[response]],
 			(* Failure - increment retry count *)
 			retryCount++
 		];
-		
+
 		(* If we've exhausted retries, break *)
 		If[retryCount > maxRetries,
 			Break[]
 		];
-		
+
 	];
 
 	(* If we get here, all retries failed *)
+	recordPyECLCalls[fullEndpoint, 1, 1];
 	Message[PyECLRequest::HTTPRequestFailed, fullEndpoint, response];
 	$Failed
 ];
 
+(* Batched form: all requests are sent together in a single parallel URLRead rather than one round trip after another.
+Results come back in the order of the input, with $Failed in place of any request that still fails after retrying. *)
+PyECLRequest[{}, ops:OptionsPattern[]]:={};
+PyECLRequest[requests:{(_String|{_String, Null|_Association})..}, ops:OptionsPattern[]]:=Module[
+	{
+		expandedRequests, baseEndpoint, fullEndpoints, httpRequests, responses, pending, retryCount, maxRetries, batchSize,
+		wireFormat, bodyFormats, rejected
+	},
+
+	(* a bare endpoint is a GET request *)
+	expandedRequests = Replace[requests, endpoint_String :> {endpoint, Null}, {1}];
+
+	baseEndpoint = pyECLBaseEndpoint[OptionValue[BaseURL]];
+	fullEndpoints = StringJoin[baseEndpoint, #]& /@ expandedRequests[[All, 1]];
+	wireFormat = OptionValue[WireFormat];
+	bodyFormats = MapThread[pyECLBodyFormat[#1, #2, wireFormat]&, {fullEndpoints, expandedRequests[[All, 2]]}];
+	httpRequests = MapThread[pyECLHTTPRequest[#1, #2, #3, wireFormat]&, {fullEndpoints, expandedRequests[[All, 2]], bodyFormats}];
+
+	(* only the requests which have failed so far are re-sent on each retry *)
+	maxRetries = OptionValue[Retries];
+	batchSize = OptionValue[BatchSize];
+	retryCount = 0;
+	responses = ConstantArray[Null, Length[httpRequests]];
+	pending = Range[Length[httpRequests]];
+
+	While[Length[pending] > 0 && retryCount <= maxRetries,
+		responses[[pending]] = pyECLRead[httpRequests[[pending]], batchSize];
+		Scan[
+			If[pyECLSuccessQ[responses[[#]]], recordPyECLWXFSupport[fullEndpoints[[#]], responses[[#]], bodyFormats[[#]]]]&,
+			pending
+		];
+		pending = Select[pending, !pyECLSuccessQ[responses[[#]]]&];
+
+		(* re-send any WXF bodies which the server did not accept as JSON; like every other re-send, this counts as a retry *)
+		rejected = Select[pending, pyECLWXFRejectedQ[responses[[#]], bodyFormats[[#]]]&];
+		If[Length[rejected] > 0,
+			Scan[pyECLFallBackToJSON, fullEndpoints[[rejected]]];
+			bodyFormats[[rejected]] = "JSON";
+			httpRequests[[rejected]] = MapThread[
+				pyECLHTTPRequest[#1, #2, "JSON", wireFormat]&,
+				{fullEndpoints[[rejected]], expandedRequests[[rejected, 2]]}
+			]
+		];
+		retryCount++
+	];
+
+	KeyValueMap[
+		recordPyECLCalls[#1, Length[#2], Length[Intersection[#2, pending]]]&,
+		PositionIndex[fullEndpoints]
+	];
+
+	If[Length[pending] > 0,
+		Message[PyECLRequest::BatchRequestFailed, pending, fullEndpoints[[pending]]]
+	];
+
+	MapIndexed[
+		If[MemberQ[pending, First[#2]],
+			$Failed,
+			pyECLFormatResponse[#1]
+		]&,
+		responses
+	]
+];
+
+
+(* resolve the endpoint based on the database *)
+pyECLBaseEndpoint[baseURL:Automatic|_String]:=Which[
+	!MatchQ[baseURL, Automatic],
+		baseURL,
+	ProductionQ[],
+		"https://api.emeraldcloudlab.com/",
+	True,
+		"https://api-stage.emeraldcloudlab.com/"
+];
+
+(* determine the body format based on body content and the WireFormat option *)
+pyECLBodyFormat[fullEndpoint_String, body:(Null|_Association), wireFormat:Automatic|"JSON"|"WXF"]:=Which[
+	MatchQ[body, Null],
+		None,
+	(* Check if body contains File[] objects for multipart *)
+	!FreeQ[body, _File],
+		"Multipart",
+	(* Default to JSON unless WXF is asked for and the host has not already turned it down *)
+	MatchQ[wireFormat, "JSON"] || KeyExistsQ[$pyECLJSONOnlyHosts, pyECLHost[fullEndpoint]],
+		"JSON",
+	MatchQ[wireFormat, "WXF"] || ByteCount[body] > $pyECLWXFThreshold,
+		"WXF",
+	True,
+		"JSON"
+];
+
+pyECLHTTPRequest[fullEndpoint_String, body:(Null|_Association), bodyFormat:(None|"Multipart"|"JSON"|"WXF"), wireFormat:Automatic|"JSON"|"WXF"]:=Module[
+	{contentType, requestBody, acceptWXFQ},
+
+	{contentType, requestBody} = Switch[bodyFormat,
+		None,
+			{"application/json", ""},
+		"Multipart",
+			{"multipart/form-data", body},
+		"WXF",
+			{"application/vnd.wolfram.wxf", BinarySerialize[body, PerformanceGoal -> "Size"]},
+		"JSON",
+			{"application/json", ExportJSON[body]}
+	];
+
+	(* only ask for WXF responses if WXF was asked for, or if this server has already shown that it supports WXF *)
+	acceptWXFQ = Or[
+		MatchQ[wireFormat, "WXF"],
+		MatchQ[wireFormat, Automatic] && KeyExistsQ[$pyECLWXFHosts, pyECLHost[fullEndpoint]]
+	];
+
+	(* prepare the request association *)
+	HTTPRequest[
+		fullEndpoint,
+		Association[
+			"Method" -> If[MatchQ[body, Null], "GET", "POST"],
+			"Headers" -> <|
+				"Authorization" -> "Bearer " <> GoLink`Private`stashedJwt,
+				"Content-Type" -> contentType,
+				(* when asking for WXF, JSON is still accepted, so that a server which does not support WXF can reply in JSON *)
+				"Accept" -> If[acceptWXFQ,
+					"application/vnd.wolfram.wxf, application/json;q=0.9, */*;q=0.8",
+					"application/json, */*;q=0.8"
+				],
+				(* If we are not using the default production or test URL, we need to send the X-Constellation-Host header
+				such that the python server knows which database to use, otherwise it will use the stage database or prod *)
+				If[!MemberQ[Join[productionObjStoreURLs, testObjStoreURLs], Global`$ConstellationDomain],
+					"X-Constellation-Host" -> Global`$ConstellationDomain,
+					Nothing
+				]
+			|>,
+			If[!MatchQ[requestBody, ""],
+				"Body" -> requestBody,
+				Nothing
+			]
+		]
+	]
+];
+
+(* send the requests in groups of batchSize, keeping track of how many were sent to each host and how long they took *)
+pyECLRead[httpRequest_HTTPRequest]:=Module[{time, response},
+	{time, response} = AbsoluteTiming[URLRead[httpRequest]];
+	recordPyECLRequests[{httpRequest}, time];
+	response
+];
+pyECLRead[httpRequests:{__HTTPRequest}, batchSize_Integer]:=Join@@Map[
+	Function[{group},
+		Module[{time, responses},
+			{time, responses} = AbsoluteTiming[URLRead[group]];
+			recordPyECLRequests[group, time];
+			responses
+		]
+	],
+	Partition[httpRequests, UpTo[batchSize]]
+];
+
+pyECLHost[url_String]:=Replace[URLParse[url, "Domain"], Except[_String] -> url];
+
+pyECLStatisticsEntry[host_String]:=Lookup[
+	$PyECLRequestStatistics,
+	host,
+	<|"Calls" -> 0, "Requests" -> 0, "Failures" -> 0, "Time" -> 0.|>
+];
+
+(* the time of a parallel group is shared out evenly between its hosts *)
+recordPyECLRequests[httpRequests:{__HTTPRequest}, time_?NumericQ]:=KeyValueMap[
+	Function[{host, count},
+		$PyECLRequestStatistics[host] = Merge[
+			{pyECLStatisticsEntry[host], <|"Requests" -> count, "Time" -> N[time * count / Length[httpRequests]]|>},
+			Total
+		]
+	],
+	Counts[pyECLHost[#["URL"]]& /@ httpRequests]
+];
+
+recordPyECLCalls[url_String, calls_Integer, failures_Integer]:=With[{host = pyECLHost[url]},
+	$PyECLRequestStatistics[host] = Merge[
+		{pyECLStatisticsEntry[host], <|"Calls" -> calls, "Failures" -> failures|>},
+		Total
+	]
+];
+
+pyECLSuccessQ[response_]:=MatchQ[response, _HTTPResponse] && response["StatusCode"] < 400;
+
+(* 415 Unsupported Media Type means the server cannot read a WXF body *)
+pyECLWXFRejectedQ[response_, bodyFormat_]:=MatchQ[bodyFormat, "WXF"] && MatchQ[response, _HTTPResponse] && response["StatusCode"] == 415;
+
+pyECLFallBackToJSON[url_String]:=($pyECLJSONOnlyHosts[pyECLHost[url]] = True);
+
+(* a successful response to a WXF body, or a response in WXF, shows that the host supports WXF *)
+recordPyECLWXFSupport[url_String, response_HTTPResponse, bodyFormat_]:=If[
+	MatchQ[bodyFormat, "WXF"] || MatchQ[response["ContentType"], "application/vnd.wolfram.wxf"],
+	$pyECLWXFHosts[pyECLHost[url]] = True
+];
+
+(* Weirdly mathematica renames Content-Type to ContentType in the response,
+despite our server using/sending Content-Type *)
+pyECLFormatResponse[response_HTTPResponse]:=Switch[response["ContentType"],
+	"application/json",
+		importJSONToAssociation[response["Body"]],
+	"application/vnd.wolfram.wxf",
+		BinaryDeserialize[response["BodyByteArray"]],
+	_,
+		response["Body"]
+];
+
 
 importJSONToAssociation[string_String]:=Module[{sanitizedString},
 	sanitizedString = StringReplace[
@@ -94,4 +293,4 @@ importJSONToAssociation[string_String]:=Module[{sanitizedString},
 	];
 	If[MatchQ[string, ""], Return[$Failed]];
 	ImportByteArray[StringToByteArray[sanitizedString], "RawJSON"]
-];
\ No newline at end of file
+];
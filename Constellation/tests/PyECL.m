@@ -57,6 +57,134 @@ DefineTests[PyECLRequest,
 				URLRead[req_HTTPRequest]:=HTTPResponse[ByteArray[ExportString[ExportJSON[Association["upload_id" -> "abc123"]],"Base64"]], <|"StatusCode" -> 200, "Headers" -> <||>, "ContentType" -> "application/json", "Cookies" -> <||>|>]
 			}
 		],
+		Example[{Basic, "Send several requests at once; results are returned in the order of the requests:"},
+			PyECLRequest[{"test/endpoint", {"engine/locations", Association["ids" -> {"id:12345"}]}}],
+			{Association["result" -> "success"], Association["result" -> "success"]},
+			Stubs :> {
+				URLRead[reqs:{___HTTPRequest}]:=Table[HTTPResponse[ByteArray[ExportString[ExportJSON[Association["result" -> "success"]],"Base64"]], <|"StatusCode" -> 200, "Headers" -> <||>, "ContentType" -> "application/json", "Cookies" -> <||>|>], Length[reqs]]
+			}
+		],
+		Example[{Messages, "BatchRequestFailed", "Batched requests that still fail after retrying are returned as $Failed without affecting the others:"},
+			PyECLRequest[{"good/endpoint", "bad/endpoint", "good/endpoint"}, Retries -> 1],
+			{Association["result" -> "success"], $Failed, Association["result" -> "success"]},
+			Stubs :> {
+				URLRead[reqs:{___HTTPRequest}]:=Map[
+					If[StringContainsQ[First[#], "bad"],
+						HTTPResponse[ByteArray[ToCharacterCode["Internal Server Error", "UTF8"]], <|"StatusCode" -> 500, "Headers" -> <||>, "ContentType" -> "application/json", "Cookies" -> <||>|>],
+						HTTPResponse[ByteArray[ExportString[ExportJSON[Association["result" -> "success"]],"Base64"]], <|"StatusCode" -> 200, "Headers" -> <||>, "ContentType" -> "application/json", "Cookies" -> <||>|>]
+					]&,
+					reqs
+				]
+			},
+			Messages :> {PyECLRequest::BatchRequestFailed}
+		],
+		Example[{Additional, "Only the batched requests that failed are re-sent when retrying:"},
+			Block[{sentCounts},
+				sentCounts = {};
+				{
+					PyECLRequest[{"good/endpoint", "flaky/endpoint"}, Retries -> 2],
+					sentCounts
+				}
+			],
+			{{Association["result" -> "success"], Association["result" -> "success"]}, {2, 1}},
+			Stubs :> {
+				URLRead[reqs:{___HTTPRequest}]:=(
+					AppendTo[sentCounts, Length[reqs]];
+					Map[
+						If[StringContainsQ[First[#], "flaky"] && Length[sentCounts] == 1,
+							HTTPResponse[ByteArray[ToCharacterCode["Service Unavailable", "UTF8"]], <|"StatusCode" -> 503, "Headers" -> <||>, "ContentType" -> "application/json", "Cookies" -> <||>|>],
+							HTTPResponse[ByteArray[ExportString[ExportJSON[Association["result" -> "success"]],"Base64"]], <|"StatusCode" -> 200, "Headers" -> <||>, "ContentType" -> "application/json", "Cookies" -> <||>|>]
+						]&,
+						reqs
+					]
+				)
+			}
+		],
+		Example[{Options, BatchSize, "Set the number of batched requests which are sent to the server together:"},
+			Block[{sentCounts},
+				sentCounts = {};
+				PyECLRequest[Table["test/endpoint", 5], BatchSize -> 2];
+				sentCounts
+			],
+			{2, 2, 1},
+			Stubs :> {
+				URLRead[reqs:{___HTTPRequest}]:=(
+					AppendTo[sentCounts, Length[reqs]];
+					Table[HTTPResponse[ByteArray[ExportString[ExportJSON[Association["result" -> "success"]],"Base64"]], <|"StatusCode" -> 200, "Headers" -> <||>, "ContentType" -> "application/json", "Cookies" -> <||>|>], Length[reqs]]
+				)
+			}
+		],
+		Example[{Additional, "Requests, failures and time spent waiting on the server are tallied per host in $PyECLRequestStatistics:"},
+			Block[{$PyECLRequestStatistics = <||>},
+				PyECLRequest["test/endpoint", BaseURL -> "https://custom-server.com/"];
+				PyECLRequest[{"test/endpoint", "test/endpoint"}, BaseURL -> "https://custom-server.com/"];
+				KeyDrop[$PyECLRequestStatistics["custom-server.com"], "Time"]
+			],
+			<|"Calls" -> 3, "Requests" -> 3, "Failures" -> 0|>,
+			Stubs :> {
+				URLRead[req_HTTPRequest]:=HTTPResponse[ByteArray[ExportString[ExportJSON[Association["result" -> "success"]],"Base64"]], <|"StatusCode" -> 200, "Headers" -> <||>, "ContentType" -> "application/json", "Cookies" -> <||>|>],
+				URLRead[reqs:{___HTTPRequest}]:=Table[HTTPResponse[ByteArray[ExportString[ExportJSON[Association["result" -> "success"]],"Base64"]], <|"StatusCode" -> 200, "Headers" -> <||>, "ContentType" -> "application/json", "Cookies" -> <||>|>], Length[reqs]]
+			}
+		],
+		Example[{Options, WireFormat, "Send the body as compressed WXF; numeric arrays are decoded from a WXF response without going through JSON text:"},
+			PyECLRequest["analysis/downsample", Association["data" -> RandomReal[1, {1000, 2}]], WireFormat -> "WXF"],
+			Association["data" -> _?(MatrixQ[#, NumericQ]&)],
+			Stubs :> {
+				URLRead[req_HTTPRequest]:=If[MatchQ[req["ContentType"], "application/vnd.wolfram.wxf"],
+					HTTPResponse[BinarySerialize[Association["data" -> RandomReal[1, {500, 2}]]], <|"StatusCode" -> 200, "Headers" -> <||>, "ContentType" -> "application/vnd.wolfram.wxf", "Cookies" -> <||>|>],
+					HTTPResponse[ByteArray[ToCharacterCode["Bad Request", "UTF8"]], <|"StatusCode" -> 400, "Headers" -> <||>, "ContentType" -> "application/json", "Cookies" -> <||>|>]
+				]
+			},
+			SetUp :> ($pyECLJSONOnlyHosts = <||>; $pyECLWXFHosts = <||>),
+			TearDown :> ($pyECLJSONOnlyHosts = <||>; $pyECLWXFHosts = <||>),
+			EquivalenceFunction -> MatchQ
+		],
+		Example[{Options, WireFormat, "With the Automatic WireFormat, WXF responses are only asked for once the server has accepted WXF:"},
+			Block[{wxfAccepted},
+				wxfAccepted = {};
+				PyECLRequest["analysis/downsample", Association["data" -> {1, 2, 3}]];
+				PyECLRequest["analysis/downsample", Association["data" -> {1, 2, 3}], WireFormat -> "WXF"];
+				PyECLRequest["analysis/downsample", Association["data" -> {1, 2, 3}]];
+				wxfAccepted
+			],
+			{False, True, True},
+			Stubs :> {
+				URLRead[req_HTTPRequest]:=(
+					AppendTo[wxfAccepted, MemberQ[Values[req["Headers"]], _String?(StringStartsQ[#, "application/vnd.wolfram.wxf,"]&)]];
+					HTTPResponse[ByteArray[ExportString[ExportJSON[Association["result" -> "success"]],"Base64"]], <|"StatusCode" -> 200, "Headers" -> <||>, "ContentType" -> "application/json", "Cookies" -> <||>|>]
+				)
+			},
+			SetUp :> ($pyECLJSONOnlyHosts = <||>; $pyECLWXFHosts = <||>),
+			TearDown :> ($pyECLJSONOnlyHosts = <||>; $pyECLWXFHosts = <||>)
+		],
+		Example[{Options, WireFormat, "If the server does not accept WXF, the body is re-sent as JSON, using up one retry:"},
+			PyECLRequest["analysis/downsample", Association["data" -> {1, 2, 3}], WireFormat -> "WXF", Retries -> 1],
+			Association["result" -> "success"],
+			Stubs :> {
+				URLRead[req_HTTPRequest]:=If[MatchQ[req["ContentType"], "application/vnd.wolfram.wxf"],
+					HTTPResponse[ByteArray[ToCharacterCode["Unsupported Media Type", "UTF8"]], <|"StatusCode" -> 415, "Headers" -> <||>, "ContentType" -> "text/plain", "Cookies" -> <||>|>],
+					HTTPResponse[ByteArray[ExportString[ExportJSON[Association["result" -> "success"]],"Base64"]], <|"StatusCode" -> 200, "Headers" -> <||>, "ContentType" -> "application/json", "Cookies" -> <||>|>]
+				]
+			},
+			SetUp :> ($pyECLJSONOnlyHosts = <||>),
+			TearDown :> ($pyECLJSONOnlyHosts = <||>)
+		],
+		Example[{Options, WireFormat, "In a batch, re-sending a WXF body as JSON also uses up a retry, so it is not re-sent once the retries have run out:"},
+			PyECLRequest[{{"analysis/downsample", Association["data" -> {1, 2, 3}]}}, WireFormat -> "WXF", Retries -> 0],
+			{$Failed},
+			Stubs :> {
+				URLRead[reqs:{___HTTPRequest}]:=Map[
+					If[MatchQ[#["ContentType"], "application/vnd.wolfram.wxf"],
+						HTTPResponse[ByteArray[ToCharacterCode["Unsupported Media Type", "UTF8"]], <|"StatusCode" -> 415, "Headers" -> <||>, "ContentType" -> "text/plain", "Cookies" -> <||>|>],
+						HTTPResponse[ByteArray[ExportString[ExportJSON[Association["result" -> "success"]],"Base64"]], <|"StatusCode" -> 200, "Headers" -> <||>, "ContentType" -> "application/json", "Cookies" -> <||>|>]
+					]&,
+					reqs
+				]
+			},
+			Messages :> {PyECLRequest::BatchRequestFailed},
+			SetUp :> ($pyECLJSONOnlyHosts = <||>),
+			TearDown :> ($pyECLJSONOnlyHosts = <||>)
+		],
 		Example[{Additional, "Test live ping endpoint:"},
 			PyECLRequest["ping"],
 			"pong"
@@ -62,13 +62,14 @@ DefineUsage[
 					{
 						OutputName -> "Protocol",
 						Description -> "Protocol generated to photograph the input samples or containers.",
-						Pattern :> ObjectP[Object[Protocol,ImageSample]]
+						Pattern :> ListableP[ObjectP[Object[Protocol,ImageSample]]]
 					}
 				}
 			}
 		},
 		MoreInformation -> {
-			"Captured images are associated with samples, not containers, so imaging of empty containers is disallowed."
+			"Captured images are associated with samples, not containers, so imaging of empty containers is disallowed.",
+			"If ShardSize is specified and there are more inputs than ShardSize, the inputs are split into consecutive shards that each become their own protocol, and a list of protocols is returned instead of a single protocol."
 		},
 		SeeAlso -> {
 			"ExperimentMeasureVolume",
@@ -285,4 +285,112 @@ DefineUsage[ExperimentInoculateLiquidMediaPreview,
     },
     Author -> {"harrison.gronlund", "yanzhe.zhu", "lige.tonggu"}
   }
-];
\ No newline at end of file
+];
+
+(* ::Section:: *)
+(* PlanColonyCampaign *)
+DefineUsage[PlanColonyCampaign,
+  {
+    BasicDefinitions -> {
+      {
+        Definition -> {"PlanColonyCampaign[Hits]", "{Batches, PendingHits}"},
+        Description -> "splits the colony 'Hits' into 'Batches' of unit operations that inoculate the colonies into liquid media and incubate them, and returns the hits that do not fill a batch yet as 'PendingHits'.",
+        Inputs :> {
+          {
+            InputName -> "Hits",
+            Description -> "The colonies to pick, each given as the sample on solid media that it grows on and the coordinates to pick it from, for example as found by AnalyzeColonies.",
+            Widget -> Adder[
+              {
+                "Sample" -> Widget[
+                  Type -> Object,
+                  Pattern :> ObjectP[Object[Sample]]
+                ],
+                "Coordinates" -> {
+                  "XCoordinate" -> Widget[Type -> Quantity, Pattern :> RangeP[-63 Millimeter, 63 Millimeter], Units -> Millimeter],
+                  "YCoordinate" -> Widget[Type -> Quantity, Pattern :> RangeP[-43 Millimeter, 43 Millimeter], Units -> Millimeter]
+                }
+              }
+            ],
+            Expandable -> False
+          }
+        },
+        Outputs :> {
+          {
+            OutputName -> "Batches",
+            Description -> "For each batch, the InoculateLiquidMedia and IncubateCells unit operations that pick and grow its colonies.",
+            Pattern :> {{_InoculateLiquidMedia, Repeated[_IncubateCells, {0, 1}]}...}
+          },
+          {
+            OutputName -> "PendingHits",
+            Description -> "The hits that do not fill a batch yet, to be given to the next call.",
+            Pattern :> {{ObjectP[Object[Sample]], {DistanceP, DistanceP}}...}
+          }
+        }
+      },
+      {
+        Definition -> {"PlanColonyCampaign[Hits, PendingHits]", "{Batches, PendingHits}"},
+        Description -> "splits the 'PendingHits' left over from the previous call and the new colony 'Hits' into 'Batches' of unit operations that inoculate the colonies into liquid media and incubate them, and returns the hits that do not fill a batch yet as the new 'PendingHits'.",
+        Inputs :> {
+          {
+            InputName -> "Hits",
+            Description -> "The newly found colonies to pick, each given as the sample on solid media that it grows on and the coordinates to pick it from, for example as found by AnalyzeColonies.",
+            Widget -> Adder[
+              {
+                "Sample" -> Widget[
+                  Type -> Object,
+                  Pattern :> ObjectP[Object[Sample]]
+                ],
+                "Coordinates" -> {
+                  "XCoordinate" -> Widget[Type -> Quantity, Pattern :> RangeP[-63 Millimeter, 63 Millimeter], Units -> Millimeter],
+                  "YCoordinate" -> Widget[Type -> Quantity, Pattern :> RangeP[-43 Millimeter, 43 Millimeter], Units -> Millimeter]
+                }
+              }
+            ],
+            Expandable -> False
+          },
+          {
+            InputName -> "PendingHits",
+            Description -> "The hits that the previous call held back, which are picked before the new hits.",
+            Widget -> Adder[
+              {
+                "Sample" -> Widget[
+                  Type -> Object,
+                  Pattern :> ObjectP[Object[Sample]]
+                ],
+                "Coordinates" -> {
+                  "XCoordinate" -> Widget[Type -> Quantity, Pattern :> RangeP[-63 Millimeter, 63 Millimeter], Units -> Millimeter],
+                  "YCoordinate" -> Widget[Type -> Quantity, Pattern :> RangeP[-43 Millimeter, 43 Millimeter], Units -> Millimeter]
+                }
+              }
+            ],
+            Expandable -> False
+          }
+        },
+        Outputs :> {
+          {
+            OutputName -> "Batches",
+            Description -> "For each batch, the InoculateLiquidMedia and IncubateCells unit operations that pick and grow its colonies.",
+            Pattern :> {{_InoculateLiquidMedia, Repeated[_IncubateCells, {0, 1}]}...}
+          },
+          {
+            OutputName -> "PendingHits",
+            Description -> "The hits that do not fill a batch yet, to be given to the next call.",
+            Pattern :> {{ObjectP[Object[Sample]], {DistanceP, DistanceP}}...}
+          }
+        }
+      }
+    },
+    MoreInformation -> {
+      "PlanColonyCampaign is meant to be called again every time new hits come in, passing back the PendingHits it returned last time. Every full batch is returned straight away, and at most BatchSize - 1 hits are ever held back, so the memory used and the time taken to resolve each batch stay the same however many colonies the campaign picks.",
+      "Each batch can be run on its own, for example with ExperimentRoboticCellPreparation[batch], while later hits are still being analyzed. The colonies of each source sample in a batch are picked together with Populations -> CustomCoordinates, and the IncubateCells unit operation refers to the new cultures by their ContainerOutLabel.",
+      "Once the last hits of the campaign are in, call PlanColonyCampaign with Flush -> True to get the remaining hits as a last, smaller batch."
+    },
+    SeeAlso -> {
+      "ExperimentInoculateLiquidMedia",
+      "ExperimentPickColonies",
+      "ExperimentIncubateCells",
+      "AnalyzeColonies"
+    },
+    Author -> {"agent"}
+  }
+];
@@ -59,7 +59,7 @@ DefineUsage[ExperimentMeasureVolume,
 					{
 						OutputName -> "Protocol",
 						Description -> "A protocol object or packet that will be used to measure the volume of the provided 'Sample'.",
-						Pattern :> ObjectP[Object[Protocol, MeasureVolume]]
+						Pattern :> ListableP[ObjectP[Object[Protocol, MeasureVolume]]]
 					}
 				}
 			}
@@ -67,7 +67,8 @@ DefineUsage[ExperimentMeasureVolume,
 		MoreInformation->{
 			"The preferred measurement method is Gravimetric, which will weigh a sample and back-calculate volume from a known density.",
 			"If weight measurement is not possible, volume will be measured using Ultrasonic liquid level detection and conversion to volume.",
-			"The conversion of liquid level distance (via Ultrasonic measurement) to well volume is done using the conversion functions stored in the container's VolumeCalibrations field."
+			"The conversion of liquid level distance (via Ultrasonic measurement) to well volume is done using the conversion functions stored in the container's VolumeCalibrations field.",
+			"If ShardSize is specified and there are more inputs than ShardSize, the inputs are split into consecutive shards that each become their own protocol, and a list of protocols is returned instead of a single protocol."
 		},
 		SeeAlso->{
 			"ExperimentMeasureDensity",
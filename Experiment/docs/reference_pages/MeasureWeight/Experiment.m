@@ -67,7 +67,8 @@ DefineUsage[ExperimentMeasureWeight,
 			"Unless a specific instrument is requested, the protocol will automatically choose the optimal instrument (Balance), based on the size of the container(s) in the input 'Items' and the weight of its contents, if known.",
 			"If the protocol is unable to automatically resolve which instrument to use, it will perform a two-step weigh process:\n\t\t\t\n\tIn the first step, the protocol will use a larger macro balance get a first estimate of the weight.\n\t\t\t\n\tBased on this result, the protocol will subsequently choose an optimal balance to weigh the 'Items'.",
 			"The user must explicitly specify the Micro-Balance using the option Instrument -> Model[Instrument,Balance,\"id:54n6evKx08XN\"] if so desired.",
-			"The user cannot specify a TransferContainer if CalibrateContainer option is set to True."
+			"The user cannot specify a TransferContainer if CalibrateContainer option is set to True.",
+			"If ShardSize is specified and there are more inputs than ShardSize, the inputs are split into consecutive shards that each become their own protocol, and a list of protocols is returned instead of a single protocol."
 		},
 		SeeAlso -> {
 			"ValidExperimentMeasureWeightQ",
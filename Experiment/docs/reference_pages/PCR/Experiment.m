@@ -600,4 +600,51 @@ DefineUsage[ValidExperimentPCRQ,
 		},
 		Author->{"lige.tonggu", "thomas", "weiran.wang", "eqian"}
 	}
-];
\ No newline at end of file
+];
+
+
+(* ::Subsubsection::Closed:: *)
+(*PartitionPCRReactions*)
+
+
+DefineUsage[PartitionPCRReactions,
+	{
+		BasicDefinitions->{
+			{
+				Definition->{"PartitionPCRReactions[Samples]","Plates"},
+				Description->"lays out the reactions of 'Samples' onto the fewest assay plates, putting only reactions with the same master mix on a plate together and keeping the replicates of each reaction on one plate, and returns the positions of the reactions on each plate.",
+				Inputs:>{
+					{
+						InputName->"Samples",
+						Description->"The samples containing nucleic acid templates, one per reaction, in the order they would be given to ExperimentPCR or ExperimentqPCR.",
+						Widget->Adder[
+							Widget[
+								Type->Object,
+								Pattern:>ObjectP[{Object[Sample],Object[Container],Model[Sample]}]
+							]
+						],
+						Expandable->False
+					}
+				},
+				Outputs:>{
+					{
+						OutputName->"Plates",
+						Description->"For each plate, the positions in 'Samples' of the reactions that go on it. Every reaction is on exactly one plate.",
+						Pattern:>{{_Integer..}...}
+					}
+				}
+			}
+		},
+		MoreInformation->{
+			"Each plate is run as its own protocol with a single MasterMix, so reactions are only put on the same plate if they share a master mix. Within a master mix, the plates are filled in the order of 'Samples', so only the last plate of each master mix is partly empty, and no layout uses fewer plates.",
+			"Every replicate of a reaction takes up a well, and all of a reaction's replicates are put on the same plate. ReservedWells sets aside wells on every plate, for example for the standards of ExperimentqPCR, which are run on each plate.",
+			"The positions can be used to split the inputs and any index-matched options the same way, for example ExperimentPCR[samples[[#]], primerPairs[[#]]]&/@PartitionPCRReactions[samples]."
+		},
+		SeeAlso->{
+			"ExperimentPCR",
+			"ExperimentqPCR",
+			"PackContainers"
+		},
+		Author->{"agent"}
+	}
+];
@@ -226,6 +226,51 @@ DefineUsage[UnrestrictLabeledSamples,
 	}
 ];
 
+(* ::Subsubsection::Closed:: *)
+(*PartitionUnitOperations*)
+
+DefineUsage[PartitionUnitOperations,
+	{
+		BasicDefinitions -> {
+			{
+				Definition->{"PartitionUnitOperations[UnitOperations]","Groups"},
+				Description->"splits 'unitOperations' into groups that do not share any labels, samples or containers, so that each group can be given to its own ExperimentSamplePreparation or ExperimentCellPreparation call.",
+				Inputs:>{
+					{
+						InputName -> "UnitOperations",
+						Description-> "The unit operations to split into independent groups.",
+						Widget->Widget[
+							Type -> Expression,
+							Pattern :> {_Symbol[___]...},
+							Size -> Paragraph
+						],
+						Expandable->False
+					}
+				},
+				Outputs:>{
+					{
+						OutputName->"Groups",
+						Description->"The groups of unit operations, in the order they first appear in 'unitOperations'. The unit operations inside of each group keep their original order.",
+						Pattern:>{{_Symbol[___]..}...}
+					}
+				}
+			}
+		},
+		MoreInformation -> {
+			"Two unit operations are in the same group if they both define or refer to the same label, or refer to the same sample or container. A sample and the container it is in count as the same object.",
+			"Unit operations that don't refer to any labels or objects (for example, Wait) act as a barrier: they are kept in the same group as the unit operations before and after them, so that nothing is moved across them.",
+			"Since the groups are independent of one another, they can be resolved at the same time, for example with ParallelMap[ExperimentSamplePreparation, PartitionUnitOperations[unitOperations]]."
+		},
+		SeeAlso -> {
+			"ExperimentSamplePreparation",
+			"ExperimentCellPreparation",
+			"LookupLabeledObject"
+		},
+		Tutorials -> {},
+		Author -> {"agent"}
+	}
+];
+
 (* ::Subsubsection::Closed:: *)
 (*SimulateResources*)
 
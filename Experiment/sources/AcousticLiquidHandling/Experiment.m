@@ -46,7 +46,20 @@ DefineOptions[ExperimentAcousticLiquidHandling,
 				Type -> Enumeration,
 				Pattern :> AcousticLiquidHandlingOptimizationTypeP
 			],
-			Description -> "Indicates that order of manipulations provided in the input liquid-handling primitives can be modified to be most efficient for the acoustic liquid handler executing the liquid transfers. Optimization will not modify the source(s), destination(s), and amount(s) of the primitives. OptimizeThroughput rearranges the manipulation sequence such that the overall throughput is maximized. SourcePlateCentric minimizes the number of times the source plates need to be changed in and out of the instrument during the course of transfer. DestinationPlateCentric minimizes the number of times the destination plates need to be changed in and out of the instrument during the course of transfer. PreserveTransferOrder leaves the original sequence of manipulations defined in the input primitives unchanged.",
+			Description -> "Indicates that order of manipulations provided in the input liquid-handling primitives can be modified to be most efficient for the acoustic liquid handler executing the liquid transfers. Optimization will not modify the source(s), destination(s), and amount(s) of the primitives. OptimizeThroughput rearranges the manipulation sequence such that the overall throughput is maximized. SourcePlateCentric minimizes the number of times the source plates need to be changed in and out of the instrument during the course of transfer. DestinationPlateCentric minimizes the number of times the destination plates need to be changed in and out of the instrument during the course of transfer. PreserveTransferOrder leaves the original sequence of manipulations defined in the input primitives unchanged. Whenever the sequence is optimized, the manipulations between each pair of source and destination plates are also ordered by well, and no manipulation is moved ahead of an earlier manipulation that it depends on (one that transfers into its source well, or out of its destination well).",
+			Category -> "General"
+		},
+		{
+			OptionName -> EstimatedTimeSavings,
+			Default -> Automatic,
+			AllowNull -> True,
+			Widget -> Widget[
+				Type -> Quantity,
+				Pattern :> GreaterEqualP[0 Minute],
+				Units -> Alternatives[Second, Minute, Hour]
+			],
+			Description -> "The estimated instrument time saved by executing the manipulations in the optimized sequence instead of the input sequence. This estimate is stored in the protocol's EstimatedTimeSavings field.",
+			ResolutionDescription -> "Always computed from the number of plate changes needed by the input sequence and by the optimized sequence of the manipulations; any specified value is replaced by the computed estimate.",
 			Category -> "General"
 		},
 
@@ -1961,7 +1974,7 @@ resolveExperimentAcousticLiquidHandlingOptions[
 		(* optimize primitives variables *)
 		allContainersNoDupes,optimizableQ,optimizePrimitivesOption,optimizationWarningBool,platePairs,optimizedPlatePairs,
 		platePairsNoDupes,optimizedPrimitiveOrder,optimizedPrimitives,sortedInWellSeparationOptions,sortedResolvedCalibrations,
-		sortedResolvedMeasurements,
+		sortedResolvedMeasurements,wellPairs,resolvedEstimatedTimeSavings,
 
 		(* ---test variables--- *)
 		samplePrepTests,aliquotTests,nonEmptyAliquotContainerTests,discardedSourceSampleTest,deprecatedTest,nonLiquidSourceTest,
@@ -4943,12 +4956,23 @@ resolveExperimentAcousticLiquidHandlingOptions[
 		]
 	];
 
+	(* get the index-matched source-destination well pairs *)
+	wellPairs=Cases[sourceToDestTuples,{{ObjectP[],sourceWell_},{ObjectP[],destWell_}}:>{sourceWell,destWell},Infinity];
+
 	(* get the optimized order of the primitives *)
-	optimizedPrimitiveOrder=If[MatchQ[optimizedPlatePairs,platePairs],
-		(* if optimization did not occur, return original sequence *)
+	optimizedPrimitiveOrder=If[optimizationWarningBool||MatchQ[optimizePrimitivesOption,PreserveTransferOrder],
+		(* if optimization is not possible or the user want to preserve the sequence, return original sequence *)
 		Range[Length[platePairs]],
-		(* otherwise, get the new sequence *)
-		OrderingBy[platePairs,Position[optimizedPlatePairs,#]&]
+		(* otherwise, follow the optimized plate pair sequence and sweep the wells in order within each plate pair,
+		without moving any transfer ahead of an earlier transfer that it depends on *)
+		acousticLHTransferOrder[platePairs,wellPairs,optimizedPlatePairs,optimizePrimitivesOption]
+	];
+
+	(* estimate the instrument time saved by the optimized sequence, using the same plate change time as the resource packets *)
+	(* Note: this is always computed here and returned in the resolved options, so that the resource packets can store it in the protocol *)
+	resolvedEstimatedTimeSavings=Max[
+		acousticLHPlateChangeTime[platePairs]-acousticLHPlateChangeTime[platePairs[[optimizedPrimitiveOrder]]],
+		0 Minute
 	];
 
 	(* rearrange our primitives based on the optimized order *)
@@ -5087,6 +5111,7 @@ resolveExperimentAcousticLiquidHandlingOptions[
 			{
 				Instrument->specifiedInstrument,
 				OptimizePrimitives->optimizePrimitivesOption,
+				EstimatedTimeSavings->resolvedEstimatedTimeSavings,
 				ResolvedManipulations->primitivesToReturn,
 				FluidAnalysisMeasurement->sortedResolvedMeasurements,
 				FluidTypeCalibration->sortedResolvedCalibrations,
@@ -5145,7 +5170,7 @@ experimentAcousticLiquidHandlingResourcePackets[
 		aliquotQ,aliquotAmounts,requiredAmounts,sampleRequiredAmounts,defineNameReplaceRules,resolvedPrimitives,primitiveAmounts,
 		suppliedDestinations,destinationSamples,destinationSamplePackets,suppliedDestinationLocations,destinationContainerSpecs,
 		destinationResources,measureVolumeOption,imageSampleOption,fluidTypeCalibOption,inWellSeparationOption,requiredObjects,
-		transferRate,transferTime,numberOfBatches,softwareSetupTime,numberOfPlateChanges,plateChangeTime,runTime,containerObjects,
+		transferRate,transferTime,numberOfBatches,softwareSetupTime,plateChangeTime,runTime,containerObjects,
 		primitivesToReturn,sourceToDestTuples,platePairs,resolvedOptionsWithListedSamplesOutStorage
 	},
 
@@ -5307,35 +5332,8 @@ experimentAcousticLiquidHandlingResourcePackets[
 	(* get the index-matched source-destination plate pairs *)
 	platePairs=Cases[sourceToDestTuples,{{source_,_},{dest_,_}}:>{source,dest}];
 
-	(* get the number of plate changes from our primitives *)
-	(* start with 4 since we first put 2 plates in and at the end takes 2 plates out *)
-	numberOfPlateChanges=4;
-	(* use Fold to track how many times we need to change the plates based on our optimized sequence *)
-	Fold[
-		Module[{source,dest},
-			(* get the previous source and destination plates *)
-			source=#1[[-1]][[1]];
-			dest=#1[[-1]][[2]];
-			(* compare as we loop over the entire sequence *)
-			Switch[#2,
-				(* if both are similar to previous ones, don't add count *)
-				{source,dest},Nothing,
-				(* if either one is the same as previous, we have to change one plate *)
-				{source,_},numberOfPlateChanges=(numberOfPlateChanges+1),
-				{_,dest},numberOfPlateChanges=(numberOfPlateChanges+1),
-				(* both are different, we need to change 2 plates *)
-				_,numberOfPlateChanges=(numberOfPlateChanges+2)
-			];
-			(* add new pairs to the list *)
-			Append[#1,#2]
-		]&,
-		{First@platePairs},
-		Rest@platePairs
-	];
-
-	(* calculate time needed for all plate changes *)
-	(* each change involves taking a plate our and replace with a new one. this is roughly 1 minute including barcode scanning *)
-	plateChangeTime=1 Minute*numberOfPlateChanges;
+	(* calculate time needed for all plate changes based on our optimized sequence *)
+	plateChangeTime=acousticLHPlateChangeTime[platePairs];
 
 	(* calculate to time for the instrument *)
 	instrumentTime=Total[{transferTime,softwareSetupTime,plateChangeTime}];
@@ -5384,6 +5382,7 @@ experimentAcousticLiquidHandlingResourcePackets[
 		Replace[Destinations] -> Lookup[myResolvedOptions, Destination],
 		Replace[Amounts] -> Lookup[myResolvedOptions, Amount],
 		Replace[ResolvedManipulations]->primitivesToReturn,
+		EstimatedTimeSavings->Lookup[myResolvedOptions,EstimatedTimeSavings],
 		Replace[RequiredObjects]->requiredObjects,
 		Replace[FluidTypeCalibration]->fluidTypeCalibOption,
 		Replace[InWellSeparation]->inWellSeparationOption
@@ -5428,6 +5427,154 @@ experimentAcousticLiquidHandlingResourcePackets[
 ];
 
 
+(* helper to count the plate changes needed to execute transfers in the sequence of the given {source plate, destination plate} pairs *)
+(* start with 4 since we first put 2 plates in and at the end take 2 plates out, then add 1 for each plate that differs from the previous pair *)
+(* each change involves taking a plate out and replacing it with a new one. this is roughly 1 minute including barcode scanning *)
+acousticLHPlateChangeTime[{}]:=0 Minute;
+acousticLHPlateChangeTime[myPlatePairs:{{_,_}..}]:=Module[{numberOfPlateChanges},
+	numberOfPlateChanges=4+Count[Flatten[MapThread[SameQ,{Most[myPlatePairs],Rest[myPlatePairs]},2]],False];
+	1 Minute*numberOfPlateChanges
+];
+
+
+(* helper to order transfers by the optimized sequence of plate pairs and then by well within each plate pair *)
+(* Note: sweeping the wells in order instead of in input order shortens the travel of the source and destination plates for large transfer maps *)
+acousticLHTransferOrder[myPlatePairs_List,myWellPairs_List,myOptimizedPlatePairs_List,myOptimization:AcousticLiquidHandlingOptimizationTypeP]:=Module[
+	{plateRanks,wellKeys,preferredOrder},
+
+	(* rank each transfer by the first appearance of its plate pair in the optimized sequence *)
+	(* Note: look the ranks up by key instead of calling Position for each transfer, which is quadratic in the number of transfers *)
+	plateRanks=Lookup[
+		First/@PositionIndex[DeleteDuplicates[myOptimizedPlatePairs]],
+		Key/@myPlatePairs
+	];
+
+	(* sort by destination well first if we are keeping the destination plates in, otherwise by source well first *)
+	wellKeys=Map[
+		Join@@Map[acousticLHWellSortKey,If[MatchQ[myOptimization,DestinationPlateCentric],Reverse[#],#]]&,
+		myWellPairs
+	];
+
+	(* end each sort key with the input index so that transfers between the same wells stay in input order *)
+	preferredOrder=Ordering[MapThread[Join[{#1},#2,{#3}]&,{plateRanks,wellKeys,Range[Length[myPlatePairs]]}]];
+
+	(* never move a transfer ahead of an earlier transfer that it depends on *)
+	acousticLHDependencyOrder[preferredOrder,acousticLHTransferPrerequisites[myPlatePairs,myWellPairs]]
+];
+
+
+(* helper to find, for each transfer, the earlier transfers that must still be executed before it: *)
+(* any earlier transfer into its source well (it would otherwise aspirate before that liquid arrives), and any earlier transfer out of its destination well (which would otherwise aspirate the liquid this one adds) *)
+acousticLHTransferPrerequisites[myPlatePairs_List,myWellPairs_List]:=Module[
+	{sourceWells,destinationWells,writersByWell,readersByWell},
+
+	(* get the {plate, well} each transfer reads from and writes to *)
+	sourceWells=Transpose[{myPlatePairs[[All,1]],myWellPairs[[All,1]]}];
+	destinationWells=Transpose[{myPlatePairs[[All,2]],myWellPairs[[All,2]]}];
+
+	(* get all the transfers that write into or read from each well, in input order *)
+	(* Note: index the wells once instead of growing a list per well for each transfer, which is quadratic in the number of transfers into the same well *)
+	writersByWell=PositionIndex[destinationWells];
+	readersByWell=PositionIndex[sourceWells];
+
+	MapThread[
+		Function[{index,sourceWell,destinationWell},
+			(* only the transfers before this one are prerequisites, and a transfer within one well does not depend on itself *)
+			Union[
+				TakeWhile[Lookup[writersByWell,Key[sourceWell],{}],LessThan[index]],
+				TakeWhile[Lookup[readersByWell,Key[destinationWell],{}],LessThan[index]]
+			]
+		],
+		{Range[Length[myPlatePairs]],sourceWells,destinationWells}
+	]
+];
+
+
+(* helper to follow the preferred order of the transfers as closely as possible while executing each transfer only after all of its prerequisites *)
+(* Note: a transfer whose prerequisites have not been executed yet is held back and executed as soon as they have been, so that it is only ever moved later *)
+acousticLHDependencyOrder[myPreferredOrder_List,myPrerequisites_List]:=Module[
+	{preferredPositions,unmetCounts,dependents,heldQ,readyHeldPositions,readyHeldCount,pushReadyHeld,popReadyHeld,execute},
+
+	(* skip the bookkeeping if no transfer depends on another *)
+	If[MatchQ[myPrerequisites,{{}...}],
+		Return[myPreferredOrder]
+	];
+
+	(* count the prerequisites each transfer is still waiting for, and list the transfers waiting on each transfer *)
+	(* Note: keep counts and a map of dependents instead of rescanning all of the held transfers after each execution, which is quadratic when many transfers are held *)
+	preferredPositions=Ordering[myPreferredOrder];
+	unmetCounts=Length/@myPrerequisites;
+	dependents=Lookup[
+		GroupBy[Flatten[MapIndexed[Thread[{#1,First[#2]}]&,myPrerequisites],1],First->Last],
+		Range[Length[myPrerequisites]],
+		{}
+	];
+	heldQ=ConstantArray[False,Length[myPrerequisites]];
+
+	(* keep the preferred positions of the held transfers whose prerequisites have all been executed in a binary min-heap, so that the earliest one is released first *)
+	readyHeldPositions=ConstantArray[0,Length[myPrerequisites]];
+	readyHeldCount=0;
+	pushReadyHeld=Function[position,
+		Module[{child=++readyHeldCount},
+			readyHeldPositions[[child]]=position;
+			While[child>1&&readyHeldPositions[[Quotient[child,2]]]>readyHeldPositions[[child]],
+				readyHeldPositions[[{child,Quotient[child,2]}]]=readyHeldPositions[[{Quotient[child,2],child}]];
+				child=Quotient[child,2]
+			]
+		]
+	];
+	popReadyHeld=Function[
+		Module[{earliest=readyHeldPositions[[1]],parent=1,smallest},
+			readyHeldPositions[[1]]=readyHeldPositions[[readyHeldCount--]];
+			While[True,
+				smallest=First[MinimalBy[Prepend[Select[{2*parent,2*parent+1},LessEqualThan[readyHeldCount]],parent],readyHeldPositions[[#]]&]];
+				If[smallest==parent,Break[]];
+				readyHeldPositions[[{parent,smallest}]]=readyHeldPositions[[{smallest,parent}]];
+				parent=smallest
+			];
+			myPreferredOrder[[earliest]]
+		]
+	];
+
+	execute=Function[index,
+		Sow[index];
+		Scan[
+			Function[dependent,
+				unmetCounts[[dependent]]--;
+				If[unmetCounts[[dependent]]==0&&heldQ[[dependent]],
+					pushReadyHeld[preferredPositions[[dependent]]]
+				]
+			],
+			dependents[[index]]
+		]
+	];
+
+	First[Last[Reap[
+		Scan[
+			Function[index,
+				If[unmetCounts[[index]]==0,
+					execute[index];
+					(* release the held transfers that are now ready, in their preferred order *)
+					While[readyHeldCount>0,
+						execute[popReadyHeld[]]
+					],
+					heldQ[[index]]=True
+				]
+			],
+			myPreferredOrder
+		]
+	]]]
+];
+
+
+(* helper to sort wells row by row, comparing the columns as numbers so that A2 comes before A10 *)
+acousticLHWellSortKey[myWell_String]:=FirstOrDefault[
+	StringCases[myWell,StartOfString~~row:LetterCharacter..~~column:DigitCharacter..~~EndOfString:>{StringLength[row],row,ToExpression[column]}],
+	{0,myWell,0}
+];
+acousticLHWellSortKey[myWell_]:={0,ToString[myWell],0};
+
+
 (* helper to combine sources and destinations according to singleton patterns since singleton pattern has List head, so we cannot easily distinguish *)
 combineSourcesAndDestinations[sources_, destinations_] := Module[{combinedList, combinedListNoContainerModel, containerModelReplacementRulesWithNull},
 	(* combine source and destination *)
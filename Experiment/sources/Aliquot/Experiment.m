@@ -337,6 +337,16 @@ DefineOptions[ExperimentAliquot,
 				Pattern :> BooleanP
 			]
 		},
+		{
+			OptionName -> DestinationWellOrder,
+			Default -> Row,
+			Description -> "The order in which the wells of plates in ContainerOut are filled when DestinationWell is not specified. Row fills the wells in the order A1, A2, A3..., while Column fills them in the order A1, B1, C1..., so that consecutive aliquots can be dispensed by a multichannel pipette in a single move.",
+			AllowNull -> False,
+			Widget -> Widget[
+				Type -> Enumeration,
+				Pattern :> Row | Column
+			]
+		},
 		PreparationOption,
 		{
 			OptionName -> SamplesInStorageCondition,
@@ -2461,7 +2471,7 @@ resolveExperimentAliquotOptions[mySamples:{ListableP[ObjectP[Object[Sample]]]..}
 		destinationWellsToTransferToNoZeroes, resolvedContainerOutLabel, fakeResolvedOptions, resolvedSampleOutLabel,
 		resolveMethod, containerOutLabelReplaceRules, sampleOutLabelReplaceRules, allPotentiallyLabeledSamples,
 		allPotentiallyLabeledContainers, sampleLabelReplaceRules, containerLabelReplaceRules, overMaxVolumeErrors,
-		overMaxVolumeOptions, overMaxVolumeTests},
+		overMaxVolumeOptions, overMaxVolumeTests, destinationWellOrder},
 
 	(* --- Setup our user specified options and cache --- *)
 
@@ -2501,9 +2511,10 @@ resolveExperimentAliquotOptions[mySamples:{ListableP[ObjectP[Object[Sample]]]..}
 		name,
 		samplesOutStorageCondition,
 		specifiedConsolidateAliquots,
+		destinationWellOrder,
 		fastTrack,
 		parentProtocol
-	} = Lookup[safePooledOptions, {ConcentratedBuffer, AssayBuffer, BufferDiluent, ContainerOut, DestinationWell, Name, SamplesOutStorageCondition, ConsolidateAliquots, FastTrack, ParentProtocol}];
+	} = Lookup[safePooledOptions, {ConcentratedBuffer, AssayBuffer, BufferDiluent, ContainerOut, DestinationWell, Name, SamplesOutStorageCondition, ConsolidateAliquots, DestinationWellOrder, FastTrack, ParentProtocol}];
 
 	(* pull out lots of shared options *)
 	{
@@ -4542,8 +4553,10 @@ resolveExperimentAliquotOptions[mySamples:{ListableP[ObjectP[Object[Sample]]]..}
 	];
 
 	(* get the position that each the groupedSamplesVolumeContainerTuples has in samplesVolumeContainerTuples for each one *)
-	(* the Alternatives @@@ is a little gross, admittedly, but basically we want to get the position of the grouped tuples in the original ungrouped list *)
-	positionsOfGroupings = Position[samplesVolumeContainerTuples, #]& /@ Alternatives @@@ groupedSamplesVolumeContainerTuples;
+	(* look the positions up in a PositionIndex rather than calling Position with every grouping, since that is quadratic in the number of samples and dominates the resolver for thousands of aliquots *)
+	positionsOfGroupings = With[{tuplePositions = PositionIndex[samplesVolumeContainerTuples]},
+		Map[List, Sort[Join @@ Lookup[tuplePositions, DeleteDuplicates[#]]]]& /@ groupedSamplesVolumeContainerTuples
+	];
 
 	(* need to map over the grouped samples and return (in the grouped order) the ContainerOut constructs*)
 	preResolvedGroupContainerOut = Map[
@@ -4706,8 +4719,16 @@ resolveExperimentAliquotOptions[mySamples:{ListableP[ObjectP[Object[Sample]]]..}
 
 	(* get all the allowed positions for the given destination container *)
 	(* there shouldn't be duplicates but it will also mess us up if there is so just make sure *)
+	(* if DestinationWellOrder -> Column, order the wells column by column so that the Automatic wells below are filled that way *)
 	allWellsForContainerOut = Map[
-		DeleteDuplicates[Lookup[#, Name, {}]]&,
+		Function[{positions},
+			With[{wells = DeleteDuplicates[Lookup[positions, Name, {}]]},
+				If[MatchQ[destinationWellOrder, Column] && AllTrue[wells, StringMatchQ[#, LetterCharacter.. ~~ DigitCharacter..]&],
+					SortBy[wells, {FromDigits[StringDelete[#, LetterCharacter]]&, StringLength, Identity}],
+					wells
+				]
+			]
+		],
 		Lookup[destinationContainerModelPackets, Positions, {}]
 	];
 
@@ -4785,8 +4806,10 @@ resolveExperimentAliquotOptions[mySamples:{ListableP[ObjectP[Object[Sample]]]..}
 	(* the rest of the stuff we're including (the samples and volumes) is for use later potentially if we're consolidating aliquots *)
 	groupedPreResolvedContainerOut = GatherBy[samplesVolumePreResolvedContainerTuples, {#[[4, 1]], Download[#[[4, 2]], Object]}&];
 
-	(* get the positions of the pre resolved containers out *)
-	positionsOfPreResolvedContainerOut = Position[samplesVolumePreResolvedContainerTuples, #]& /@ Alternatives @@@ groupedPreResolvedContainerOut;
+	(* get the positions of the pre resolved containers out (see positionsOfGroupings for why we use a PositionIndex) *)
+	positionsOfPreResolvedContainerOut = With[{tuplePositions = PositionIndex[samplesVolumePreResolvedContainerTuples]},
+		Map[List, Sort[Join @@ Lookup[tuplePositions, DeleteDuplicates[#]]]]& /@ groupedPreResolvedContainerOut
+	];
 
 	(* get the open wells per grouping *)
 	openWellsPerGrouping = Map[
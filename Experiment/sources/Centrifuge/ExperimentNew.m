@@ -573,10 +573,11 @@ ExperimentCentrifuge[mySamples : ListableP[ObjectP[Object[Sample]]], myOptions :
 	cacheBall = FlattenCachePackets[{Lookup[expandedSafeOps, Cache, {}], Flatten[{downloadedStuff,allCentrifugeEquipmentPackets}]}];
 
 	(* Build the resolved options *)
+	(* NOTE: We reuse the resolved options of a previous call if neither the samples nor the options have changed since. *)
 	resolvedOptionsResult = Check[
 		{resolvedOptions,resolvedOptionsTests} = If[gatherTests,
-			resolveExperimentCentrifugeOptions[sampleObjects, expandedSafeOps, Cache -> cacheBall, Simulation -> updatedSimulation, Output -> {Result, Tests}],
-			{resolveExperimentCentrifugeOptions[sampleObjects, expandedSafeOps, Cache -> cacheBall, Simulation -> updatedSimulation, Output -> Result], {}}
+			cachedResolverCall[resolveExperimentCentrifugeOptions, sampleObjects, expandedSafeOps, Cache -> cacheBall, Simulation -> updatedSimulation, Output -> {Result, Tests}],
+			{cachedResolverCall[resolveExperimentCentrifugeOptions, sampleObjects, expandedSafeOps, Cache -> cacheBall, Simulation -> updatedSimulation, Output -> Result], {}}
 		],
 		$Failed,
 		{Error::InvalidInput,Error::InvalidOption,Error::ConflictingUnitOperationMethodRequirements}
@@ -287,6 +287,296 @@ removeLinks[myInput_, myOptions_] := Module[
 	}
 ];
 
+(* ::Subsection::Closed:: *)
+(* caches options resolver results between experiment calls *)
+
+(* The largest number of resolver results that we will hold on to before we start to drop the oldest ones. *)
+$ExperimentResolverCacheSize=100;
+
+(* Store previous resolver results in the form of {resolverFunction, inputs, options, resolutionOptions, simulationHash, userContext, versionedObjects} => *)
+(* <|"Versions" -> objectVersions, Result -> resolvedOptions, Tests -> tests|>. *)
+(* NOTE: versionedObjects are the inputs, their containers and their models, and any objects given in the options, and objectVersions are their *)
+(* CAS tokens when the result was resolved. The server gives an object a new CAS token every time that it is uploaded to, so before we return a *)
+(* cached result we ask the server for the current CAS tokens of those objects, and only return it if none of them has been uploaded to since. *)
+(* userContext is the user, notebook and site that the experiment is resolved for. *)
+(* NOTE: The options in the key leave out Output, so that validating a call (which asks the resolver for its Tests) and then submitting it (which *)
+(* only asks for the Result) use the same result. Tests are only stored if they were asked for, so a call that asks for Tests can't use a result *)
+(* that was stored without them. *)
+(* NOTE: We only cache results that didn't throw any messages, since using a cached result doesn't throw them again. *)
+$ExperimentResolverCache=<||>;
+
+(* Helper function to call an options resolver, or to use its previous result if neither its inputs, its options nor the objects *)
+(* that it resolved from have changed since. This makes validating and then submitting the same experiment only resolve once. *)
+cachedResolverCall[myResolverFunction_Symbol, myInputs_List, myOptions:{_Rule...}, myResolutionOptions:OptionsPattern[]]:=Module[
+	{resolutionOptions, cache, simulation, outputSpecification, output, inputObjects, packetsByObject, inputContainersAndModels, versionedObjects,
+		objectVersions, simulationHash, cacheKey, cachedEntry, currentVersions, cachedResult, preResolverMessageLength, resolverOutput},
+
+	resolutionOptions=ToList[myResolutionOptions];
+	cache=Lookup[resolutionOptions, Cache, {}];
+	simulation=Lookup[resolutionOptions, Simulation, Null];
+	outputSpecification=Lookup[resolutionOptions, Output, Result];
+	output=ToList[outputSpecification];
+
+	(* Get the objects that the resolver depends on the most: our inputs, their containers and their models, and the objects in our options. *)
+	(* Take the containers and models from the packets that the experiment function already downloaded instead of downloading them again. *)
+	inputObjects=Cases[Flatten[myInputs], ObjectReferenceP[]];
+	packetsByObject=GroupBy[Cases[cache, KeyValuePattern[Object->ObjectReferenceP[]]], Lookup[#, Object]&, Join@@#&];
+	inputContainersAndModels=Lookup[Lookup[packetsByObject, inputObjects, <||>], {Container, Model}, Null];
+
+	versionedObjects=DeleteDuplicates[Download[
+		Cases[{inputObjects, inputContainersAndModels, Normal[KeyDrop[myOptions, {Cache, Simulation}]]}, ObjectReferenceP[]|LinkP[], Infinity],
+		Object
+	]];
+
+	(* Look up the CAS token of each of those objects in the session's object cache. These are the versions of the objects that the experiment *)
+	(* function downloaded, so they are the versions that the resolver will resolve from. *)
+	objectVersions=(Lookup[Lookup[Constellation`Private`objectCache, Key[Constellation`Private`getObjectCacheKey[#]], <||>], "CAS", Null]&)/@versionedObjects;
+
+	(* If we don't know the version of every object (for example, because some of them are simulated or were never downloaded), *)
+	(* we can't tell when the result would be out of date, so just call the resolver. *)
+	If[!MatchQ[objectVersions, {_String..}] || MemberQ[objectVersions, ""] || !ContainsOnly[output, {Result, Tests}],
+		Return[myResolverFunction[myInputs, myOptions, Sequence@@resolutionOptions]]
+	];
+
+	(* See the NOTE on $PrimitiveFrameworkResolverOutputCache for why we drop SimulatedObjects before hashing. *)
+	simulationHash=Hash[If[MatchQ[simulation, SimulationP], KeyDrop[simulation[[1]], SimulatedObjects], Null]];
+
+	cacheKey={
+		myResolverFunction,
+		myInputs,
+		KeyDrop[myOptions, {Cache, Simulation, Output}],
+		KeyDrop[resolutionOptions, {Cache, Simulation, Output}],
+		simulationHash,
+		{$PersonID, $Notebook, $Site},
+		versionedObjects
+	};
+
+	(* If we have resolved this before with everything that we are asked for, check with the server that none of the objects has been uploaded *)
+	(* to since. If so, mark the result as the most recently used and return it in the form that we were asked for. *)
+	(* NOTE: The session's object cache can be older than the server, since Download doesn't ask the server for the fields that it was given *)
+	(* through its Cache option, so we ask for the current CAS tokens here. We only do this on a hit, so that a miss costs no extra round trip. *)
+	cachedEntry=Lookup[$ExperimentResolverCache, Key[cacheKey], Null];
+	If[MatchQ[cachedEntry, _Association] && (!MemberQ[output, Tests] || KeyExistsQ[cachedEntry, Tests]),
+		currentVersions=(If[AssociationQ[#], Lookup[#, "cas", Null], Null]&)/@Lookup[Constellation`Private`peekObjects[versionedObjects], versionedObjects, Null];
+
+		If[MatchQ[currentVersions, Lookup[cachedEntry, "Versions"]],
+			KeyDropFrom[$ExperimentResolverCache, Key[cacheKey]];
+			AppendTo[$ExperimentResolverCache, cacheKey->cachedEntry];
+
+			(* The resolved options hold the Output and Cache of the call that they were resolved for, so give them ours instead. *)
+			cachedResult=Lookup[cachedEntry, Result];
+			cachedResult=If[MatchQ[cachedResult, {(_Rule|_RuleDelayed)..}],
+				ReplaceRule[cachedResult, Normal[KeyTake[myOptions, Intersection[Keys[cachedResult], {Output, Cache}]]]],
+				cachedResult
+			];
+
+			Return[Replace[outputSpecification, {Result->cachedResult, Tests->Lookup[cachedEntry, Tests, {}]}, {0, 1}]]
+		]
+	];
+
+	(* Otherwise, call the resolver and cache its result if it didn't throw any messages. *)
+	preResolverMessageLength=Length[$MessageList];
+	resolverOutput=myResolverFunction[myInputs, myOptions, Sequence@@resolutionOptions];
+
+	If[Length[$MessageList]==preResolverMessageLength,
+		KeyDropFrom[$ExperimentResolverCache, Key[cacheKey]];
+		AppendTo[
+			$ExperimentResolverCache,
+			cacheKey->Append[
+				AssociationThread[output, If[ListQ[outputSpecification], resolverOutput, {resolverOutput}]],
+				"Versions"->objectVersions
+			]
+		];
+		If[Length[$ExperimentResolverCache]>$ExperimentResolverCacheSize,
+			KeyDropFrom[$ExperimentResolverCache, Take[Keys[$ExperimentResolverCache], Length[$ExperimentResolverCache]-$ExperimentResolverCacheSize]]
+		]
+	];
+
+	resolverOutput
+];
+
+(* ::Subsection::Closed:: *)
+(* splits very large experiment calls into shards *)
+
+Error::ExperimentShardFailed="Shard `1` of `2`, holding inputs `3` through `4`, could not be resolved or uploaded, so the remaining shards were not run and no protocols are returned. Please check the messages above for the cause.";
+Warning::ExperimentShardsRolledBack="The protocols `1` uploaded by the earlier shards of this call have been rolled back.";
+Error::ExperimentShardRollbackFailed="The protocols `1` uploaded by the earlier shards of this call could not be rolled back. Please cancel them with CancelProtocol if they are not needed.";
+
+(* Helper function to tell if an experiment call should be split into shards and, if so, how many inputs go in each shard. *)
+(* NOTE: Sharding is opt-in through the ShardSize option, since it changes Result from one protocol to a list of protocols. *)
+(* We only shard calls that ask for the Result and/or Tests, since Options, Preview and Simulation describe a single protocol. *)
+(* Calls with sample preparation or a Name are not sharded either, since neither can be split between several protocols. *)
+experimentShardSize[myInputs_List, myOptions:{(_Rule|_RuleDelayed)...}]:=Module[{shardSize, output},
+	shardSize=Lookup[myOptions, ShardSize, Null];
+	output=ToList[Lookup[myOptions, Output, Result]];
+
+	If[
+		And[
+			MatchQ[shardSize, _Integer?Positive],
+			Length[myInputs]>shardSize,
+			ContainsOnly[output, {Result, Tests}],
+			MatchQ[Lookup[myOptions, PreparatoryUnitOperations, Null], Null|{}],
+			MatchQ[Lookup[myOptions, Name, Null], Null]
+		],
+		shardSize,
+		Null
+	]
+];
+
+(* Helper function to call an experiment on consecutive shards of its inputs, so that no single call resolves or uploads all of them *)
+(* and memory only has to hold one shard at a time. Each shard becomes its own protocol. Result is the list of the shards' results *)
+(* (in the order of the inputs) and Tests are the tests of all shards. *)
+(* All shards are uploaded under one upload transaction. If a shard fails, the remaining shards are not run and the transaction is rolled back, *)
+(* so that a failed call doesn't leave the protocols of its earlier shards behind. *)
+shardedExperimentCall[myFunction_Symbol, myInputs_List, myOptions:{(_Rule|_RuleDelayed)...}, myShardSize_Integer]:=Module[
+	{outputSpecification, output, unshardedOptions, expandedOptions, optionDefinitions, inputMatchedOptions, shardedOptions,
+		shardIndexLists, uploadQ, uploadTransaction, shardOutputs, failedShard, earlierProtocols, rollbackResult},
+
+	outputSpecification=Lookup[myOptions, Output, Result];
+	output=ToList[outputSpecification];
+	unshardedOptions=ReplaceRule[myOptions, ShardSize->Null];
+
+	(* Expand the index-matched options so that we can give each shard the values for its own inputs. *)
+	expandedOptions=Quiet[Last[ExpandIndexMatchedInputs[myFunction, {myInputs}, myOptions]]];
+
+	(* If the options can't be expanded (for example, because their lengths don't match the inputs), let the experiment report it. *)
+	If[!MatchQ[expandedOptions, {(_Rule|_RuleDelayed)...}],
+		Return[myFunction[myInputs, unshardedOptions]]
+	];
+
+	(* Get the options that are index-matched to the inputs, either directly or through their index matching parent. *)
+	optionDefinitions=OptionDefinition[myFunction];
+	inputMatchedOptions=Lookup[
+		Select[optionDefinitions, MatchQ[Lookup[#, "IndexMatching"], "Input"] || MatchQ[Lookup[#, "IndexMatchingInput"], _String]&],
+		"OptionSymbol"
+	];
+	inputMatchedOptions=Join[
+		inputMatchedOptions,
+		Lookup[
+			Select[optionDefinitions, MemberQ[ToString/@inputMatchedOptions, Lookup[#, "IndexMatchingParent"]]&],
+			"OptionSymbol"
+		]
+	];
+
+	(* Only split the values that were actually expanded to one per input. *)
+	shardedOptions=Select[
+		Intersection[Keys[expandedOptions], inputMatchedOptions],
+		(ListQ[Lookup[expandedOptions, #]] && Length[Lookup[expandedOptions, #]]==Length[myInputs])&
+	];
+
+	shardIndexLists=Partition[Range[Length[myInputs]], UpTo[myShardSize]];
+
+	(* Only calls that return the Result with Upload -> True upload anything, so only those need a transaction to roll back. *)
+	uploadQ=MemberQ[output, Result] && TrueQ[Lookup[myOptions, Upload, True]];
+	uploadTransaction=If[uploadQ, BeginUploadTransaction[CreateUUID[]], None];
+
+	(* Call the experiment on each shard, keeping only what it returns rather than anything it resolved along the way. *)
+	(* Stop at the first shard that fails, since the call can no longer return a protocol for each of its shards. *)
+	shardOutputs={};
+	failedShard=Null;
+	(* If the call is aborted part way through, close the transaction and roll back whatever the shards uploaded so far *)
+	(* before passing the abort on, so that an abort neither leaves the transaction open for later uploads nor leaves partial protocols behind. *)
+	CheckAbort[
+		Do[
+			Module[{shardIndices, shardOutput, shardOutputAssociation},
+				shardIndices=shardIndexLists[[shardNumber]];
+				shardOutput=myFunction[
+					myInputs[[shardIndices]],
+					ReplaceRule[
+						unshardedOptions,
+						Join[
+							(#->Lookup[expandedOptions, #][[shardIndices]]&)/@shardedOptions,
+							{Output->output}
+						]
+					]
+				];
+
+				(* Some early returns give $Failed instead of a value for each requested output. *)
+				shardOutputAssociation=If[ListQ[shardOutput] && Length[shardOutput]==Length[output],
+					AssociationThread[output, shardOutput],
+					AssociationThread[output, ConstantArray[shardOutput, Length[output]]]
+				];
+				AppendTo[shardOutputs, shardOutputAssociation];
+
+				If[MemberQ[output, Result] && MatchQ[Lookup[shardOutputAssociation, Result], $Failed|{___, $Failed, ___}],
+					failedShard=shardNumber;
+					Break[]
+				]
+			],
+			{shardNumber, Length[shardIndexLists]}
+		],
+		If[MatchQ[uploadTransaction, _String],
+			EndUploadTransaction[];
+			Quiet[RollbackTransaction[uploadTransaction]]
+		];
+		Abort[]
+	];
+
+	(* Close the transaction before rolling it back, so that it doesn't cover any later uploads. *)
+	If[MatchQ[uploadTransaction, _String],
+		EndUploadTransaction[]
+	];
+
+	(* If a shard failed, report which inputs it held, and roll back whatever the earlier shards uploaded. *)
+	If[MatchQ[failedShard, _Integer],
+		Message[Error::ExperimentShardFailed, failedShard, Length[shardIndexLists], First[shardIndexLists[[failedShard]]], Last[shardIndexLists[[failedShard]]]];
+
+		earlierProtocols=Cases[Lookup[Most[shardOutputs], Result, {}], ObjectReferenceP[], Infinity];
+		If[MatchQ[uploadTransaction, _String] && Length[earlierProtocols]>0,
+			rollbackResult=RollbackTransaction[uploadTransaction];
+			If[MatchQ[rollbackResult, $Failed],
+				Message[Error::ExperimentShardRollbackFailed, earlierProtocols],
+				Message[Warning::ExperimentShardsRolledBack, earlierProtocols]
+			]
+		];
+
+		Return[outputSpecification/.{
+			Result->$Failed,
+			Tests->DeleteCases[Flatten[Lookup[shardOutputs, Tests, {}]], $Failed]
+		}]
+	];
+
+	outputSpecification/.{
+		Result->Lookup[shardOutputs, Result, $Failed],
+		Tests->DeleteCases[Flatten[Lookup[shardOutputs, Tests, {}]], $Failed]
+	}
+];
+
+(* ::Subsection::Closed:: *)
+(* makes the tests of a ValidExperiment..Q call stop at the first hard failure *)
+
+(* Helper function for the FailFast option of the ValidExperiment..Q functions. Marks every test that is not a warning as a FatalFailure, *)
+(* so that RunUnitTest runs the tests once, in order, and doesn't run (or report) any test after the first one that fails. *)
+failFastTests[myTests:{TestP...}]:=Map[
+	If[TrueQ[#[Warning]],
+		#,
+		EmeraldTest[Append[First[#], FatalFailure->True]]
+	]&,
+	myTests
+];
+
+(* Helper function for the FailFast option of the ValidExperiment..Q functions. Makes the "is valid" warning for each input, but only runs *)
+(* ValidObjectQ (once, for all of the inputs) when the first of these warnings is run. If RunUnitTest stops at an earlier failure, *)
+(* ValidObjectQ is never run. *)
+failFastValidObjectQWarnings[myObjects:{ObjectP[]...}]:=Module[{validObjectBooleans},
+	validObjectBooleans=Null;
+
+	MapIndexed[
+		With[{index=First[#2]},
+			Warning[StringJoin[ToString[#1, InputForm], " is valid (run ValidObjectQ for more detailed information):"],
+				(
+					If[MatchQ[validObjectBooleans, Null],
+						validObjectBooleans=ValidObjectQ[myObjects, OutputFormat->Boolean]
+					];
+					validObjectBooleans[[index]]
+				),
+				True
+			]
+		]&,
+		myObjects
+	]
+];
+
 (* ::Subsection::Closed:: *)
 (* Helper function to be called in sanitizeInputs to check if any options contain specified objects that are in an unusable state *)
 DefineOptions[checkObjectsInOptions,
@@ -1412,6 +1412,26 @@ DefineOptionSet[
 ];
 
 
+(* ::Subsubsection::Closed:: *)
+(*ShardSizeOption*)
+
+
+DefineOptionSet[
+	ShardSizeOption:>{
+		{
+			OptionName -> ShardSize,
+			Default -> Null,
+			Description -> "The largest number of inputs that are resolved and uploaded together in one protocol. If specified, longer input lists are split into consecutive shards of at most this many inputs, each of which becomes its own protocol, and Result is the list of those protocols (or, with Upload -> False, the list of each shard's packets) rather than a single protocol. If any shard fails, the remaining shards are not run, the protocols of the earlier shards are rolled back and Result is $Failed. Calls that return Options, a Preview or a Simulation, or that have a Name or sample preparation, are never split. If Null, the inputs are never split.",
+			AllowNull -> True,
+			Widget -> Widget[
+				Type -> Number,
+				Pattern :> GreaterP[0, 1]
+			]
+		}
+	}
+];
+
+
 (* ::Subsubsection::Closed:: *)
 (*ConfirmOption*)
 
@@ -3999,7 +3999,8 @@ DefineOptions[
 	Options :> {HelperOutputOption, CacheOption, SimulationOption}
 ];
 
-resolveFPLCOptions[mySamples : {ObjectP[Object[Sample]]...}, myOptions : {_Rule...}, myResolutionOptions : OptionsPattern[resolveFPLCOptions]] := Module[
+(* NOTE: $compiledGradientCache is Blocked to a fresh association so that each distinct gradient is only compiled once in this call (see compiledGradient). *)
+resolveFPLCOptions[mySamples : {ObjectP[Object[Sample]]...}, myOptions : {_Rule...}, myResolutionOptions : OptionsPattern[resolveFPLCOptions]] := Block[{$compiledGradientCache = <||>}, Module[
 	{outputSpecification, output, gatherTests, cache, samplePrepOptions, fplcOptions, simulatedSamples, resolvedSamplePrepOptions, simulatedCache,
 		samplePrepTests, invalidInputs, invalidOptions, resolvedAliquotOptions, discardedQ, discardedSamplePackets, discardedInvalidInputs, containerlessQ,
 		resolvedPostProcessingOptions, messagesQ, engineQ, samplePackets, sampleStatuses, discardedSamplePacketsTest, resolvedExperimentOptions, resolvedOptions,
@@ -9755,7 +9756,7 @@ resolveFPLCOptions[mySamples : {ObjectP[Object[Sample]]...}, myOptions : {_Rule.
 		Result -> resolvedOptions,
 		Tests -> allTests
 	}
-];
+]];
 
 (* ::Subsubsection:: *)
 (*fplcResourcePackets*)
@@ -12038,20 +12039,24 @@ ExperimentFPLCPreview[myInput : ListableP[ObjectP[{Object[Container], Object[Sam
 
 
 DefineOptions[ValidExperimentFPLCQ,
-	Options :> {VerboseOption, OutputFormatOption},
+	Options :> {VerboseOption, OutputFormatOption, FailFastOption},
 	SharedOptions :> {ExperimentFPLC}
 ];
 
 
 ValidExperimentFPLCQ[myInput : ListableP[ObjectP[{Object[Container], Object[Sample], Model[Sample]}] | _String], myOptions : OptionsPattern[ValidExperimentFPLCQ]] := Module[
-	{listedOptions, listedInput, preparedOptions, filterTests, initialTestDescription, allTests, verbose, outputFormat},
+	{listedOptions, listedInput, preparedOptions, filterTests, initialTestDescription, allTests, verbose, outputFormat, failFast},
 
 	(* get the options as a list *)
 	listedOptions = ToList[myOptions];
 	listedInput = ToList[myInput];
 
+	(* determine the Verbose, OutputFormat and FailFast options; quiet the OptionValue::nodef message in case someone just passed nonsense *)
+	(* like if I ran OptionDefault[OptionValue[ValidExperimentMassSpectrometryQ, {Horse -> Zebra, Verbose -> True, OutputFormat -> Boolean}, {Verbose, OutputFormat}]], it would throw a message for the Horse -> Zebra option not existing, even if I am not actually pulling that one out *)
+	{verbose, outputFormat, failFast} = Quiet[OptionDefault[OptionValue[{Verbose, OutputFormat, FailFast}]], OptionValue::nodef];
+
 	(* remove the Output option before passing to the core function because it doesn't make sense here *)
-	preparedOptions = DeleteCases[listedOptions, (Output | Verbose | OutputFormat) -> _];
+	preparedOptions = DeleteCases[listedOptions, (Output | Verbose | OutputFormat | FailFast) -> _];
 
 	(* return only the tests for ExperimentFPLC *)
 	filterTests = ExperimentFPLC[myInput, Append[preparedOptions, Output -> Tests]];
@@ -12068,25 +12073,27 @@ ValidExperimentFPLCQ[myInput : ListableP[ObjectP[{Object[Container], Object[Samp
 			(* generate the initial test, which we know will pass if we got this far (?) *)
 			initialTest = Test[initialTestDescription, True, True];
 
-			(* create warnings for invalid objects *)
-			validObjectBooleans = ValidObjectQ[DeleteCases[listedInput, _String], OutputFormat -> Boolean];
-			voqWarnings = MapThread[
-				Warning[StringJoin[ToString[#1, InputForm], " is valid (run ValidObjectQ for more detailed information):"],
-					#2,
-					True
-				]&,
-				{DeleteCases[listedInput, _String], validObjectBooleans}
-			];
+			(* if we're failing fast, RunUnitTest stops at the first test that fails, and we only check the inputs with ValidObjectQ if it gets that far *)
+			If[TrueQ[failFast],
+				Flatten[{initialTest, failFastTests[filterTests], failFastValidObjectQWarnings[DeleteCases[listedInput, _String]]}],
+				(
+					(* create warnings for invalid objects *)
+					validObjectBooleans = ValidObjectQ[DeleteCases[listedInput, _String], OutputFormat -> Boolean];
+					voqWarnings = MapThread[
+						Warning[StringJoin[ToString[#1, InputForm], " is valid (run ValidObjectQ for more detailed information):"],
+							#2,
+							True
+						]&,
+						{DeleteCases[listedInput, _String], validObjectBooleans}
+					];
 
-			(* get all the tests/warnings *)
-			Flatten[{initialTest, filterTests, voqWarnings}]
+					(* get all the tests/warnings *)
+					Flatten[{initialTest, filterTests, voqWarnings}]
+				)
+			]
 		]
 	];
 
-	(* determine the Verbose and OutputFormat options; quiet the OptionValue::nodef message in case someone just passed nonsense *)
-	(* like if I ran OptionDefault[OptionValue[ValidExperimentMassSpectrometryQ, {Horse -> Zebra, Verbose -> True, OutputFormat -> Boolean}, {Verbose, OutputFormat}]], it would throw a message for the Horse -> Zebra option not existing, even if I am not actually pulling that one out *)
-	{verbose, outputFormat} = Quiet[OptionDefault[OptionValue[{Verbose, OutputFormat}]], OptionValue::nodef];
-
 	(* run all the tests as requested *)
 	Lookup[RunUnitTest[<|"ValidExperimentFPLCQ" -> allTests|>, OutputFormat -> outputFormat, Verbose -> verbose], "ValidExperimentFPLCQ"]
 ];
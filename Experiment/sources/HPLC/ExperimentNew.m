@@ -4310,7 +4310,7 @@ ExperimentHPLC[mySamples : ListableP[ObjectP[Object[Sample]]], myOptions : Optio
 		modelInstrumentObjects, columnObjects, modelColumnObjects, gradientObjects, fractionCollectionObjects, syringeObject, authorObject, cacheBall,
 		resolvedOptionsResult, resolvedOptions, resolvedOptionsTests, collapsedResolvedOptions, protocolObject, resourcePackets,
 		resourcePacketTests, cartridgeObjects, modelCartridgeObjects, cartridgeFields, modelCartridgeFields,
-		mySamplesWithPreparedSamplesNamed, safeOpsNamed, myOptionsWithPreparedSamplesNamed},
+		mySamplesWithPreparedSamplesNamed, safeOpsNamed, myOptionsWithPreparedSamplesNamed, returnEarlyBecauseOptionsResolverOnly},
 
 	(* Make sure we're working with a list of options *)
 	{listedSamples, listedOptions} = removeLinks[ToList[mySamples], ToList[myOptions]];
@@ -4737,6 +4737,20 @@ ExperimentHPLC[mySamples : ListableP[ObjectP[Object[Sample]]], myOptions : Optio
 		}]
 	];
 
+	(* Lookup our OptionsResolverOnly option. This will determine if we skip the resource packets *)
+	(* If Output contains Result, then we can't do this *)
+	returnEarlyBecauseOptionsResolverOnly = TrueQ[Lookup[safeOps, OptionsResolverOnly]] && Not[MemberQ[output, Result]];
+
+	(* If we were only asked for the resolved options, return them without building the resource packets *)
+	If[returnEarlyBecauseOptionsResolverOnly,
+		Return[outputSpecification /. {
+			Result -> Null,
+			Tests -> Join[safeOpsTests, validLengthTests, templateTests, resolvedOptionsTests],
+			Options -> RemoveHiddenOptions[ExperimentHPLC, collapsedResolvedOptions],
+			Preview -> Null
+		}]
+	];
+
 	(* Build packets with resources *)
 	{resourcePackets, resourcePacketTests} = If[gatherTestsQ,
 		HPLCResourcePacketsNew[mySamplesWithPreparedSamples, templatedOptions, resolvedOptions, Cache -> cacheBall, Simulation -> updatedSimulation, Output -> {Result, Tests}],
@@ -4879,7 +4893,8 @@ DefineOptions[
 ];
 
 
-resolveExperimentHPLCOptions[mySamples : {ObjectP[Object[Sample]]...}, myOptions : {_Rule...}, ops : OptionsPattern[resolveExperimentHPLCOptions]] := Module[
+(* NOTE: $compiledGradientCache is Blocked to a fresh association so that each distinct gradient is only compiled once in this call (see compiledGradient). *)
+resolveExperimentHPLCOptions[mySamples : {ObjectP[Object[Sample]]...}, myOptions : {_Rule...}, ops : OptionsPattern[resolveExperimentHPLCOptions]] := Block[{$compiledGradientCache = <||>}, Module[
 	{outputSpecification, output, gatherTestsQ, messagesQ, engineQ, testOrNull, warningOrNull, cache, simulatedSamplePackets,
 		samplePrepOptions, hplcOptions, samplePrepTests, simulatedSamples, fastAssoc, simulation,
 		resolvedSamplePrepOptions, updatedSimulation, optionsAssociation,
@@ -15076,7 +15091,7 @@ tightly as possible, put them all in a single target grouping *)
 		Result -> If[!internalUsageQ, resolvedOptions, {simulatedSamples, resolvedOptions, invalidOptions, invalidInputs, updatedSimulation}]
 	}
 
-];
+]];
 
 
 
@@ -22678,8 +22693,8 @@ ExperimentHPLCOptions[myObjects : ListableP[ObjectP[Object[Container]]] | Listab
 	(* remove the Output option before passing to the core function because it doesn't make sense here *)
 	noOutputOptions = DeleteCases[listedOptions, (Output -> _) | (OutputFormat -> _)];
 
-	(* return only the preview for ExperimentHPLC *)
-	options = ExperimentHPLC[myObjects, Append[noOutputOptions, Output -> Options]];
+	(* return only the options for ExperimentHPLC, skipping the resource packets unless we were told not to *)
+	options = ExperimentHPLC[myObjects, ReplaceRule[noOutputOptions, {Output -> Options, OptionsResolverOnly -> Lookup[listedOptions, OptionsResolverOnly, True]}]];
 
 	(* If options fail, return failure *)
 	If[MatchQ[options, $Failed],
@@ -22706,7 +22721,8 @@ ExperimentHPLCOptions[myObjects : ListableP[ObjectP[Object[Container]]] | Listab
 DefineOptions[ValidExperimentHPLCQ,
 	Options :> {
 		VerboseOption,
-		OutputFormatOption
+		OutputFormatOption,
+		FailFastOption
 	},
 	SharedOptions :> {ExperimentHPLC}
 ];
@@ -22714,33 +22730,39 @@ DefineOptions[ValidExperimentHPLCQ,
 
 ValidExperimentHPLCQ[myObjects : ListableP[ObjectP[Object[Container]]] | ListableP[(ObjectP[{Object[Sample], Model[Sample]}] | _String)], myOptions : OptionsPattern[]] := Module[
 	{listedOptions, noOutputOptions, preparedOptions, hplcTests, validObjectBooleans, voqWarnings,
-		initialTestDescription, allTests, verbose, outputFormat},
+		initialTestDescription, allTests, verbose, outputFormat, failFast},
 
 	(* get the options as a list *)
 	listedOptions = ToList[myOptions];
 
+	(* determine the Verbose, OutputFormat and FailFast options; quiet the OptionValue::nodef message in case someone just passed nonsense *)
+	(* like if I ran OptionDefault[OptionValue[ValidExperimentHPLCQ, {Horse -> Zebra, Verbose -> True, OutputFormat -> Boolean}, {Verbose, OutputFormat}]], it would throw a message for the Horse -> Zebra option not existing, even if I am not actually pulling that one out *)
+	{verbose, outputFormat, failFast} = Quiet[OptionDefault[OptionValue[{Verbose, OutputFormat, FailFast}]], OptionValue::nodef];
+
 	(* remove the Output option before passing to the core function because it doesn't make sense here *)
-	preparedOptions = DeleteCases[listedOptions, (Output | Verbose | OutputFormat) -> _];
+	preparedOptions = DeleteCases[listedOptions, (Output | Verbose | OutputFormat | FailFast) -> _];
 
 	(* return only the tests for ExperimentHPLC *)
 	hplcTests = ExperimentHPLC[myObjects, Append[preparedOptions, Output -> Tests]];
 
-	(* Create warnings for invalid objects *)
-	validObjectBooleans = ValidObjectQ[DeleteCases[ToList[myObjects], _String], OutputFormat -> Boolean];
-	voqWarnings = MapThread[
-		Warning[StringJoin[ToString[#1, InputForm], " is valid (run ValidObjectQ for more detailed information):"],
-			#2,
-			True
-		]&,
-		{DeleteCases[ToList[myObjects], _String], validObjectBooleans}
-	];
-
 	(* Make a list of all the tests *)
-	allTests = Join[hplcTests, voqWarnings];
+	allTests = If[TrueQ[failFast],
+		(* if we're failing fast, RunUnitTest stops at the first test of ExperimentHPLC that fails, and we only check the inputs with ValidObjectQ if it gets that far *)
+		Join[failFastTests[hplcTests], failFastValidObjectQWarnings[DeleteCases[ToList[myObjects], _String]]],
+		(
+			(* Create warnings for invalid objects *)
+			validObjectBooleans = ValidObjectQ[DeleteCases[ToList[myObjects], _String], OutputFormat -> Boolean];
+			voqWarnings = MapThread[
+				Warning[StringJoin[ToString[#1, InputForm], " is valid (run ValidObjectQ for more detailed information):"],
+					#2,
+					True
+				]&,
+				{DeleteCases[ToList[myObjects], _String], validObjectBooleans}
+			];
 
-	(* determine the Verbose and OutputFormat options; quiet the OptionValue::nodef message in case someone just passed nonsense *)
-	(* like if I ran OptionDefault[OptionValue[ValidExperimentHPLCQ, {Horse -> Zebra, Verbose -> True, OutputFormat -> Boolean}, {Verbose, OutputFormat}]], it would throw a message for the Horse -> Zebra option not existing, even if I am not actually pulling that one out *)
-	{verbose, outputFormat} = Quiet[OptionDefault[OptionValue[{Verbose, OutputFormat}]], OptionValue::nodef];
+			Join[hplcTests, voqWarnings]
+		)
+	];
 
 	(* run all the tests as requested *)
 	Lookup[RunUnitTest[<|"ValidExperimentHPLCQ" -> allTests|>, OutputFormat -> outputFormat, Verbose -> verbose], "ValidExperimentHPLCQ"]
@@ -1976,6 +1976,7 @@ resolveGradient[
 
 
 (* 3 - Main Overload - eight gradients with the refractive index reference loading input *)
+(* A call often has hundreds of injections that share a handful of gradients, so each distinct set of gradient options is only compiled once per options resolver call *)
 resolveGradient[
   myGradientValue:(Automatic|expandedGradientP|Null),
   myGradientAValue:(Null|Automatic|{{TimeP,PercentP}..}|PercentP),
@@ -1993,6 +1994,59 @@ resolveGradient[
   myFlushTime:(TimeP|Null),
   myEquilibrationTime:(TimeP|Null),
   myReferenceLoadingClosedQ:(Open|Closed|None|{(Open|Closed|None)..})
+]:=compiledGradient[{
+  myGradientValue,
+  myGradientAValue,
+  myGradientBValue,
+  myGradientCValue,
+  myGradientDValue,
+  myGradientEValue,
+  myGradientFValue,
+  myGradientGValue,
+  myGradientHValue,
+  myFlowRateValue,
+  myGradientStart,
+  myGradientEnd,
+  myGradientDuration,
+  myFlushTime,
+  myEquilibrationTime,
+  myReferenceLoadingClosedQ
+}];
+
+(* compiledGradient *)
+(* The compiled gradient for each distinct set of gradient options seen so far in the current options resolver call, or Null if we aren't in one. *)
+(* resolveExperimentHPLCOptions and resolveFPLCOptions Block this to an empty association for the length of the call, so that compileGradient is *)
+(* only called once per distinct gradient within a call, and nothing is kept once the call is over. *)
+$compiledGradientCache=Null;
+
+compiledGradient[myGradientOptions_List]:=Which[
+  !AssociationQ[$compiledGradientCache],
+    compileGradient@@myGradientOptions,
+  KeyExistsQ[$compiledGradientCache, myGradientOptions],
+    $compiledGradientCache[myGradientOptions],
+  True,
+    $compiledGradientCache[myGradientOptions]=compileGradient@@myGradientOptions
+];
+
+(* compileGradient *)
+(* Builds the full gradient table, with the equilibration and flush steps and the refractive index reference loading status, from the gradient options *)
+compileGradient[
+  myGradientValue:(Automatic|expandedGradientP|Null),
+  myGradientAValue:(Null|Automatic|{{TimeP,PercentP}..}|PercentP),
+  myGradientBValue:(Null|Automatic|{{TimeP,PercentP}..}|PercentP),
+  myGradientCValue:(Null|Automatic|{{TimeP,PercentP}..}|PercentP),
+  myGradientDValue:(Null|Automatic|{{TimeP,PercentP}..}|PercentP),
+  myGradientEValue:(Null|Automatic|{{TimeP,PercentP}..}|PercentP),
+  myGradientFValue:(Null|Automatic|{{TimeP,PercentP}..}|PercentP),
+  myGradientGValue:(Null|Automatic|{{TimeP,PercentP}..}|PercentP),
+  myGradientHValue:(Null|Automatic|{{TimeP,PercentP}..}|PercentP),
+  myFlowRateValue:({{TimeP,FlowRateP}..}|FlowRateP),
+  myGradientStart:(PercentP|Null),
+  myGradientEnd:(PercentP|Null),
+  myGradientDuration:(TimeP|Null),
+  myFlushTime:(TimeP|Null),
+  myEquilibrationTime:(TimeP|Null),
+  myReferenceLoadingClosedQ:(Open|Closed|None|{(Open|Closed|None)..})
 ]:=Module[
   {protoResolvedGradient,gradientWithEquilibrationTime,gradientWithFlushTime, gradientWithReferenceLoading,
     gradientATimepoints, gradientBTimepoints, gradientCTimepoints, gradientDTimepoints, gradientASpecifiedTimes,
@@ -97,6 +97,7 @@ DefineOptions[
 		(* Shared Options *)
 		(* Had to break apart NonBiologyFuntopiaSharedOptions to get rid of ImageSample option *)
 		ProtocolOptions,
+		ShardSizeOption,
 		SimulationOption,
 		PreparationOption,
 		ModelInputOptions,
@@ -144,7 +145,7 @@ ExperimentImageSample[mySamples:ListableP[ObjectP[{Object[Sample],Model[Sample]}
 		nonHazardousInputs,hazardousInputs,hazardCheckedSamples,hazardCheckedResolvedOptions,hazardTests,
 		collapsedResolvedOptions,resolvedPreparation,optionsResolverOnly,returnEarlyBecauseOptionsResolverOnly,
 		returnEarlyBecauseFailuresQ,returnEarlyBecauseAllHazardousSamples,performSimulationQ,
-		protocolObject,protocolPacketWithResources,resourcePacketTests,simulatedProtocol,finalSimulation, containerModelFields
+		protocolObject,protocolPacketWithResources,resourcePacketTests,simulatedProtocol,finalSimulation, containerModelFields,shardSize
 	},
 
 	(* Determine the requested return value from the function *)
@@ -157,6 +158,12 @@ ExperimentImageSample[mySamples:ListableP[ObjectP[{Object[Sample],Model[Sample]}
 	(* make sure we're working with a list of options and samples, and remove all temporal links *)
 	{listedSamples,listedOptions}=removeLinks[ToList[mySamples],ToList[myOptions]];
 
+	(* Split very large calls into shards that are each resolved and uploaded as their own protocol *)
+	shardSize=experimentShardSize[listedSamples,listedOptions];
+	If[MatchQ[shardSize,_Integer],
+		Return[shardedExperimentCall[ExperimentImageSample,listedSamples,listedOptions,shardSize]]
+	];
+
 
 	(* Simulate our sample preparation. *)
 	validSamplePreparationResult=Check[
@@ -1259,10 +1259,11 @@ ExperimentIncubate[myInputs:ListableP[ObjectP[Object[Sample]]],myOptions:Options
 	]}],{Download::FieldDoesntExist, Download::ObjectDoesNotExist}];
 
 	(* Build the resolved options *)
+	(* NOTE: We reuse the resolved options of a previous call if neither the samples nor the options have changed since. *)
 	resolvedOptionsResult = Check[
 		{resolvedOptions,resolvedOptionsTests} = If[gatherTests,
-			resolveExperimentIncubateNewOptions[ToList[mySamplesWithPreparedSamples],expandedSafeOps,Cache->cacheBall,Simulation->samplePreparationSimulation,Output->{Result,Tests}],
-			{resolveExperimentIncubateNewOptions[ToList[mySamplesWithPreparedSamples],expandedSafeOps,Cache->cacheBall,Simulation->samplePreparationSimulation],{}}
+			cachedResolverCall[resolveExperimentIncubateNewOptions,ToList[mySamplesWithPreparedSamples],expandedSafeOps,Cache->cacheBall,Simulation->samplePreparationSimulation,Output->{Result,Tests}],
+			{cachedResolverCall[resolveExperimentIncubateNewOptions,ToList[mySamplesWithPreparedSamples],expandedSafeOps,Cache->cacheBall,Simulation->samplePreparationSimulation],{}}
 		],
 		$Failed,
 		{Error::InvalidInput,Error::InvalidOption}
@@ -9597,3 +9597,118 @@ ExperimentInoculateLiquidMediaPreview[myInputs: ListableP[ObjectP[{Object[Contai
 
 	(* return only the preview for ExperimentInoculateLiquidMedia *)
 	ExperimentInoculateLiquidMedia[myInputs, Append[noOutputOptions, Output -> Preview]]];
+
+
+(* ::Subsection::Closed:: *)
+(*PlanColonyCampaign*)
+
+
+DefineOptions[PlanColonyCampaign,
+	Options :> {
+		{
+			OptionName -> BatchSize,
+			Default -> 96,
+			AllowNull -> False,
+			Widget -> Widget[Type -> Number, Pattern :> GreaterP[0, 1]],
+			Description -> "The largest number of colonies that are picked in one batch. No more than this many hits are held back between calls, and each batch is resolved on its own, so the time and memory taken by each batch do not grow with the size of the campaign.",
+			Category -> "General"
+		},
+		{
+			OptionName -> Flush,
+			Default -> False,
+			AllowNull -> False,
+			Widget -> Widget[Type -> Enumeration, Pattern :> BooleanP],
+			Description -> "Indicates if the hits that do not fill a whole batch are emitted as a last, smaller batch rather than held back for the next call. Set to True once the last hits of the campaign have arrived.",
+			Category -> "General"
+		},
+		{
+			OptionName -> DestinationMedia,
+			Default -> Automatic,
+			AllowNull -> False,
+			Widget -> Widget[Type -> Object, Pattern :> ObjectP[{Model[Sample], Object[Sample]}]],
+			Description -> "The liquid media that the picked colonies are inoculated into.",
+			ResolutionDescription -> "Automatically resolved by ExperimentInoculateLiquidMedia when the batch is run.",
+			Category -> "Inoculation"
+		},
+		{
+			OptionName -> DestinationMediaContainer,
+			Default -> Automatic,
+			AllowNull -> False,
+			Widget -> Widget[Type -> Object, Pattern :> ObjectP[Model[Container]]],
+			Description -> "The container that the colonies picked from each source sample in a batch are inoculated into.",
+			ResolutionDescription -> "Automatically resolved by ExperimentInoculateLiquidMedia when the batch is run.",
+			Category -> "Inoculation"
+		},
+		{
+			OptionName -> IncubationTime,
+			Default -> Automatic,
+			AllowNull -> True,
+			Widget -> Widget[Type -> Quantity, Pattern :> RangeP[0 Hour, $MaxCellIncubationTime], Units -> {Hour, {Hour, Day}}],
+			Description -> "The duration for which the inoculated cultures of each batch are incubated. If Null, the batches only inoculate the colonies and are not incubated.",
+			ResolutionDescription -> "Automatically resolved by ExperimentIncubateCells when the batch is run.",
+			Category -> "Incubation"
+		}
+	}
+];
+
+(* colony hits are the source sample with the colony on it and the coordinates to pick the colony from *)
+colonyHitP = {ObjectP[Object[Sample]], {DistanceP, DistanceP}};
+
+(* public planner for cell-line development campaigns that pick and grow thousands of colonies *)
+(* it takes the colony hits as they come in, for example from AnalyzeColonies, and hands back every full batch straight away, *)
+(* holding on only to the hits that do not fill a batch yet, so nothing about the campaign as a whole is kept in memory or resolved at once *)
+PlanColonyCampaign[myHits:{colonyHitP...}, myOptions:OptionsPattern[PlanColonyCampaign]] := PlanColonyCampaign[myHits, {}, myOptions];
+PlanColonyCampaign[myHits:{colonyHitP...}, myPendingHits:{colonyHitP...}, myOptions:OptionsPattern[PlanColonyCampaign]] := Module[
+	{safeOptions, batchSize, flush, destinationMedia, destinationMediaContainer, incubationTime, allHits, fullBatchCount, batchHits, pendingHits, batches},
+
+	(* get our options *)
+	safeOptions = SafeOptions[PlanColonyCampaign, ToList[myOptions]];
+	{batchSize, flush, destinationMedia, destinationMediaContainer, incubationTime} = Lookup[
+		safeOptions,
+		{BatchSize, Flush, DestinationMedia, DestinationMediaContainer, IncubationTime}
+	];
+
+	(* the hits held back last time come first so that colonies are picked in the order they were found *)
+	allHits = Join[myPendingHits, myHits];
+
+	(* split off every full batch, and the rest as well if we are flushing *)
+	fullBatchCount = Quotient[Length[allHits], batchSize];
+	{batchHits, pendingHits} = If[TrueQ[flush],
+		{Partition[allHits, UpTo[batchSize]], {}},
+		{Partition[Take[allHits, fullBatchCount * batchSize], batchSize], Drop[allHits, fullBatchCount * batchSize]}
+	];
+
+	(* make the unit operations of each batch *)
+	batches = Map[
+		Function[{hits},
+			Module[{coordinatesBySample, sourceSamples, pickCoordinates, containerOutLabels, inoculation},
+
+				(* pick all of the colonies of a source sample in the batch in one go, in the order the samples first come up *)
+				coordinatesBySample = GroupBy[Transpose[{Download[hits[[All, 1]], Object], hits[[All, 2]]}], First -> Last];
+				sourceSamples = Keys[coordinatesBySample];
+				pickCoordinates = Values[coordinatesBySample];
+
+				(* label the new cultures so that the incubation can refer to them *)
+				containerOutLabels = Table[CreateUniqueLabel["colony campaign culture"], Length[sourceSamples]];
+
+				inoculation = InoculateLiquidMedia[
+					Sample -> sourceSamples,
+					InoculationSource -> SolidMedia,
+					Populations -> CustomCoordinates,
+					PickCoordinates -> pickCoordinates,
+					DestinationMedia -> destinationMedia,
+					DestinationMediaContainer -> destinationMediaContainer,
+					ContainerOutLabel -> containerOutLabels
+				];
+
+				If[NullQ[incubationTime],
+					{inoculation},
+					{inoculation, IncubateCells[Sample -> containerOutLabels, Time -> incubationTime]}
+				]
+			]
+		],
+		batchHits
+	];
+
+	{batches, pendingHits}
+];
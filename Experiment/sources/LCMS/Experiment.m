@@ -9182,7 +9182,7 @@ ExperimentLCMS[mySamples:ListableP[ObjectP[Object[Sample]]],myOptions:OptionsPat
 		cartridgeObjects, modelCartridgeObjects,cacheBall, resolvedOptionsResult, collapsedResolvedOptions, protocolObject,
 		resolvedOptions,resolvedOptionsTests, sampleIdentityModelFields,modelMoleculeFieldsPacket,identityModelFieldsPacketForm,
 		identityModelObjects, resourcePackets,resourcePacketTests,listedSamples, mySamplesWithPreparedSamplesNamed, safeOpsNamed,
-		myOptionsWithPreparedSamplesNamed, updatedSimulation},
+		myOptionsWithPreparedSamplesNamed, updatedSimulation, returnEarlyBecauseOptionsResolverOnly},
 
 	(* Make sure we're working with a list of options *)
 	{listedSamples, listedOptions} = removeLinks[ToList[mySamples], ToList[myOptions]];
@@ -9646,6 +9646,21 @@ ExperimentLCMS[mySamples:ListableP[ObjectP[Object[Sample]]],myOptions:OptionsPat
 	];
 	
 	
+	(* Lookup our OptionsResolverOnly option. This will determine if we skip the resource packets *)
+	(* If Output contains Result, then we can't do this *)
+	returnEarlyBecauseOptionsResolverOnly=TrueQ[Lookup[safeOps,OptionsResolverOnly]]&&Not[MemberQ[output,Result]];
+
+	(* If we were only asked for the resolved options, return them without building the resource packets *)
+	If[returnEarlyBecauseOptionsResolverOnly,
+		Return[outputSpecification/.{
+			Result -> Null,
+			Tests->Join[safeOpsTests,validLengthTests,templateTests,resolvedOptionsTests],
+			Options->RemoveHiddenOptions[ExperimentLCMS,collapsedResolvedOptions],
+			Preview->Null,
+			Simulation -> updatedSimulation
+		}]
+	];
+
 	(* Build packets with resources *)
 	{resourcePackets,resourcePacketTests} = If[gatherTestsQ,
 		LCMSResourcePackets[ToList[mySamplesWithPreparedSamples],templatedOptions,resolvedOptions,Cache->cacheBall, Simulation -> updatedSimulation,Output->{Result,Tests}],
@@ -20361,8 +20376,8 @@ ExperimentLCMSOptions[myObjects:ListableP[ObjectP[Object[Container]]]|ListableP[
 	(* remove the Output option before passing to the core function because it doesn't make sense here *)
 	noOutputOptions = DeleteCases[listedOptions, (Output -> _) | (OutputFormat->_)];
 
-	(* return only the preview for ExperimentLCMS *)
-	options = ExperimentLCMS[myObjects, Append[noOutputOptions, Output -> Options]];
+	(* return only the options for ExperimentLCMS, skipping the resource packets unless we were told not to *)
+	options = ExperimentLCMS[myObjects, ReplaceRule[noOutputOptions, {Output -> Options, OptionsResolverOnly -> Lookup[listedOptions, OptionsResolverOnly, True]}]];
 
 	(* If options fail, return failure *)
 	If[MatchQ[options,$Failed],
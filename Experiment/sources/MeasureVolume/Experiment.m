@@ -114,6 +114,7 @@ DefineOptions[
 			Widget -> Widget[Type -> Enumeration, Pattern :> BooleanP]
 		},
 		ProtocolOptions,
+		ShardSizeOption,
 		SimulationOption,
 		PreparationOption,
 		SamplePrepOptions,
@@ -165,7 +166,7 @@ ExperimentMeasureVolume[mySamples:ListableP[ObjectP[Object[Sample]]],myOptions:O
 		simulatedProtocol,finalSimulation,aliquotAdjustedOptions,cache,inSituOp,packets,metaContainers,metaContainerParents,
 		samplePackets,sampleModels,containerPackets, containerModels,volumeCalibrations,filteredSamplesIn,filteredExpandedOptions,metaMetaContainerParents,
 		objectSampleFields,modelSampleFields,containerFields,modelContainerFields,rackPackets,mySamplesWithPreparedSamplesNamed,
-		myOptionsWithPreparedSamplesNamed,safeOptionsNamed, numberOfReplicates,parentProtocolPacket,parentPostProcessingBool,storageMeasurements
+		myOptionsWithPreparedSamplesNamed,safeOptionsNamed, numberOfReplicates,parentProtocolPacket,parentPostProcessingBool,storageMeasurements,shardSize
 	},
 
 	(* Determine the requested return value from the function *)
@@ -178,6 +179,12 @@ ExperimentMeasureVolume[mySamples:ListableP[ObjectP[Object[Sample]]],myOptions:O
 	(* make sure we're working with a list of options and samples, and remove all temporal links *)
 	{listedSamples,listedOptions}=removeLinks[ToList[mySamples],ToList[myOptions]];
 
+	(* Split very large calls into shards that are each resolved and uploaded as their own protocol *)
+	shardSize=experimentShardSize[listedSamples,listedOptions];
+	If[MatchQ[shardSize,_Integer],
+		Return[shardedExperimentCall[ExperimentMeasureVolume,listedSamples,listedOptions,shardSize]]
+	];
+
 	(* Simulate our sample preparation. *)
 	validSamplePreparationResult=Check[
 		(* Simulate sample preparation. *)
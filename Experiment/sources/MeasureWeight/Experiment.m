@@ -96,6 +96,7 @@ DefineOptions[ExperimentMeasureWeight,
 		AliquotOptions,
 		ModelInputOptions,
 		ProtocolOptions,
+		ShardSizeOption,
 		SamplePrepOptions,
 		ImageSampleOption,
 		SamplesInStorageOptions,
@@ -290,7 +291,7 @@ ExperimentMeasureWeight[myInputs:ListableP[ObjectP[{Object[Container],Sequence @
 	myInputsWithPreparedSamplesDuplicateFree,
 	validQ,previewRule,optionsRule,testsRule,simulationRule,resultRule,allMetaContainerPackets,validSamplePreparationResult,myInputsWithPreparedSamples,
 	livingSterileWarningBools, livingSamples, sterileSamples,
-	myOptionsWithPreparedSamples,updatedSimulation,myInputsWithPreparedSamplesNamed,myOptionsWithPreparedSamplesNamed,safeOptionsNamed,parentProtocolPackets,parentPostProcessingBool,coveredContainerPackets
+	myOptionsWithPreparedSamples,updatedSimulation,myInputsWithPreparedSamplesNamed,myOptionsWithPreparedSamplesNamed,safeOptionsNamed,parentProtocolPackets,parentPostProcessingBool,coveredContainerPackets,shardSize
 },
 
 	(* Determine the requested return value from the function *)
@@ -305,6 +306,12 @@ ExperimentMeasureWeight[myInputs:ListableP[ObjectP[{Object[Container],Sequence @
 	(* Remove temporal links and throw warnings *)
 	{listedInputs,listedOptions}=removeLinks[ToList[myInputs],ToList[myOptions]];
 
+	(* Split very large calls into shards that are each resolved and uploaded as their own protocol *)
+	shardSize=experimentShardSize[listedInputs,listedOptions];
+	If[MatchQ[shardSize,_Integer],
+		Return[shardedExperimentCall[ExperimentMeasureWeight,listedInputs,listedOptions,shardSize]]
+	];
+
 	(* Simulate our sample preparation. *)
 	validSamplePreparationResult=Check[
 		(* Simulate sample preparation. *)
@@ -4040,7 +4040,8 @@ ExperimentPCROptions[
 	listedOptions=ToList[myOptions];
 
 	(* Send in the correct Output option and remove the OutputFormat option *)
-	preparedOptions=Normal@KeyDrop[Append[listedOptions,Output->Options],{OutputFormat}];
+	(* We only need the resolved options, so skip the resource packets and simulation unless we were told not to *)
+	preparedOptions=Normal@KeyDrop[ReplaceRule[listedOptions,{Output->Options,OptionsResolverOnly->Lookup[listedOptions,OptionsResolverOnly,True]}],{OutputFormat}];
 
 	resolvedOptions=ExperimentPCR[mySamples,myPrimerPairSamples,preparedOptions];
 
@@ -4169,3 +4170,97 @@ ValidExperimentPCRQ[
 	Table[{{Null,Null}},Length[ToList[mySamples]]],
 	myOptions
 ];
+
+
+(* ::Subsection::Closed:: *)
+(*PartitionPCRReactions*)
+
+
+DefineOptions[PartitionPCRReactions,
+	Options:>{
+		{
+			OptionName->MasterMix,
+			Default->Automatic,
+			AllowNull->True,
+			Pattern:>ListableP[Automatic|Null|ObjectP[{Model[Sample],Object[Sample]}]],
+			Description->"The master mix of each reaction. Reactions with different master mixes are never put on the same plate, since each plate is run as its own protocol with a single MasterMix. On 96-well plates, Automatic is taken to be $PCRDefaultMasterMix, the master mix ExperimentPCR resolves it to, so those reactions share plates with the reactions given that master mix. On 384-well plates the reactions with Automatic are kept apart, since the master mix ExperimentqPCR resolves it to depends on the assay.",
+			Category->"Plate Packing"
+		},
+		{
+			OptionName->NumberOfReplicates,
+			Default->Null,
+			AllowNull->True,
+			Pattern:>GreaterEqualP[2,1],
+			Description->"The number of wells that each reaction is run in. The replicates of a reaction are always kept on the same plate.",
+			Category->"Plate Packing"
+		},
+		{
+			OptionName->NumberOfWells,
+			Default->96,
+			AllowNull->False,
+			Pattern:>96|384,
+			Description->"The number of wells of the assay plate; 96 for ExperimentPCR and 384 for ExperimentqPCR.",
+			Category->"Plate Packing"
+		},
+		{
+			OptionName->ReservedWells,
+			Default->0,
+			AllowNull->False,
+			Pattern:>GreaterEqualP[0,1],
+			Description->"The number of wells on every plate that are kept free of reactions, for example for the standards, which are run on each plate, or a moat.",
+			Category->"Plate Packing"
+		}
+	}
+];
+
+Error::PCRReactionsDoNotFit="Each reaction needs `1` well(s), but only `2` of the `3` wells on each plate are left once the ReservedWells are set aside. Please decrease NumberOfReplicates or ReservedWells, or use a plate with more wells.";
+Error::PCRMasterMixLengthMismatch="The MasterMix option has `1` entries, but there are `2` reactions. Please specify a single master mix or one master mix per reaction.";
+
+(* public helper to lay out a large number of PCR or qPCR reactions onto the smallest number of assay plates *)
+(* each plate is run as its own protocol, so reactions are only put together on a plate if they share a master mix; *)
+(* the layout of the whole campaign is worked out at once, and each group that comes back can be given to its own ExperimentPCR/ExperimentqPCR call *)
+PartitionPCRReactions[{},myOptions:OptionsPattern[PartitionPCRReactions]]:={};
+PartitionPCRReactions[mySamples:{(ObjectP[{Object[Sample],Object[Container],Model[Sample]}]|_String)..},myOptions:OptionsPattern[PartitionPCRReactions]]:=Module[
+	{safeOptions,masterMix,numberOfReplicates,numberOfWells,reservedWells,wellsPerReaction,reactionsPerPlate,masterMixes,masterMixGroups},
+
+	(* get our options *)
+	safeOptions=SafeOptions[PartitionPCRReactions,ToList[myOptions]];
+	{masterMix,numberOfReplicates,numberOfWells,reservedWells}=Lookup[safeOptions,{MasterMix,NumberOfReplicates,NumberOfWells,ReservedWells}];
+
+	(* every replicate of a reaction takes up a well, and replicates stay together, so this is how many reactions fit on a plate *)
+	wellsPerReaction=Replace[numberOfReplicates,Null->1];
+	reactionsPerPlate=Floor[(numberOfWells-reservedWells)/wellsPerReaction];
+
+	If[reactionsPerPlate<1,
+		Message[Error::PCRReactionsDoNotFit,wellsPerReaction,Max[numberOfWells-reservedWells,0],numberOfWells];
+		Return[$Failed]
+	];
+
+	(* get one master mix per reaction, by object reference so that the same master mix given by name and by ID goes together *)
+	masterMixes=If[ListQ[masterMix],
+		masterMix,
+		ConstantArray[masterMix,Length[mySamples]]
+	];
+
+	If[Length[masterMixes]!=Length[mySamples],
+		Message[Error::PCRMasterMixLengthMismatch,Length[masterMixes],Length[mySamples]];
+		Return[$Failed]
+	];
+
+	(* ExperimentPCR resolves Automatic to its default master mix (ExperimentqPCR's default depends on the assay, so we can't tell it here) *)
+	masterMixes=Replace[
+		masterMixes,
+		{
+			Automatic/;MatchQ[numberOfWells,96]:>$PCRDefaultMasterMix,
+			object:ObjectP[]:>Download[object,Object]
+		},
+		{1}
+	];
+
+	(* the reactions of each master mix, in the order the master mixes first appear *)
+	masterMixGroups=Values[PositionIndex[masterMixes]];
+
+	(* since no plate can hold two master mixes, filling each master mix's plates in turn already gives the fewest plates; *)
+	(* only the last plate of each master mix is partly empty *)
+	Join@@(Partition[#,UpTo[reactionsPerPlate]]&/@masterMixGroups)
+];
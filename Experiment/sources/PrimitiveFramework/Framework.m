@@ -105,15 +105,36 @@ $DummyPrimitiveP = _LabelSample | _LabelContainer | _Wait;
  *)
 $PrimitiveFrameworkIndexedLabelCache={};
 
+(* The smallest number of resolver results that we will hold on to before we start to drop the oldest ones. *)
+$PrimitiveFrameworkResolverCacheSize=250;
+
+(* The most resolver results that a single unit operation can leave in the cache during one call: the framework caches one *)
+(* result per output specification (with and without Tests) and per preparation that the unit operation is resolved for *)
+(* (Manual and Robotic), so 2 x 2. *)
+$PrimitiveFrameworkResolverResultsPerPrimitive=4;
+
 (* Helper function to KeyDrop if our resolver cache gets too large. *)
-(* NOTE: Keys will return keys in order of first added to last added. *)
-resizePrimitiveFrameworkCache[]:=If[Length[Keys[$PrimitiveFrameworkResolverOutputCache]]>250,
+(* NOTE: Keys will return keys in order of first added to last added (or last used, see lookupPrimitiveFrameworkResolverCache). *)
+(* NOTE: The limit grows with the number of unit operations in the call, by $PrimitiveFrameworkResolverResultsPerPrimitive for each, *)
+(* so that every cached result of every unit operation of the previous call survives the resize. This is what makes re-running *)
+(* a large call after changing one unit operation incremental: every unit operation before the changed one (whose inputs, *)
+(* options and incoming simulation are unchanged) is looked up instead of resolved again. *)
+resizePrimitiveFrameworkCache[myNumberOfPrimitives_Integer]:=If[Length[Keys[$PrimitiveFrameworkResolverOutputCache]]>Max[$PrimitiveFrameworkResolverCacheSize, $PrimitiveFrameworkResolverResultsPerPrimitive*myNumberOfPrimitives],
   KeyDropFrom[
     $PrimitiveFrameworkResolverOutputCache,
     Take[Keys[$PrimitiveFrameworkResolverOutputCache], Ceiling[Length[Keys[$PrimitiveFrameworkResolverOutputCache]]/2]]
   ];
 ];
 
+(* Helper function to get a previous resolver result and mark it as the most recently used, so that results which keep *)
+(* being reused are the last to be dropped by resizePrimitiveFrameworkCache. *)
+lookupPrimitiveFrameworkResolverCache[myKey_]:=Module[{cachedResult},
+  cachedResult=Lookup[$PrimitiveFrameworkResolverOutputCache, Key[myKey]];
+  KeyDropFrom[$PrimitiveFrameworkResolverOutputCache, Key[myKey]];
+  AppendTo[$PrimitiveFrameworkResolverOutputCache, myKey->cachedResult];
+  cachedResult
+];
+
 (* NOTE: We keep the input pattern here extremely vague because we want to give the user informative messages if their *)
 (* input doesn't match the primitive set pattern. *)
 (* NOTE: We use the exact same logic for all Experiment, ExperimentSamplePreparation, ExperimentRoboticSamplePreparation, etc. so we use this *)
@@ -488,8 +509,8 @@ myFunction[myPrimitives_List, myOptions:OptionsPattern[]]:=Block[{$ProgressPrint
     ]
   ];
 
-  (* Resize our cache, if necessary. *)
-  resizePrimitiveFrameworkCache[];
+  (* Resize our cache, if necessary, making sure to keep enough room for the results of every unit operation in this call. *)
+  resizePrimitiveFrameworkCache[Count[myPrimitives, _Symbol[_Association], Infinity]];
 
   (* If we are working on building UO as children of another UO, empty the LabelField cache *)
   If[unitOperationPacketsQ,
@@ -4136,7 +4157,7 @@ myFunction[myPrimitives_List, myOptions:OptionsPattern[]]:=Block[{$ProgressPrint
 
                         If[KeyExistsQ[$PrimitiveFrameworkResolverOutputCache, {resolverFunction, inputsFromPrimitiveOptions, KeyDrop[fullResolverOptions, {Cache, Simulation}], simulationHash}],
                           usedResolverCacheQ=True;
-                          {options,simulation,tests,result,myMessageList,Constellation`Private`$UniqueLabelLookup}=Lookup[$PrimitiveFrameworkResolverOutputCache, Key[{resolverFunction, inputsFromPrimitiveOptions, KeyDrop[fullResolverOptions, {Cache, Simulation}], simulationHash}]],
+                          {options,simulation,tests,result,myMessageList,Constellation`Private`$UniqueLabelLookup}=lookupPrimitiveFrameworkResolverCache[{resolverFunction, inputsFromPrimitiveOptions, KeyDrop[fullResolverOptions, {Cache, Simulation}], simulationHash}],
                           {options,simulation,tests,result}=resolverFunction[
                             Sequence@@inputsFromPrimitiveOptions,
                             fullResolverOptions
@@ -4181,7 +4202,7 @@ myFunction[myPrimitives_List, myOptions:OptionsPattern[]]:=Block[{$ProgressPrint
 
                         If[KeyExistsQ[$PrimitiveFrameworkResolverOutputCache, {resolverFunction, inputsFromPrimitiveOptions, KeyDrop[fullResolverOptions, {Cache, Simulation}], simulationHash}],
                           usedResolverCacheQ=True;
-                          {options,simulation,result,myMessageList,Constellation`Private`$UniqueLabelLookup}=Lookup[$PrimitiveFrameworkResolverOutputCache, Key[{resolverFunction, inputsFromPrimitiveOptions, KeyDrop[fullResolverOptions, {Cache, Simulation}], simulationHash}]],
+                          {options,simulation,result,myMessageList,Constellation`Private`$UniqueLabelLookup}=lookupPrimitiveFrameworkResolverCache[{resolverFunction, inputsFromPrimitiveOptions, KeyDrop[fullResolverOptions, {Cache, Simulation}], simulationHash}],
                           {options,simulation,result}=resolverFunction[
                             Sequence@@inputsFromPrimitiveOptions,
                             fullResolverOptions
@@ -4263,7 +4284,7 @@ myFunction[myPrimitives_List, myOptions:OptionsPattern[]]:=Block[{$ProgressPrint
 
                         If[KeyExistsQ[$PrimitiveFrameworkResolverOutputCache, {resolverFunction, inputsFromPrimitiveOptions, KeyDrop[fullResolverOptions, {Cache, Simulation}], simulationHash}],
                           usedResolverCacheQ=True;
-                          {options,simulation,tests,result,timeEstimate,myMessageList,Constellation`Private`$UniqueLabelLookup}=Lookup[$PrimitiveFrameworkResolverOutputCache, Key[{resolverFunction, inputsFromPrimitiveOptions, KeyDrop[fullResolverOptions, {Cache, Simulation}], simulationHash}]],
+                          {options,simulation,tests,result,timeEstimate,myMessageList,Constellation`Private`$UniqueLabelLookup}=lookupPrimitiveFrameworkResolverCache[{resolverFunction, inputsFromPrimitiveOptions, KeyDrop[fullResolverOptions, {Cache, Simulation}], simulationHash}],
                           {options,simulation,tests,result,timeEstimate}=resolverFunction[
                             Sequence@@inputsFromPrimitiveOptions,
                             fullResolverOptions
@@ -4306,7 +4327,7 @@ myFunction[myPrimitives_List, myOptions:OptionsPattern[]]:=Block[{$ProgressPrint
 
                         If[KeyExistsQ[$PrimitiveFrameworkResolverOutputCache, {resolverFunction, inputsFromPrimitiveOptions, KeyDrop[fullResolverOptions, {Cache, Simulation}], simulationHash}],
                           usedResolverCacheQ=True;
-                          {options,simulation,result,timeEstimate,myMessageList,Constellation`Private`$UniqueLabelLookup}=Lookup[$PrimitiveFrameworkResolverOutputCache, Key[{resolverFunction, inputsFromPrimitiveOptions, KeyDrop[fullResolverOptions, {Cache, Simulation}], simulationHash}]],
+                          {options,simulation,result,timeEstimate,myMessageList,Constellation`Private`$UniqueLabelLookup}=lookupPrimitiveFrameworkResolverCache[{resolverFunction, inputsFromPrimitiveOptions, KeyDrop[fullResolverOptions, {Cache, Simulation}], simulationHash}],
                           {options,simulation,result,timeEstimate}=resolverFunction[
                             Sequence@@inputsFromPrimitiveOptions,
                             fullResolverOptions
@@ -4381,7 +4402,7 @@ myFunction[myPrimitives_List, myOptions:OptionsPattern[]]:=Block[{$ProgressPrint
 
                         If[KeyExistsQ[$PrimitiveFrameworkResolverOutputCache, {resolverFunction, inputsFromPrimitiveOptions, KeyDrop[fullResolverOptions, {Cache, Simulation}], simulationHash}],
                           usedResolverCacheQ=True;
-                          {options,simulation,tests,timeEstimate,myMessageList,Constellation`Private`$UniqueLabelLookup}=Lookup[$PrimitiveFrameworkResolverOutputCache, Key[{resolverFunction, inputsFromPrimitiveOptions, KeyDrop[fullResolverOptions, {Cache, Simulation}], simulationHash}]],
+                          {options,simulation,tests,timeEstimate,myMessageList,Constellation`Private`$UniqueLabelLookup}=lookupPrimitiveFrameworkResolverCache[{resolverFunction, inputsFromPrimitiveOptions, KeyDrop[fullResolverOptions, {Cache, Simulation}], simulationHash}],
                           {options,simulation,tests,timeEstimate}=resolverFunction[
                             Sequence@@inputsFromPrimitiveOptions,
                             fullResolverOptions
@@ -4446,7 +4467,7 @@ myFunction[myPrimitives_List, myOptions:OptionsPattern[]]:=Block[{$ProgressPrint
 
                         If[KeyExistsQ[$PrimitiveFrameworkResolverOutputCache, {resolverFunction, inputsFromPrimitiveOptions, KeyDrop[fullResolverOptions, {Cache, Simulation}], simulationHash}],
                           usedResolverCacheQ=True;
-                          {options,simulation,timeEstimate,myMessageList,Constellation`Private`$UniqueLabelLookup}=Lookup[$PrimitiveFrameworkResolverOutputCache, Key[{resolverFunction, inputsFromPrimitiveOptions, KeyDrop[fullResolverOptions, {Cache, Simulation}], simulationHash}]],
+                          {options,simulation,timeEstimate,myMessageList,Constellation`Private`$UniqueLabelLookup}=lookupPrimitiveFrameworkResolverCache[{resolverFunction, inputsFromPrimitiveOptions, KeyDrop[fullResolverOptions, {Cache, Simulation}], simulationHash}],
                           {options,simulation,timeEstimate}=resolverFunction[
                             Sequence@@inputsFromPrimitiveOptions,
                             fullResolverOptions
@@ -424,6 +424,107 @@ UnrestrictLabeledSamples[objects:{ObjectP[{Object[Sample], Object[Container], Ob
 ];
 
 
+(* ::Subsubsection::Closed:: *)
+(*PartitionUnitOperations*)
+
+
+(* ::Code::Initialization:: *)
+Authors[PartitionUnitOperations]={"dima"};
+
+
+(* ::Code::Initialization:: *)
+DefineOptions[PartitionUnitOperations,
+	Options:>{
+		CacheOption,
+		SimulationOption
+	}
+];
+
+(* public helper to split a list of unit operations into groups that do not share any labels, samples or containers. *)
+(* the framework resolves unit operations one at a time, threading the simulation through, so a single call can't resolve them out of order. *)
+(* instead, each group returned here can be given to its own ExperimentSamplePreparation/ExperimentCellPreparation call, and those calls can run on separate kernels. *)
+PartitionUnitOperations[{}, myOptions:OptionsPattern[PartitionUnitOperations]]:={};
+PartitionUnitOperations[myUnitOperations:{_Symbol[___]..}, myOptions:OptionsPattern[PartitionUnitOperations]]:=Module[
+	{safeOptions, cache, simulation, normalizedUnitOperations, unitOperationLabels, definedLabels, labelTokens, unitOperationObjects,
+		allObjects, samples, containers, sampleContainers, containerContents, relatedObjects, unitOperationTokens, tokenPositions,
+		tokenEdges, tokenlessEdges, components},
+
+	(* get our options *)
+	safeOptions=SafeOptions[PartitionUnitOperations, ToList[myOptions]];
+	{cache, simulation}=Lookup[safeOptions, {Cache, Simulation}];
+
+	(* replace associations with lists of rules so that we can pull out the options of nested unit operations too (for example, inside of method wrappers) *)
+	normalizedUnitOperations=Normal[myUnitOperations, Association];
+
+	(* the labels that each unit operation defines, through any option ending in "Label" *)
+	unitOperationLabels=Map[
+		Function[{unitOperation},
+			Cases[
+				Flatten[Cases[unitOperation, (key_Symbol->value_)/;StringEndsQ[SymbolName[key], "Label"]:>value, Infinity]],
+				_String
+			]
+		],
+		normalizedUnitOperations
+	];
+	definedLabels=DeleteDuplicates[Flatten[unitOperationLabels]];
+
+	(* every label that a unit operation either defines or refers to *)
+	labelTokens=(Intersection[Cases[#, _String, Infinity], definedLabels]&)/@normalizedUnitOperations;
+
+	(* every object that a unit operation refers to. models don't tie unit operations together since each use gets its own sample. *)
+	unitOperationObjects=(DeleteDuplicates[Cases[Download[Cases[#, ObjectP[], Infinity], Object], Object[___]]]&)/@normalizedUnitOperations;
+	allObjects=DeleteDuplicates[Flatten[unitOperationObjects]];
+
+	(* a sample and the container it is in are the same physical thing as far as ordering is concerned, so look up both directions *)
+	samples=Cases[allObjects, ObjectP[Object[Sample]]];
+	containers=Cases[allObjects, ObjectP[Object[Container]]];
+	{sampleContainers, containerContents}=Quiet[
+		Download[
+			{samples, containers},
+			{{Container[Object]}, {Contents[[All, 2]][Object]}},
+			Cache->cache,
+			Simulation->simulation
+		],
+		{Download::FieldDoesntExist, Download::NotLinkField}
+	];
+	relatedObjects=Association[
+		MapThread[
+			(#1->Cases[Flatten[{#2}], ObjectP[]]&),
+			{Join[samples, containers], Join[sampleContainers, containerContents]}
+		]
+	];
+
+	(* the labels and objects that tie each unit operation to the others *)
+	unitOperationTokens=MapThread[
+		DeleteDuplicates[Join[#1, #2, Flatten[Lookup[relatedObjects, #2, {}]]]]&,
+		{labelTokens, unitOperationObjects}
+	];
+
+	(* connect each unit operation to the previous one that shares any of its labels or objects *)
+	tokenPositions=Merge[
+		MapIndexed[AssociationThread[#1, ConstantArray[First[#2], Length[#1]]]&, unitOperationTokens],
+		Identity
+	];
+	tokenEdges=Flatten[(UndirectedEdge@@@Partition[#, 2, 1]&)/@Values[tokenPositions]];
+
+	(* unit operations without any labels or objects (for example, Wait) are barriers: what comes after them must wait for what comes before them, *)
+	(* so join them to both of their neighbors, which puts the groups on either side of them into one group *)
+	tokenlessEdges=Flatten[Map[
+		{
+			If[#>1, UndirectedEdge[#-1, #], Nothing],
+			If[#<Length[myUnitOperations], UndirectedEdge[#, #+1], Nothing]
+		}&,
+		Flatten[Position[unitOperationTokens, {}, {1}]]
+	]];
+
+	(* each connected component is a group of unit operations that can be resolved on its own *)
+	components=ConnectedComponents[Graph[Range[Length[myUnitOperations]], Join[tokenEdges, tokenlessEdges]]];
+
+	(* return the groups in the order they first appear, keeping the original order inside of each group *)
+	(myUnitOperations[[#]]&)/@SortBy[Sort/@components, First]
+];
+
+
 (* ::Subsubsection::Closed:: *)
 (*SimulateResources*)
 
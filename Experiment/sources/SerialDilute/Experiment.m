@@ -1225,15 +1225,9 @@ calculateFromConcentrate[varName_Symbol, ConcentrationFactor_Integer,
 	];
 
 (*Function that multiplies each successive element of a given list*)
-accMultFunction[numberList_] := Module[{intermediateList,numbersToMultiplyBy},
-	numbersToMultiplyBy = Map[
-		(* for every instance, take the product of all the entries of numberList up to this point *)
-		Times @@ numberList[[;; (# - 1)]]&,
-		(* this gives me  a list starting at 1 of whatever length we need *)
-		Range[Length[numberList]]
-	];
-	intermediateList = numbersToMultiplyBy * numberList
-];
+(* i.e. the running product of the list, computed in one pass rather than taking the product of every prefix *)
+accMultFunction[{}] := {};
+accMultFunction[numberList_List] := FoldList[Times, numberList];
 
 (*helper function that takes in a list of volumes, a running total, a maximum volume,
 and a running list of lists of groupings of volumes where the volumes are grouped together
@@ -1241,31 +1235,28 @@ if they can add up to the max but not over*)
 (*function preserves order of volumes in listNums*)
 (*Used to sort volumes when determining how many 200mL waste containers we need*)
 (*similar to GroupByTotal in Core.m*)
+(*walks the volumes once, marking where a new group has to start, instead of recursing with Append for every volume,
+which was quadratic and hit the recursion limit for large batches*)
 groupByEdited[listNums : {VolumeP ...}, total_, max_, groupings_] :=
-	Which[
-		(*Base case*)
-		Length[listNums] == 0, groupings,
-
-		(*If the next volume will make you go over the max*)
-		listNums[[1]] + total >= max,
-		Module[{firstElem,
-			nextGroupings},
-			firstElem = listNums[[1]];
-			nextGroupings = Append[groupings, {firstElem}];
-			groupByEdited[Rest[listNums], firstElem, max, nextGroupings]
-		],
+	Module[{runningTotal, newGroupStarts, groupLengths, newGroupings},
+		runningTotal = total;
+
+		(*a volume starts a new group if it would make the running total go over the max*)
+		newGroupStarts = Map[
+			Function[volume,
+				If[volume + runningTotal >= max,
+					runningTotal = volume; True,
+					runningTotal = volume + runningTotal; False
+				]
+			],
+			listNums
+		];
 
-		(*If the next volume will not make you go over the max*)
-		listNums[[1]] + total < max,
-		Module[{firstElem, updatedLastListInGroupings, droppedGroupings,
-			nextGroupings},
-			firstElem = listNums[[1]];
-			updatedLastListInGroupings = Join[groupings[[-1]], {firstElem}];
-			droppedGroupings = Drop[groupings, -1];
-			nextGroupings =
-				Append[droppedGroupings, updatedLastListInGroupings];
-			groupByEdited[Rest[listNums], firstElem + total, max, nextGroupings]
-		]
+		(*split the volumes at those positions; the first run (possibly empty) extends the last of the given groupings*)
+		groupLengths = Differences[Join[{1}, Flatten[Position[newGroupStarts, True]], {Length[listNums] + 1}]];
+		newGroupings = TakeList[listNums, groupLengths];
+
+		Join[Most[groupings], {Join[Last[groupings], First[newGroupings]]}, Rest[newGroupings]]
 	];
 
 Error::NoSerialDiluteFactors = "No SerialDilutionFactors or TargetConcentrations have been given, or they cannot be calculated with the given information for samples `1`.";
@@ -1297,7 +1288,8 @@ resolveExperimentSerialDiluteOptions[mySamples:{ObjectP[Object[Sample]]...},myOp
 		serialDiluteOptionsAssociation,invalidInputs,invalidOptions,targetContainers,
 		discardedSamplePackets,discardedInvalidInputs,discardedTest,roundedSerialDiluteOptions,precisionTests,
 		samplePackets,mapThreadFriendlyOptions,mwPackets,resolvedPostProcessingOptions,resolvedOptions,allTests,
-		samplePrepOptionsWithMasterSwitches,samplePrepOptionsAssociation,concentratedBufferPacket,
+		samplePrepOptionsWithMasterSwitches,samplePrepOptionsAssociation,concentratedBufferPacket,cachePacketLookup,fetchCachedPacket,
+		mwPacketLookup,
 
 		(*MapThread Options*)
 		containerOut,destinationWells,
@@ -1427,10 +1419,22 @@ resolveExperimentSerialDiluteOptions[mySamples:{ObjectP[Object[Sample]]...},myOp
 	(* Remember to download from simulatedSamples, using our simulatedCache *)
 	(* Quiet[Download[...],Download::FieldDoesntExist] *)
 
-	samplePackets=fetchPacketFromCache[#,cache]&/@mySamples;
+	(* Note: fetchPacketFromCache scans the whole cache for every object, which is quadratic in the number of samples, so look up *)
+	(* the first packet of each object by key instead and only fall back to fetchPacketFromCache for anything else (names, Null, etc.) *)
+	cachePacketLookup = GroupBy[cache,Lookup[#,Object]&,First];
+	fetchCachedPacket = Function[object,
+		If[MatchQ[object,ObjectReferenceP[]],
+			Replace[Lookup[cachePacketLookup,Key[object]],_Missing:>fetchPacketFromCache[object,cache]],
+			fetchPacketFromCache[object,cache]
+		]
+	];
+
+	samplePackets=fetchCachedPacket/@mySamples;
 	mwPackets = Select[cache,KeyExistsQ[#,MolecularWeight]&];
+	(* group the molecular weight packets by object so that each sample does not have to Select through all of them *)
+	mwPacketLookup = GroupBy[mwPackets,Lookup[#,Object]&];
 
-	concentratedBufferPacket = fetchPacketFromCache[#,cache]&/@concentratedBufferOption;
+	concentratedBufferPacket = fetchCachedPacket/@concentratedBufferOption;
 	(*temporary fix for null concentratedBufferPacket, this wasn't an issue before though?*)
 	(*concentratedBufferPacket = If[NullQ[concentratedBufferPacket],Table[{},Length[mySamples]]];*)
 
@@ -1481,7 +1485,7 @@ resolveExperimentSerialDiluteOptions[mySamples:{ObjectP[Object[Sample]]...},myOp
 	(*-- RESOLVE EXPERIMENT OPTIONS --*)
 	(* Convert our options into a MapThread friendly version. *)
 	mapThreadFriendlyOptions = OptionsHandling`Private`mapThreadOptions[ExperimentSerialDilute,roundedSerialDiluteOptions];
-	objectToNewResolvedLabelLookup = {};
+	objectToNewResolvedLabelLookup = <||>;
 
 	(* Check if sample is Sterile, contains cells, or require AsepticHandling *)
 	(* Note:ExperimentSerialDilute does not have SterileTechnique or Sterile option yet, so we do not need to check *)
@@ -1594,7 +1598,7 @@ resolveExperimentSerialDiluteOptions[mySamples:{ObjectP[Object[Sample]]...},myOp
 							Module[{molecularWeightPacket,mw,density, totalVolume, composition,
 								percentOrConcentration,volumePercent,massPercent,concentration, finalConcentration,
 								restSerialDilutionFactors,compositionPre},
-								molecularWeightPacket = First[Select[mwPackets,Lookup[#,Object]==analyte&]];
+								molecularWeightPacket = First[Lookup[mwPacketLookup,Key[analyte],{}]];
 								mw = molecularWeightPacket[MolecularWeight];
 
 								density = molecularWeightPacket[Density];
@@ -1672,7 +1676,7 @@ resolveExperimentSerialDiluteOptions[mySamples:{ObjectP[Object[Sample]]...},myOp
 						(* If analyte == Null then we just want to return Null for Error catching *)
 						molecularWeightPacket = If[MatchQ[analyte, Null],
 							Null,
-							First[Select[mwPackets,Lookup[#,Object]==analyte&]]
+							First[Lookup[mwPacketLookup,Key[analyte],{}]]
 						];
 						dividers = accMultFunction[serialDilutionFactors];
 
@@ -2052,7 +2056,7 @@ resolveExperimentSerialDiluteOptions[mySamples:{ObjectP[Object[Sample]]...},myOp
 					Module[{newLabel},
 						newLabel=CreateUniqueLabel["serial dilute source sample"];
 
-						AppendTo[objectToNewResolvedLabelLookup, mySample->newLabel];
+						objectToNewResolvedLabelLookup[mySample]=newLabel;
 
 						newLabel
 					]
@@ -2073,7 +2077,7 @@ resolveExperimentSerialDiluteOptions[mySamples:{ObjectP[Object[Sample]]...},myOp
 					Module[{newLabel},
 						newLabel=CreateUniqueLabel["serial dilute source sample container"];
 
-						AppendTo[objectToNewResolvedLabelLookup, sampleContainer->newLabel];
+						objectToNewResolvedLabelLookup[sampleContainer]=newLabel;
 
 						newLabel
 					]
@@ -2096,7 +2100,7 @@ resolveExperimentSerialDiluteOptions[mySamples:{ObjectP[Object[Sample]]...},myOp
 					Module[{newLabel},
 						newLabel=CreateUniqueLabel["serial dilute diluent"];
 
-						AppendTo[objectToNewResolvedLabelLookup, diluentObj->newLabel];
+						objectToNewResolvedLabelLookup[diluentObj]=newLabel;
 
 						newLabel
 					]
@@ -2119,7 +2123,7 @@ resolveExperimentSerialDiluteOptions[mySamples:{ObjectP[Object[Sample]]...},myOp
 					Module[{newLabel},
 						newLabel=CreateUniqueLabel["serial dilute concentrated buffer"];
 
-						AppendTo[objectToNewResolvedLabelLookup, concetratedBufferObj->newLabel];
+						objectToNewResolvedLabelLookup[concetratedBufferObj]=newLabel;
 
 						newLabel
 					]
@@ -2142,7 +2146,7 @@ resolveExperimentSerialDiluteOptions[mySamples:{ObjectP[Object[Sample]]...},myOp
 					Module[{newLabel},
 						newLabel=CreateUniqueLabel["serial dilute buffer diluent"];
 
-						AppendTo[objectToNewResolvedLabelLookup, bufferDiluentObj->newLabel];
+						objectToNewResolvedLabelLookup[bufferDiluentObj]=newLabel;
 
 						newLabel
 					]
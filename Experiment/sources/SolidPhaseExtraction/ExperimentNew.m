@@ -13966,15 +13966,18 @@ ExperimentSolidPhaseExtractionOptions[myPooledSamples : ListableP[ListableP[Alte
 (*ValidExperimentSolidPhaseExtractionQ*)
 
 
-DefineOptions[ValidExperimentSolidPhaseExtractionQ, Options :> {VerboseOption, OutputFormatOption}, SharedOptions :> {ExperimentSolidPhaseExtraction}];
+DefineOptions[ValidExperimentSolidPhaseExtractionQ, Options :> {VerboseOption, OutputFormatOption, FailFastOption}, SharedOptions :> {ExperimentSolidPhaseExtraction}];
 ValidExperimentSolidPhaseExtractionQ[myPooledSamples : ListableP[ListableP[Alternatives[ObjectP[Object[Sample]], ObjectP[Object[Container]], _String]]], myOptions : OptionsPattern[]] := Module[
-	{listedOptions, preparedOptions, experimentSolidPhaseExtractionTests, initialTestDescription, allTests, verbose, outputFormat},
+	{listedOptions, preparedOptions, experimentSolidPhaseExtractionTests, initialTestDescription, allTests, verbose, outputFormat, failFast},
 
 	(* get the options as a list *)
 	listedOptions = ToList[myOptions];
 
+	(* determine the Verbose, OutputFormat and FailFast options; quiet the OptionValue::nodef message in case someone just passed nonsense *)
+	{verbose, outputFormat, failFast} = Quiet[OptionDefault[OptionValue[{Verbose, OutputFormat, FailFast}]], OptionValue::nodef];
+
 	(* remove the Output option before passing to the core function because it doesn't make sense here *)
-	preparedOptions = DeleteCases[listedOptions, (Output | Verbose | OutputFormat) -> _];
+	preparedOptions = DeleteCases[listedOptions, (Output | Verbose | OutputFormat | FailFast) -> _];
 
 	(* return only the tests for ExperimentSolidPhaseExtraction *)
 	experimentSolidPhaseExtractionTests = ExperimentSolidPhaseExtraction[myPooledSamples, Append[preparedOptions, Output -> Tests]];
@@ -13991,22 +13994,26 @@ ValidExperimentSolidPhaseExtractionQ[myPooledSamples : ListableP[ListableP[Alter
 			(* generate the initial test, which we know will pass if we got this far (?) *)
 			initialTest = Test[initialTestDescription, True, True];
 
-			(* create warnings for invalid objects *)
-			validObjectBooleans = ValidObjectQ[Flatten[DeleteCases[ToList[myPooledSamples], _String]], OutputFormat -> Boolean];
-			voqWarnings = MapThread[
-				Warning[StringJoin[ToString[#1, InputForm], " is valid (run ValidObjectQ for more detailed information):"],
-					#2,
-					True
-				]&,
-				{Flatten[DeleteCases[ToList[myPooledSamples], _String]], validObjectBooleans}
-			];
+			(* if we're failing fast, RunUnitTest stops at the first test that fails, and we only check the inputs with ValidObjectQ if it gets that far *)
+			If[TrueQ[failFast],
+				Flatten[{initialTest, failFastTests[experimentSolidPhaseExtractionTests], failFastValidObjectQWarnings[Flatten[DeleteCases[ToList[myPooledSamples], _String]]]}],
+				(
+					(* create warnings for invalid objects *)
+					validObjectBooleans = ValidObjectQ[Flatten[DeleteCases[ToList[myPooledSamples], _String]], OutputFormat -> Boolean];
+					voqWarnings = MapThread[
+						Warning[StringJoin[ToString[#1, InputForm], " is valid (run ValidObjectQ for more detailed information):"],
+							#2,
+							True
+						]&,
+						{Flatten[DeleteCases[ToList[myPooledSamples], _String]], validObjectBooleans}
+					];
 
-			(* get all the tests/warnings *)
-			Flatten[{initialTest, experimentSolidPhaseExtractionTests, voqWarnings}]
+					(* get all the tests/warnings *)
+					Flatten[{initialTest, experimentSolidPhaseExtractionTests, voqWarnings}]
+				)
+			]
 		]
 	];
-	(* determine the Verbose and OutputFormat options; quiet the OptionValue::nodef message in case someone just passed nonsense *)
-	{verbose, outputFormat} = Quiet[OptionDefault[OptionValue[{Verbose, OutputFormat}]], OptionValue::nodef];
 
 	(* run all the tests as requested *)
 	Lookup[RunUnitTest[<|"ValidExperimentSolidPhaseExtractionQ" -> allTests|>, OutputFormat -> outputFormat, Verbose -> verbose], "ValidExperimentSolidPhaseExtractionQ"]
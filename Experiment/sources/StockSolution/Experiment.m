@@ -3151,7 +3151,15 @@ experimentStockSolutionFormula[
 	resultRule = Result -> Which[
 		MatchQ[newModelChangePacketsOrExistingModels, $Failed], $Failed,
 		MemberQ[listedOutput, Result] && validQ && MatchQ[extraPackets, {}], UploadProtocol[updatedProtocolPacket, uploadProtocolOptions],
-		MemberQ[listedOutput, Result] && validQ, UploadProtocol[updatedProtocolPacket, extraPackets, uploadProtocolOptions],
+		MemberQ[listedOutput, Result] && validQ, Module[{protocol},
+			protocol = UploadProtocol[updatedProtocolPacket, extraPackets, uploadProtocolOptions];
+
+			(* the new stock solution models are uploaded with the protocol; let UploadStockSolution's formula lookup find them without searching again *)
+			If[MatchQ[protocol, ObjectReferenceP[]],
+				addStockSolutionFormulaModels[extraPackets]
+			];
+			protocol
+		],
 		True, $Failed
 	];
 
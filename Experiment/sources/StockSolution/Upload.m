@@ -4314,7 +4314,7 @@ newStockSolution[
 		alternativePreparationPackets, uploadReadyFormula, fieldRule, checkFieldsList, newStockSolutionPacket, existingMatchingModel,
 		modelTemplateInputObject, mismatchFields, resolvedSterile, resolvedAsepticHandling, upload, resolvedOptionsNoAmbient,
 		state, gatherTests, fastTrack, sameFormulaComponentDownloadValues, sameFormulaComponentModelPacketsWithObjects,
-		sameFormulaComponentComponentModelPackets, massFormulas, componentMassAmounts
+		sameFormulaComponentComponentModelPackets, massFormulas, componentMassAmounts, formulaLookupKey
 	},
 
 	(* pull out the Upload option *)
@@ -4393,6 +4393,9 @@ newStockSolution[
 		the Length part of the query is particular narsty and likes to evaluate; with it in;
 		TODO can this be done in one Search? the length query doesn't play nice with mapthread *)
 
+	(* outside of the unit test searches, search for the formula by its normalized key *)
+	formulaLookupKey=stockSolutionFormulaKey[newModelType,components,mySolvent,myAuthorNotebooks];
+
 	sameFormulaComponentModels=Which[
 		MatchQ[$StockSolutionUnitTestSearchName, _String] && MatchQ[$StockSolutionUnitTestFilterOutNewlyCreatedObjects, True],
 			Block[{$RequiredSearchName=$StockSolutionUnitTestSearchName},
@@ -4429,15 +4432,7 @@ newStockSolution[
 				Search[ConstantArray[newModelType,Length[altPrepSearchConditions]],Evaluate@altPrepSearchConditions]
 			],
 		True,
-			Intersection@@Join[
-				{
-					With[
-						{formulaLength=Length[myFormulaSpec]},
-						Search[newModelType,Length[Formula]==formulaLength&&Deprecated!=True]
-					]
-				},
-				Search[ConstantArray[newModelType,Length[altPrepSearchConditions]],Evaluate@altPrepSearchConditions]
-			]
+			stockSolutionFormulaLookup[formulaLookupKey]
 	];
 
 	(* need to actually download from these search results to see if they are indeed the same RATIO in addition to having the same exact components;
@@ -5042,13 +5037,111 @@ newStockSolution[
 	If[MatchQ[existingMatchingModel,ObjectReferenceP[]],
 		existingMatchingModel,
 		If[Lookup[resolvedOptionsNoAmbient,Upload],
-			Upload[newStockSolutionPacket],
+			Module[{newModel},
+				newModel=Upload[newStockSolutionPacket];
+				addStockSolutionFormulaModels[{newStockSolutionPacket}];
+				newModel
+			],
 			newStockSolutionPacket
 		]
 	]
 ];
 
 
+(* ::Subsubsection::Closed:: *)
+(*stockSolutionFormulaLookup*)
+
+
+(* the normalized key of a formula for stockSolutionFormulaLookup: the model type, the component models in a canonical order, the solvent (or Null)
+ 	and the notebooks the models may come from; the amounts are left out since the ratios are compared against the candidate packets downloaded by newStockSolution *)
+stockSolutionFormulaKey[
+	myType:TypeP[],
+	myComponents:{ObjectReferenceP[]..},
+	mySolvent:(ObjectP[Model[Sample]]|Null),
+	myNotebooks:{ObjectReferenceP[Object[LaboratoryNotebook]]...}
+]:={
+	myType,
+	Sort[myComponents],
+	If[MatchQ[mySolvent,ObjectP[]],Download[mySolvent,Object],Null],
+	Sort[myNotebooks]
+};
+
+
+(* the non-deprecated models of the given type with exactly the components and solvent of the key, from the key's notebooks or public;
+ 	memoized once any model has been found, so that a formula that is submitted again is a lookup rather than a search of the whole database;
+	a formula without any model yet is not memoized and so is searched for again on its next call, and addStockSolutionFormulaModels adds
+	the models uploaded later in the session to the formulas that are memoized already *)
+stockSolutionFormulaLookup[myKey:{myType_,myComponents_List,mySolvent_,myNotebooks_List}]:=Module[
+	{searchConditions, models},
+
+	(* Search doesn't let us ask for a Formula with model A AND model B in one condition, so search per component and intersect *)
+	searchConditions=And[
+		Field[Formula[[2]]]==#,
+		FillToVolumeSolvent==mySolvent,
+		If[MatchQ[myNotebooks,{}],
+			Notebook==Null,
+			Or[
+				Notebook==Alternatives@@myNotebooks,
+				Notebook==Null
+			]
+		],
+		Deprecated!=True
+	]&/@myComponents;
+
+	models=Intersection@@Join[
+		{
+			With[
+				{formulaLength=Length[myComponents]},
+				Search[myType,Length[Formula]==formulaLength&&Deprecated!=True]
+			]
+		},
+		Search[ConstantArray[myType,Length[searchConditions]],Evaluate@searchConditions]
+	];
+
+	If[Length[models]>0,
+		If[!MemberQ[$Memoization,Experiment`Private`stockSolutionFormulaLookup],
+			AppendTo[$Memoization,Experiment`Private`stockSolutionFormulaLookup]
+		];
+		stockSolutionFormulaLookup[myKey]=models
+	];
+
+	models
+];
+
+
+(* adds newly uploaded stock solution models to the formulas stockSolutionFormulaLookup has memoized for them, so that the next call for the formula
+ 	returns them without searching again; formulas that aren't memoized yet will find them with their own Search *)
+addStockSolutionFormulaModels[myPackets:{___Association}]:=Module[
+	{newModelPackets, notebook},
+
+	(* only models with a formula are found by stockSolutionFormulaLookup *)
+	newModelPackets=Cases[myPackets,KeyValuePattern[{Object->ObjectReferenceP[Model[Sample]],Replace[Formula]->{{_,_}..}}]];
+
+	(* new objects are uploaded to the current notebook, or are public if there is none *)
+	notebook=If[MatchQ[$Notebook,ObjectP[]],Download[$Notebook,Object],Null];
+
+	Map[
+		Function[newModelPacket,
+			With[
+				{
+					type=Lookup[newModelPacket,Type,Most[Lookup[newModelPacket,Object]]],
+					components=Sort[Download[Lookup[newModelPacket,Replace[Formula]][[All,2]],Object]],
+					solvent=If[MatchQ[Lookup[newModelPacket,FillToVolumeSolvent,Null],ObjectP[]],Download[Lookup[newModelPacket,FillToVolumeSolvent],Object],Null]
+				},
+				Map[
+					(stockSolutionFormulaLookup[#]=DeleteDuplicates[Append[stockSolutionFormulaLookup[#],Lookup[newModelPacket,Object]]])&,
+					Cases[
+						DownValues[stockSolutionFormulaLookup][[All,1]],
+						Verbatim[HoldPattern][HoldPattern[stockSolutionFormulaLookup[key:{type,components,solvent,notebooks_List}]]]/;(NullQ[notebook]||MemberQ[notebooks,notebook]):>key
+					]
+				]
+			]
+		],
+		newModelPackets
+	]
+];
+
+
 (*
 	PACKET CREATOR - unitOperations overload
 		- relies on unitOps and resolved options
@@ -520,6 +520,121 @@ DefineTests[
 			SourcePlateCentric,
 			Variables:>{options}
 		],
+		Example[{Additional,"The instrument time saved by rearranging the manipulations to reduce plate changes is stored in the protocol:"},
+			protocol=ExperimentAcousticLiquidHandling[
+				{
+					Object[Sample,"AcousticLiquidHandling Test Water Sample 1"<>$SessionUUID],
+					Object[Sample,"AcousticLiquidHandling Test Water Sample 1"<>$SessionUUID],
+					Object[Sample,"AcousticLiquidHandling Test Water Sample 1"<>$SessionUUID],
+					Object[Sample,"AcousticLiquidHandling Test Water Sample 1"<>$SessionUUID]
+				},
+				{
+					{"A1", {1,Model[Container,Plate,"96-well Polypropylene Flat-Bottom Plate, Black"]}},
+					{"A1", {2,Model[Container,Plate,"96-well Polypropylene Flat-Bottom Plate, Black"]}},
+					{"A2", {1,Model[Container,Plate,"96-well Polypropylene Flat-Bottom Plate, Black"]}},
+					{"A2", {2,Model[Container,Plate,"96-well Polypropylene Flat-Bottom Plate, Black"]}}
+				},
+				{100 Nanoliter,100 Nanoliter,100 Nanoliter,100 Nanoliter},
+				OptimizePrimitives->DestinationPlateCentric
+			];
+			Download[protocol,EstimatedTimeSavings],
+			EqualP[2 Minute],
+			Variables:>{protocol}
+		],
+		Test["The protocol's EstimatedTimeSavings is 0 Minute if the sequence of the manipulations is preserved:",
+			protocol=ExperimentAcousticLiquidHandling[
+				{
+					Object[Sample,"AcousticLiquidHandling Test Water Sample 1"<>$SessionUUID],
+					Object[Sample,"AcousticLiquidHandling Test Water Sample 1"<>$SessionUUID],
+					Object[Sample,"AcousticLiquidHandling Test Water Sample 1"<>$SessionUUID],
+					Object[Sample,"AcousticLiquidHandling Test Water Sample 1"<>$SessionUUID]
+				},
+				{
+					{"A1", {1,Model[Container,Plate,"96-well Polypropylene Flat-Bottom Plate, Black"]}},
+					{"A1", {2,Model[Container,Plate,"96-well Polypropylene Flat-Bottom Plate, Black"]}},
+					{"A2", {1,Model[Container,Plate,"96-well Polypropylene Flat-Bottom Plate, Black"]}},
+					{"A2", {2,Model[Container,Plate,"96-well Polypropylene Flat-Bottom Plate, Black"]}}
+				},
+				{100 Nanoliter,100 Nanoliter,100 Nanoliter,100 Nanoliter},
+				OptimizePrimitives->PreserveTransferOrder
+			];
+			Download[protocol,EstimatedTimeSavings],
+			EqualP[0 Minute],
+			Variables:>{protocol}
+		],
+		Test["Transfers between the same pair of plates are ordered by source well when the sequence is optimized:",
+			Experiment`Private`acousticLHTransferOrder[
+				{
+					{Object[Container,Plate,"Source plate"],Object[Container,Plate,"Destination plate"]},
+					{Object[Container,Plate,"Source plate"],Object[Container,Plate,"Destination plate"]}
+				},
+				{{"A2","A1"},{"A1","A2"}},
+				{{Object[Container,Plate,"Source plate"],Object[Container,Plate,"Destination plate"]}},
+				SourcePlateCentric
+			],
+			{2,1}
+		],
+		Test["A transfer is never moved ahead of an earlier transfer into its source well:",
+			Experiment`Private`acousticLHTransferOrder[
+				{
+					{Object[Container,Plate,"Plate 1"],Object[Container,Plate,"Plate 2"]},
+					{Object[Container,Plate,"Plate 2"],Object[Container,Plate,"Plate 3"]}
+				},
+				{{"A1","B1"},{"B1","A1"}},
+				{
+					{Object[Container,Plate,"Plate 2"],Object[Container,Plate,"Plate 3"]},
+					{Object[Container,Plate,"Plate 1"],Object[Container,Plate,"Plate 2"]}
+				},
+				SourcePlateCentric
+			],
+			{1,2}
+		],
+		Test["A transfer is never moved ahead of an earlier transfer out of its destination well:",
+			Experiment`Private`acousticLHTransferOrder[
+				{
+					{Object[Container,Plate,"Plate 1"],Object[Container,Plate,"Plate 2"]},
+					{Object[Container,Plate,"Plate 3"],Object[Container,Plate,"Plate 1"]}
+				},
+				{{"A1","A1"},{"A1","A1"}},
+				{
+					{Object[Container,Plate,"Plate 3"],Object[Container,Plate,"Plate 1"]},
+					{Object[Container,Plate,"Plate 1"],Object[Container,Plate,"Plate 2"]}
+				},
+				SourcePlateCentric
+			],
+			{1,2}
+		],
+		Test["Independent transfers still follow the optimized sequence around a dependent one:",
+			Experiment`Private`acousticLHTransferOrder[
+				{
+					{Object[Container,Plate,"Plate 1"],Object[Container,Plate,"Plate 2"]},
+					{Object[Container,Plate,"Plate 2"],Object[Container,Plate,"Plate 3"]},
+					{Object[Container,Plate,"Plate 2"],Object[Container,Plate,"Plate 3"]}
+				},
+				{{"A1","B1"},{"B1","A1"},{"C1","C1"}},
+				{
+					{Object[Container,Plate,"Plate 2"],Object[Container,Plate,"Plate 3"]},
+					{Object[Container,Plate,"Plate 1"],Object[Container,Plate,"Plate 2"]}
+				},
+				SourcePlateCentric
+			],
+			{3,1,2}
+		],
+		Test["Held transfers are released as soon as their prerequisites are executed when many transfers go through an intermediate plate:",
+			Experiment`Private`acousticLHTransferOrder[
+				Join[
+					ConstantArray[{Object[Container,Plate,"Plate 1"],Object[Container,Plate,"Plate 2"]},384],
+					ConstantArray[{Object[Container,Plate,"Plate 2"],Object[Container,Plate,"Plate 3"]},384]
+				],
+				Join[#,#]&[Transpose[{#,#}]&[Flatten[Table[row<>ToString[column],{row,CharacterRange["A","P"]},{column,24}]]]],
+				{
+					{Object[Container,Plate,"Plate 2"],Object[Container,Plate,"Plate 3"]},
+					{Object[Container,Plate,"Plate 1"],Object[Container,Plate,"Plate 2"]}
+				},
+				SourcePlateCentric
+			],
+			Riffle[Range[384],Range[385,768]]
+		],
 		Example[{Options,FluidAnalysisMeasurement,"Specify the measurement type used to determine the fluid properties of the source samples:"},
 			options=ExperimentAcousticLiquidHandling[
 				{
@@ -770,6 +770,13 @@ DefineTests[ExperimentAliquot,
 			],
 			{"A1", "A2"}
 		],
+		Example[{Options, DestinationWellOrder, "Use the DestinationWellOrder option to fill the open positions of the specified container column by column, in order from A1 to H1 and then A2:"},
+			Lookup[
+				ExperimentAliquot[{Object[Sample, "ExperimentAliquot New Test Chemical 1 (1.5 mL)"<>$SessionUUID], Object[Sample, "ExperimentAliquot New Test Chemical 1 (1.8 mL)"<>$SessionUUID]}, {200 Microliter, 200 Microliter}, ContainerOut -> Model[Container, Plate, "96-well 2mL Deep Well Plate"], DestinationWellOrder -> Column, Output -> Options],
+				DestinationWell
+			],
+			{"A1", "B1"}
+		],
 		Example[{Options, TargetConcentration, "Prepare a diluted aliquot of a source sample by indicating the desired final concentration:"},
 			options = ExperimentAliquot[Object[Sample, "ExperimentAliquot New Test Chemical 1 (1.5 mL, 5 mL)"<>$SessionUUID], TargetConcentration -> 50 Micromolar, Output -> Options];
 			Lookup[options, TargetConcentration],
@@ -5608,6 +5608,242 @@ DefineTests[sanitizeInputs,
 ];
 
 
+(* ::Subsection::Closed:: *)
+(*cachedResolverCall*)
+
+DefineTests[cachedResolverCall,
+	{
+		Example[{Basic, "Returns the previous result of an experiment's resolver instead of resolving again if neither the inputs nor the options have changed:"},
+			Block[{$ExperimentResolverCache = <||>},
+				Module[{firstOptions, firstCacheLength, secondOptions},
+					firstOptions = ExperimentIncubate[Object[Sample, "cachedResolverCall test water sample " <> $SessionUUID], Time -> 5 Minute, Output -> Options];
+					firstCacheLength = Length[$ExperimentResolverCache];
+					secondOptions = ExperimentIncubate[Object[Sample, "cachedResolverCall test water sample " <> $SessionUUID], Time -> 5 Minute, Output -> Options];
+					{SameQ[firstOptions, secondOptions], firstCacheLength, Length[$ExperimentResolverCache]}
+				]
+			],
+			{True, 1, 1}
+		],
+		Example[{Basic, "Validating a call and then submitting it only resolves its options once:"},
+			Block[{$ExperimentResolverCache = <||>},
+				Module[{resolverCalls = 0},
+					Internal`InheritedBlock[{resolveExperimentIncubateNewOptions},
+						(* Count the calls to the resolver without changing what it returns. *)
+						DownValues[resolveExperimentIncubateNewOptions] = Prepend[
+							DownValues[resolveExperimentIncubateNewOptions],
+							HoldPattern[resolveExperimentIncubateNewOptions[___]] :> Null /; (resolverCalls++; False)
+						];
+						ExperimentIncubate[Object[Sample, "cachedResolverCall test water sample " <> $SessionUUID], Time -> 5 Minute, Upload -> False, Output -> Tests];
+						ExperimentIncubate[Object[Sample, "cachedResolverCall test water sample " <> $SessionUUID], Time -> 5 Minute, Upload -> False, Output -> Result]
+					];
+					resolverCalls
+				]
+			],
+			1
+		],
+		Example[{Basic, "Resolves again if the options have changed:"},
+			Block[{$ExperimentResolverCache = <||>},
+				ExperimentIncubate[Object[Sample, "cachedResolverCall test water sample " <> $SessionUUID], Time -> 5 Minute, Output -> Options];
+				ExperimentIncubate[Object[Sample, "cachedResolverCall test water sample " <> $SessionUUID], Time -> 10 Minute, Output -> Options];
+				Length[$ExperimentResolverCache]
+			],
+			2
+		],
+		Example[{Basic, "Resolves again if an input has been uploaded to since:"},
+			Block[{$ExperimentResolverCache = <||>},
+				Module[{resolverCalls = 0},
+					Internal`InheritedBlock[{resolveExperimentIncubateNewOptions},
+						(* Count the calls to the resolver without changing what it returns. *)
+						DownValues[resolveExperimentIncubateNewOptions] = Prepend[
+							DownValues[resolveExperimentIncubateNewOptions],
+							HoldPattern[resolveExperimentIncubateNewOptions[___]] :> Null /; (resolverCalls++; False)
+						];
+						ExperimentIncubate[Object[Sample, "cachedResolverCall test water sample " <> $SessionUUID], Time -> 5 Minute, Output -> Options];
+						Upload[<|Object -> Object[Sample, "cachedResolverCall test water sample " <> $SessionUUID], Volume -> RandomReal[{40, 50}] Milliliter|>];
+						ExperimentIncubate[Object[Sample, "cachedResolverCall test water sample " <> $SessionUUID], Time -> 5 Minute, Output -> Options]
+					];
+					resolverCalls
+				]
+			],
+			2
+		],
+		Example[{Additional, "Resolves again if the result was resolved without Tests and Tests are asked for:"},
+			Block[{$ExperimentResolverCache = <||>},
+				Module[{resolverCalls = 0},
+					Internal`InheritedBlock[{resolveExperimentIncubateNewOptions},
+						(* Count the calls to the resolver without changing what it returns. *)
+						DownValues[resolveExperimentIncubateNewOptions] = Prepend[
+							DownValues[resolveExperimentIncubateNewOptions],
+							HoldPattern[resolveExperimentIncubateNewOptions[___]] :> Null /; (resolverCalls++; False)
+						];
+						ExperimentIncubate[Object[Sample, "cachedResolverCall test water sample " <> $SessionUUID], Time -> 5 Minute, Upload -> False, Output -> Result];
+						ExperimentIncubate[Object[Sample, "cachedResolverCall test water sample " <> $SessionUUID], Time -> 5 Minute, Upload -> False, Output -> Tests]
+					];
+					resolverCalls
+				]
+			],
+			2
+		],
+		Example[{Additional, "Resolves again for a different user:"},
+			Block[{$ExperimentResolverCache = <||>},
+				ExperimentIncubate[Object[Sample, "cachedResolverCall test water sample " <> $SessionUUID], Time -> 5 Minute, Output -> Options];
+				Block[{$PersonID = Object[User, Emerald, Developer, "id:n0k9mGkqa6Gr"]},
+					ExperimentIncubate[Object[Sample, "cachedResolverCall test water sample " <> $SessionUUID], Time -> 5 Minute, Output -> Options]
+				];
+				Length[$ExperimentResolverCache]
+			],
+			2
+		]
+	},
+	SymbolSetUp :> (
+		$CreatedObjects = {};
+
+		Module[{allObjects, existingObjects, testContainer},
+			allObjects = {Object[Container, Vessel, "cachedResolverCall test 50mL tube " <> $SessionUUID], Object[Sample, "cachedResolverCall test water sample " <> $SessionUUID]};
+			existingObjects = PickList[allObjects, DatabaseMemberQ[allObjects]];
+			EraseObject[existingObjects, Force -> True, Verbose -> False];
+
+			testContainer = Upload[<|
+				Type -> Object[Container, Vessel],
+				Model -> Link[Model[Container, Vessel, "50mL Tube"], Objects],
+				Name -> "cachedResolverCall test 50mL tube " <> $SessionUUID,
+				DeveloperObject -> True
+			|>];
+
+			ECL`InternalUpload`UploadSample[
+				Model[Sample, "Milli-Q water"],
+				{"A1", testContainer},
+				InitialAmount -> 45 Milliliter,
+				Name -> "cachedResolverCall test water sample " <> $SessionUUID
+			];
+
+			Upload[<|Object -> Object[Sample, "cachedResolverCall test water sample " <> $SessionUUID], DeveloperObject -> True|>]
+		]
+	),
+	SymbolTearDown :> (
+		Module[{allObjects, existingObjects},
+			allObjects = Cases[Flatten[{$CreatedObjects, Object[Container, Vessel, "cachedResolverCall test 50mL tube " <> $SessionUUID], Object[Sample, "cachedResolverCall test water sample " <> $SessionUUID]}], ObjectP[]];
+			existingObjects = PickList[allObjects, DatabaseMemberQ[allObjects]];
+			EraseObject[existingObjects, Force -> True, Verbose -> False]
+		]
+	),
+	Stubs :> {
+		$PersonID = Object[User, "Test user for notebook-less test protocols"]
+	}
+];
+
+
+(* ::Subsection::Closed:: *)
+(*experimentShardSize*)
+
+DefineTests[experimentShardSize,
+	{
+		Example[{Basic, "Returns the number of inputs to put in each shard if there are more inputs than the ShardSize:"},
+			experimentShardSize[Range[5], {ShardSize -> 2}],
+			2
+		],
+		Example[{Basic, "Returns Null if the inputs fit in a single shard:"},
+			experimentShardSize[Range[5], {ShardSize -> 5}],
+			Null
+		],
+		Example[{Basic, "Returns Null if ShardSize is not specified, since sharding changes the shape of the Result:"},
+			experimentShardSize[Range[5000], {}],
+			Null
+		],
+		Example[{Additional, "Calls that return Options, a Preview or a Simulation are never sharded:"},
+			experimentShardSize[Range[5], {ShardSize -> 2, Output -> {Result, Options}}],
+			Null
+		],
+		Example[{Additional, "Calls with a Name or sample preparation are never sharded:"},
+			{
+				experimentShardSize[Range[5], {ShardSize -> 2, Name -> "My protocol"}],
+				experimentShardSize[Range[5], {ShardSize -> 2, PreparatoryUnitOperations -> {LabelContainer[Label -> "my container", Container -> Model[Container, Vessel, "2mL Tube"]]}}]
+			},
+			{Null, Null}
+		]
+	}
+];
+
+
+(* ::Subsection::Closed:: *)
+(*failFastTests*)
+
+DefineTests[failFastTests,
+	{
+		Example[{Basic, "Marks every test which is not a warning as a FatalFailure:"},
+			(#[FatalFailure]&)/@failFastTests[{Test["a", True, True], Warning["b", False, True], Test["c", True, True]}],
+			{True, False, True}
+		],
+		Example[{Basic, "RunUnitTest runs each test once and stops at the first one which fails:"},
+			Module[{runCount = 0},
+				RunUnitTest[
+					<|"failFastTests" -> failFastTests[{Test["a", (runCount++; True), True], Test["b", (runCount++; False), True], Test["c", (runCount++; False), True]}]|>,
+					OutputFormat -> Boolean,
+					Verbose -> False
+				];
+				runCount
+			],
+			2
+		],
+		Example[{Additional, "Failing warnings don't stop the tests:"},
+			Module[{runCount = 0},
+				RunUnitTest[
+					<|"failFastTests" -> failFastTests[{Warning["a", (runCount++; False), True], Test["b", (runCount++; True), True], Test["c", (runCount++; False), True]}]|>,
+					OutputFormat -> Boolean,
+					Verbose -> False
+				];
+				runCount
+			],
+			3
+		]
+	}
+];
+
+
+(* ::Subsection::Closed:: *)
+(*failFastValidObjectQWarnings*)
+
+DefineTests[failFastValidObjectQWarnings,
+	{
+		Example[{Basic, "Returns a warning for each input:"},
+			failFastValidObjectQWarnings[{Model[Sample, "Milli-Q water"], Model[Sample, "Milli-Q water"]}],
+			{TestP, TestP}
+		],
+		Example[{Basic, "Runs ValidObjectQ once for all of the inputs when the warnings are run:"},
+			(
+				RunUnitTest[
+					<|"failFastValidObjectQWarnings" -> failFastValidObjectQWarnings[{Model[Sample, "Milli-Q water"], Model[Sample, "Milli-Q water"]}]|>,
+					OutputFormat -> Boolean,
+					Verbose -> False
+				];
+				$failFastValidObjectQCount
+			),
+			1
+		],
+		Example[{Additional, "Doesn't run ValidObjectQ if RunUnitTest stops at an earlier failure:"},
+			(
+				RunUnitTest[
+					<|"failFastValidObjectQWarnings" -> Join[
+						failFastTests[{Test["a", False, True]}],
+						failFastValidObjectQWarnings[{Model[Sample, "Milli-Q water"], Model[Sample, "Milli-Q water"]}]
+					]|>,
+					OutputFormat -> Boolean,
+					Verbose -> False
+				];
+				$failFastValidObjectQCount
+			),
+			0
+		]
+	},
+	SetUp :> (
+		$failFastValidObjectQCount = 0
+	),
+	Stubs :> {
+		ValidObjectQ[myObjects_List, ___] := ($failFastValidObjectQCount++; ConstantArray[True, Length[myObjects]])
+	}
+];
+
+
 (* ::Subsection::Closed:: *)
 (*populateWorkingAndAliquotSamples*)
 
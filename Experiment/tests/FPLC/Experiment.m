@@ -4762,6 +4762,11 @@ DefineTests[ValidExperimentFPLCQ,
 			ValidExperimentFPLCQ[Object[Sample, "ValidExperimentFPLCQ Test Oligo" <> $SessionUUID], InjectionVolume -> 100 Micro Liter, OutputFormat -> TestSummary],
 			_EmeraldTestSummary
 		],
+		Example[
+			{Options, FailFast, "Stop at the first failing test rather than running all of them:"},
+			ValidExperimentFPLCQ[{Object[Sample, "ValidExperimentFPLCQ Test Oligo" <> $SessionUUID], Object[Sample, "ValidExperimentFPLCQ Test Discarded Sample" <> $SessionUUID]}, FailFast -> True],
+			False
+		],
 		Example[{Messages, "DiscardedSamples", "Discarded samples cannot be used as inputs:"},
 			ValidExperimentFPLCQ[{Object[Sample, "ValidExperimentFPLCQ Test Oligo" <> $SessionUUID], Object[Sample, "ValidExperimentFPLCQ Test Discarded Sample" <> $SessionUUID]}],
 			False
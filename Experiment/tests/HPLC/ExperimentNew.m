@@ -8044,6 +8044,14 @@ DefineTests[ExperimentHPLC,
 
 DefineTests[ExperimentHPLCOptions,
 	{
+		Example[
+			{Additional,"The options resolved without building the resource packets are the same as those resolved with them:"},
+			SameQ[
+				ExperimentHPLCOptions[Object[Sample,"Test Sample 1 for ExperimentHPLCOptions tests"<>$SessionUUID], OutputFormat->List],
+				ExperimentHPLCOptions[Object[Sample,"Test Sample 1 for ExperimentHPLCOptions tests"<>$SessionUUID], OptionsResolverOnly->False, OutputFormat->List]
+			],
+			True
+		],
 		Example[
 			{Basic,"Automatically resolve of all options for sample:"},
 			ExperimentHPLCOptions[{
@@ -8303,6 +8311,18 @@ DefineTests[ValidExperimentHPLCQ,
 				Object[Sample,"Test Sample 3 for ValidExperimentHPLCQ tests" <> $SessionUUID]
 			},InjectionVolume->100 Micro Liter,OutputFormat->TestSummary],
 			_EmeraldTestSummary
+		],
+		Example[
+			{Options,FailFast,"Stop at the first failing test, returning only the tests up to and including it:"},
+			Last[ValidExperimentHPLCQ[
+				Object[Sample,"Test Sample 1 for ValidExperimentHPLCQ tests" <> $SessionUUID],
+				InjectionVolume -> 5 Microliter,
+				GradientA -> 60 Percent,
+				GradientB -> 60 Percent,
+				FailFast -> True,
+				OutputFormat -> TestSummary
+			][Results]][Passed],
+			False
 		]
 	},
 	SymbolSetUp:>(
@@ -5417,6 +5417,129 @@ DefineTests[InoculateLiquidMedia,
     inoculateLiquidMediaObjectErasure["InoculateLiquidMedia", True]
   )
 ];
+(* ::Subsection:: *)
+(* PlanColonyCampaign *)
+
+DefineTests[PlanColonyCampaign,
+  {
+    Example[{Basic, "Split colony hits into batches that inoculate and incubate up to 96 colonies each, holding back the hits that do not fill a batch:"},
+      Module[{batches, pendingHits},
+        {batches, pendingHits} = PlanColonyCampaign[
+          Table[{Object[Sample, "PlanColonyCampaign test e.coli sample 1 in omniTray " <> $SessionUUID], {0 Millimeter, i * 0.1 Millimeter}}, {i, 200}]
+        ];
+        {Length[batches], Length[pendingHits], Head /@ First[batches]}
+      ],
+      {2, 8, {InoculateLiquidMedia, IncubateCells}}
+    ],
+    Example[{Basic, "Pass the hits held back by the previous call along with the new hits; they are picked first:"},
+      Module[{pendingHits, batches, newPendingHits},
+        {batches, pendingHits} = PlanColonyCampaign[Table[{Object[Sample, "PlanColonyCampaign test e.coli sample 1 in omniTray " <> $SessionUUID], {0 Millimeter, i * 0.1 Millimeter}}, {i, 10}]];
+        {batches, newPendingHits} = PlanColonyCampaign[Table[{Object[Sample, "PlanColonyCampaign test e.coli sample 1 in omniTray " <> $SessionUUID], {1 Millimeter, i * 0.1 Millimeter}}, {i, 90}], pendingHits];
+        {
+          Length[batches],
+          Length[newPendingHits],
+          First[First[Lookup[First[First[First[batches]]], PickCoordinates]]]
+        }
+      ],
+      {1, 4, {0 Millimeter, 0.1 Millimeter}},
+      EquivalenceFunction -> Equal
+    ],
+    Example[{Options, Flush, "Return the hits that do not fill a batch as a last, smaller batch:"},
+      Module[{batches, pendingHits},
+        {batches, pendingHits} = PlanColonyCampaign[
+          Table[{Object[Sample, "PlanColonyCampaign test e.coli sample 1 in omniTray " <> $SessionUUID], {0 Millimeter, i * 0.1 Millimeter}}, {i, 100}],
+          Flush -> True
+        ];
+        {Length[batches], Length[pendingHits], Length[First[Lookup[First[First[Last[batches]]], PickCoordinates]]]}
+      ],
+      {2, 0, 4}
+    ],
+    Example[{Options, BatchSize, "Pick fewer colonies in each batch:"},
+      Module[{batches, pendingHits},
+        {batches, pendingHits} = PlanColonyCampaign[
+          Table[{Object[Sample, "PlanColonyCampaign test e.coli sample 1 in omniTray " <> $SessionUUID], {0 Millimeter, i * 0.1 Millimeter}}, {i, 100}],
+          BatchSize -> 24
+        ];
+        {Length[batches], Length[pendingHits]}
+      ],
+      {4, 4}
+    ],
+    Example[{Options, IncubationTime, "Set how long the new cultures of each batch are incubated:"},
+      Lookup[
+        First[First[First[PlanColonyCampaign[
+          Table[{Object[Sample, "PlanColonyCampaign test e.coli sample 1 in omniTray " <> $SessionUUID], {0 Millimeter, i * 0.1 Millimeter}}, {i, 96}],
+          IncubationTime -> 12 Hour
+        ]]][[2]]],
+        Time
+      ],
+      12 Hour,
+      EquivalenceFunction -> Equal
+    ],
+    Example[{Options, IncubationTime, "If IncubationTime is Null, the batches only inoculate the colonies:"},
+      Head /@ First[First[PlanColonyCampaign[
+        Table[{Object[Sample, "PlanColonyCampaign test e.coli sample 1 in omniTray " <> $SessionUUID], {0 Millimeter, i * 0.1 Millimeter}}, {i, 96}],
+        IncubationTime -> Null
+      ]]],
+      {InoculateLiquidMedia}
+    ],
+    Example[{Options, DestinationMedia, "Set the media that the colonies are inoculated into:"},
+      Lookup[
+        First[First[First[First[PlanColonyCampaign[
+          Table[{Object[Sample, "PlanColonyCampaign test e.coli sample 1 in omniTray " <> $SessionUUID], {0 Millimeter, i * 0.1 Millimeter}}, {i, 96}],
+          DestinationMedia -> Model[Sample, Media, "LB Broth, Miller"]
+        ]]]]],
+        DestinationMedia
+      ],
+      ObjectP[Model[Sample, Media, "LB Broth, Miller"]]
+    ],
+    Example[{Additional, "The colonies of each source sample in a batch are picked together, and the incubation refers to the new cultures by their labels:"},
+      Module[{batch, inoculation, incubation},
+        batch = First[First[PlanColonyCampaign[
+          Join[
+            Table[{Object[Sample, "PlanColonyCampaign test e.coli sample 1 in omniTray " <> $SessionUUID], {0 Millimeter, i * 0.1 Millimeter}}, {i, 48}],
+            Table[{Object[Sample, "PlanColonyCampaign test e.coli sample 2 in omniTray " <> $SessionUUID], {0 Millimeter, i * 0.1 Millimeter}}, {i, 48}]
+          ]
+        ]]];
+        {inoculation, incubation} = batch;
+        {
+          Length /@ Lookup[First[inoculation], PickCoordinates],
+          MatchQ[Lookup[First[inoculation], ContainerOutLabel], Lookup[First[incubation], Sample]]
+        }
+      ],
+      {{48, 48}, True}
+    ],
+    Test["The unit operations of a batch resolve with Output -> Options, with a new culture for each source sample and an incubation of the labeled cultures:",
+      Module[{batch, inoculation, incubation, inoculationOptions, cellPreparationOptions},
+        batch = First[First[PlanColonyCampaign[
+          Join[
+            Table[{Object[Sample, "PlanColonyCampaign test e.coli sample 1 in omniTray " <> $SessionUUID], {0 Millimeter, i * 0.1 Millimeter}}, {i, 48}],
+            Table[{Object[Sample, "PlanColonyCampaign test e.coli sample 2 in omniTray " <> $SessionUUID], {0 Millimeter, i * 0.1 Millimeter}}, {i, 48}]
+          ]
+        ]]];
+        {inoculation, incubation} = batch;
+        inoculationOptions = ExperimentInoculateLiquidMedia[
+          Lookup[First[inoculation], Sample],
+          Sequence @@ Normal[KeyDrop[First[inoculation], Sample]],
+          Output -> Options
+        ];
+        cellPreparationOptions = ExperimentRoboticCellPreparation[batch, Output -> Options];
+        {
+          Lookup[inoculationOptions, ContainerOutLabel],
+          MatchQ[Lookup[First[incubation], Sample], Lookup[inoculationOptions, ContainerOutLabel]],
+          MatchQ[cellPreparationOptions, {(_Rule|_RuleDelayed)..}]
+        }
+      ],
+      {{_String, _String}, True, True}
+    ]
+  },
+  SymbolSetUp :> (
+    inoculateLiquidMediaSymbolSetUp["PlanColonyCampaign"]
+  ),
+  SymbolTearDown :> (
+    inoculateLiquidMediaObjectErasure["PlanColonyCampaign", True]
+  )
+];
+
 (* ::Subsection:: *)
 (* Setup and Teardown *)
 inoculateLiquidMediaObjectErasure[functionName_String, tearDownBool: BooleanP] := Module[
@@ -10566,6 +10566,13 @@ DefineTests[
 		Example[{Options,OutputFormat,"If OutputFormat -> List, return a list of options:"},
 			ExperimentLCMSOptions[Object[Sample,"ExperimentLCMSOptions Test Sample 1" <> $SessionUUID],OutputFormat->List],
 			{(_Rule|_RuleDelayed)..}
+		],
+		Example[{Additional,"The options resolved without building the resource packets are the same as those resolved with them:"},
+			SameQ[
+				ExperimentLCMSOptions[Object[Sample,"ExperimentLCMSOptions Test Sample 1" <> $SessionUUID],OutputFormat->List],
+				ExperimentLCMSOptions[Object[Sample,"ExperimentLCMSOptions Test Sample 1" <> $SessionUUID],OptionsResolverOnly->False,OutputFormat->List]
+			],
+			True
 		]
 	},
 	SymbolSetUp:>(
@@ -1046,6 +1046,81 @@ DefineTests[
 			}
     ],
 
+    Test["Inputs beyond the ShardSize are split into one protocol per shard:",
+      ExperimentMeasureWeight[
+        {
+          Object[Sample,"Available solid sample 1 for ExperimentMeasureWeight testing"<> $SessionUUID],
+          Object[Sample,"Available liquid sample 1 for ExperimentMeasureWeight testing"<> $SessionUUID]
+        },
+        ShardSize->1
+      ],
+      {ObjectP[Object[Protocol,MeasureWeight]],ObjectP[Object[Protocol,MeasureWeight]]},
+			Stubs:>{
+				$PersonID = Object[User, "Test user for notebook-less test protocols"],
+				$EmailEnabled=False
+			}
+    ],
+
+    Test["If a shard fails, the protocols of the earlier shards are rolled back and the upload transaction is closed:",
+      Module[{transactionsBefore,result},
+        transactionsBefore=$CurrentUploadTransactions;
+        result=ExperimentMeasureWeight[
+          {
+            Object[Sample,"Available solid sample 1 for ExperimentMeasureWeight testing"<> $SessionUUID],
+            Object[Sample,"Discarded sample for ExperimentMeasureWeight testing"<> $SessionUUID]
+          },
+          ShardSize->1
+        ];
+        {result,$CurrentUploadTransactions===transactionsBefore}
+      ],
+      {$Failed,True},
+      Messages:>{
+        Error::DiscardedSamples,
+        Error::InvalidInput,
+        Error::ExperimentShardFailed,
+        Warning::ExperimentShardsRolledBack
+      },
+			Stubs:>{
+				$PersonID = Object[User, "Test user for notebook-less test protocols"],
+				$EmailEnabled=False
+			}
+    ],
+
+    Test["If a sharded call is aborted, the upload transaction is closed and rolled back before the abort is passed on:",
+      Module[{transactionsBefore,resolverCalls=0,rollbackCalls=0,result},
+        transactionsBefore=$CurrentUploadTransactions;
+        Internal`InheritedBlock[{Experiment`Private`resolveExperimentMeasureWeightOptions,RollbackTransaction},
+          Unprotect[RollbackTransaction];
+          (* abort while resolving the second shard *)
+          DownValues[Experiment`Private`resolveExperimentMeasureWeightOptions]=Prepend[
+            DownValues[Experiment`Private`resolveExperimentMeasureWeightOptions],
+            HoldPattern[Experiment`Private`resolveExperimentMeasureWeightOptions[___]]:>Abort[]/;(resolverCalls++;resolverCalls==2)
+          ];
+          (* count the rollbacks without changing what they do *)
+          DownValues[RollbackTransaction]=Prepend[
+            DownValues[RollbackTransaction],
+            HoldPattern[RollbackTransaction[___]]:>Null/;(rollbackCalls++;False)
+          ];
+          result=CheckAbort[
+            ExperimentMeasureWeight[
+              {
+                Object[Sample,"Available solid sample 1 for ExperimentMeasureWeight testing"<> $SessionUUID],
+                Object[Sample,"Available liquid sample 1 for ExperimentMeasureWeight testing"<> $SessionUUID]
+              },
+              ShardSize->1
+            ],
+            $Aborted
+          ]
+        ];
+        {result,$CurrentUploadTransactions===transactionsBefore,rollbackCalls}
+      ],
+      {$Aborted,True,1},
+			Stubs:>{
+				$PersonID = Object[User, "Test user for notebook-less test protocols"],
+				$EmailEnabled=False
+			}
+    ],
+
     Example[{Options,NumberOfReplicates,"Indicate that each measurement should be repeated 3 times and the results should be averaged:"},
       Download[
         ExperimentMeasureWeight[{
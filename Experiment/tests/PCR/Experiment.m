@@ -3166,6 +3166,63 @@ DefineTests[ValidExperimentPCRQ,
 ];
 
 
+(* ::Subsection::Closed:: *)
+(*PartitionPCRReactions*)
+
+
+DefineTests[PartitionPCRReactions,
+	{
+		Example[{Basic,"Lays out more reactions than fit on one 96-well plate onto as few plates as possible:"},
+			PartitionPCRReactions[Table[Object[Sample,"id:"<>ToString[i]],{i,200}]],
+			{Range[1,96],Range[97,192],Range[193,200]}
+		],
+		Example[{Basic,"Reactions with different master mixes are put on different plates:"},
+			PartitionPCRReactions[
+				Table[Object[Sample,"id:"<>ToString[i]],{i,4}],
+				MasterMix->{Model[Sample,"id:GmzlKjP6pan9"],Null,Model[Sample,"id:GmzlKjP6pan9"],Null}
+			],
+			{{1,3},{2,4}}
+		],
+		Example[{Options,NumberOfReplicates,"Every replicate takes up a well, and the replicates of a reaction are kept on the same plate:"},
+			Length/@PartitionPCRReactions[Table[Object[Sample,"id:"<>ToString[i]],{i,100}],NumberOfReplicates->3],
+			{32,32,32,4}
+		],
+		Example[{Options,NumberOfWells,"Use 384-well plates, as ExperimentqPCR does:"},
+			Length/@PartitionPCRReactions[Table[Object[Sample,"id:"<>ToString[i]],{i,1000}],NumberOfWells->384],
+			{384,384,232}
+		],
+		Example[{Options,ReservedWells,"Keep wells free on every plate for the standards:"},
+			Length/@PartitionPCRReactions[Table[Object[Sample,"id:"<>ToString[i]],{i,400}],NumberOfWells->384,ReservedWells->24],
+			{360,40}
+		],
+		Example[{Options,MasterMix,"Every reaction is on exactly one plate, whatever the mix of master mixes:"},
+			Sort[Flatten[PartitionPCRReactions[
+				Table[Object[Sample,"id:"<>ToString[i]],{i,300}],
+				MasterMix->Table[If[OddQ[i],Model[Sample,"id:GmzlKjP6pan9"],Automatic],{i,300}]
+			]]],
+			Range[300]
+		],
+		Example[{Options,MasterMix,"Reactions left to the default master mix share plates with the reactions given the master mix ExperimentPCR defaults to:"},
+			PartitionPCRReactions[
+				Table[Object[Sample,"id:"<>ToString[i]],{i,4}],
+				MasterMix->{Automatic,Null,Model[Sample,"DreamTaq PCR Master Mix"],Automatic}
+			],
+			{{1,3,4},{2}}
+		],
+		Example[{Messages,"PCRReactionsDoNotFit","Returns $Failed if the replicates of a reaction do not fit on a plate:"},
+			PartitionPCRReactions[{Object[Sample,"id:1"]},NumberOfReplicates->4,ReservedWells->94],
+			$Failed,
+			Messages:>{Error::PCRReactionsDoNotFit}
+		],
+		Example[{Messages,"PCRMasterMixLengthMismatch","Returns $Failed if the master mixes are not index-matched to the reactions:"},
+			PartitionPCRReactions[{Object[Sample,"id:1"],Object[Sample,"id:2"]},MasterMix->{Null,Null,Null}],
+			$Failed,
+			Messages:>{Error::PCRMasterMixLengthMismatch}
+		]
+	}
+];
+
+
 (* ::Subsection::Closed:: *)
 (*PCR*)
 (* This is the unit test for the primitive heads *)
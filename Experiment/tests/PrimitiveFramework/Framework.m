@@ -10617,3 +10617,41 @@ DefineTests[ValidateUnitOperationsJSON,
     On[Warning::InstrumentUndergoingMaintenance];
   )
 ];
+
+
+(* ::Subsubsection::Closed:: *)
+(*resizePrimitiveFrameworkCache*)
+
+DefineTests[resizePrimitiveFrameworkCache,
+  {
+    Example[{Basic,"Drop the oldest half of the resolver cache once it holds more than $PrimitiveFrameworkResolverCacheSize results:"},
+      Block[{$PrimitiveFrameworkResolverOutputCache=AssociationThread[Range[300],Range[300]]},
+        resizePrimitiveFrameworkCache[10];
+        {Length[$PrimitiveFrameworkResolverOutputCache],First[Keys[$PrimitiveFrameworkResolverOutputCache]]}
+      ],
+      {150,151}
+    ],
+    Example[{Basic,"Keep every result when the cache is within the $PrimitiveFrameworkResolverResultsPerPrimitive results per unit operation needed for a large call:"},
+      Block[{$PrimitiveFrameworkResolverOutputCache=AssociationThread[Range[1000],Range[1000]]},
+        resizePrimitiveFrameworkCache[500];
+        Length[$PrimitiveFrameworkResolverOutputCache]
+      ],
+      1000
+    ]
+  }
+];
+
+
+(* ::Subsubsection::Closed:: *)
+(*lookupPrimitiveFrameworkResolverCache*)
+
+DefineTests[lookupPrimitiveFrameworkResolverCache,
+  {
+    Example[{Basic,"Return a previous resolver result and move it to the end of the cache so that it is the last to be dropped:"},
+      Block[{$PrimitiveFrameworkResolverOutputCache=<|"a"->1,"b"->2,"c"->3|>},
+        {lookupPrimitiveFrameworkResolverCache["a"],Keys[$PrimitiveFrameworkResolverOutputCache]}
+      ],
+      {1,{"b","c","a"}}
+    ]
+  }
+];
@@ -271,6 +271,81 @@ DefineTests[
 ];
 
 
+(* ::Subsubsection::Closed:: *)
+(*PartitionUnitOperations*)
+
+DefineTests[
+	PartitionUnitOperations,
+	{
+		Example[{Basic, "Unit operations that work on different labeled containers are split into separate groups:"},
+			PartitionUnitOperations[{
+				LabelContainer[Label -> "PartitionUnitOperations container 1", Container -> Model[Container, Vessel, "2mL Tube"]],
+				LabelContainer[Label -> "PartitionUnitOperations container 2", Container -> Model[Container, Vessel, "2mL Tube"]],
+				Transfer[Source -> Model[Sample, "Milli-Q water"], Destination -> "PartitionUnitOperations container 1", Amount -> 1 Milliliter],
+				Transfer[Source -> Model[Sample, "Milli-Q water"], Destination -> "PartitionUnitOperations container 2", Amount -> 1 Milliliter]
+			}],
+			{
+				{
+					LabelContainer[Label -> "PartitionUnitOperations container 1", Container -> Model[Container, Vessel, "2mL Tube"]],
+					Transfer[Source -> Model[Sample, "Milli-Q water"], Destination -> "PartitionUnitOperations container 1", Amount -> 1 Milliliter]
+				},
+				{
+					LabelContainer[Label -> "PartitionUnitOperations container 2", Container -> Model[Container, Vessel, "2mL Tube"]],
+					Transfer[Source -> Model[Sample, "Milli-Q water"], Destination -> "PartitionUnitOperations container 2", Amount -> 1 Milliliter]
+				}
+			}
+		],
+		Example[{Basic, "Unit operations that share a label stay in the same group, in their original order:"},
+			Length[PartitionUnitOperations[{
+				LabelContainer[Label -> "PartitionUnitOperations container 1", Container -> Model[Container, Vessel, "2mL Tube"]],
+				LabelContainer[Label -> "PartitionUnitOperations container 2", Container -> Model[Container, Vessel, "2mL Tube"]],
+				Transfer[Source -> Model[Sample, "Milli-Q water"], Destination -> "PartitionUnitOperations container 1", Amount -> 1 Milliliter],
+				Transfer[Source -> "PartitionUnitOperations container 1", Destination -> "PartitionUnitOperations container 2", Amount -> 500 Microliter]
+			}]],
+			1
+		],
+		Example[{Basic, "Unit operations that don't refer to any labels or objects, such as Wait, are barriers that join the groups before and after them:"},
+			PartitionUnitOperations[{
+				LabelContainer[Label -> "PartitionUnitOperations container 1", Container -> Model[Container, Vessel, "2mL Tube"]],
+				Wait[Duration -> 5 Minute],
+				LabelContainer[Label -> "PartitionUnitOperations container 2", Container -> Model[Container, Vessel, "2mL Tube"]]
+			}],
+			{
+				{
+					LabelContainer[Label -> "PartitionUnitOperations container 1", Container -> Model[Container, Vessel, "2mL Tube"]],
+					Wait[Duration -> 5 Minute],
+					LabelContainer[Label -> "PartitionUnitOperations container 2", Container -> Model[Container, Vessel, "2mL Tube"]]
+				}
+			}
+		],
+		Example[{Additional, "Only the groups on either side of a Wait are joined; independent unit operations elsewhere are still split off:"},
+			Length /@ PartitionUnitOperations[{
+				LabelContainer[Label -> "PartitionUnitOperations container 1", Container -> Model[Container, Vessel, "2mL Tube"]],
+				LabelContainer[Label -> "PartitionUnitOperations container 2", Container -> Model[Container, Vessel, "2mL Tube"]],
+				Wait[Duration -> 5 Minute],
+				LabelContainer[Label -> "PartitionUnitOperations container 3", Container -> Model[Container, Vessel, "2mL Tube"]],
+				Transfer[Source -> Model[Sample, "Milli-Q water"], Destination -> "PartitionUnitOperations container 1", Amount -> 1 Milliliter]
+			}],
+			{2, 3}
+		],
+		Example[{Additional, "An empty list of unit operations has no groups:"},
+			PartitionUnitOperations[{}],
+			{}
+		],
+		Example[{Additional, "A 1,000 step preparation made of 500 independent pairs of unit operations is split into 500 groups:"},
+			Length[PartitionUnitOperations[Flatten[Table[
+				{
+					LabelContainer[Label -> "PartitionUnitOperations container " <> ToString[i], Container -> Model[Container, Vessel, "2mL Tube"]],
+					Transfer[Source -> Model[Sample, "Milli-Q water"], Destination -> "PartitionUnitOperations container " <> ToString[i], Amount -> 1 Milliliter]
+				},
+				{i, 500}
+			]]]],
+			500
+		]
+	}
+];
+
+
 (* ::Subsubsection::Closed:: *)
 (*Experiment`Private`SimulateResources*)
 
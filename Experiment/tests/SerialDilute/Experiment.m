@@ -1272,6 +1272,33 @@ DefineTests[ExperimentSerialDilute,
 				Error::InvalidOption
 			}
 		],
+		Test["A batch of identical series resolves each series to the same amounts as a single series:",
+			Module[{singleOptions,batchOptions},
+				singleOptions=ExperimentSerialDilute[
+					Object[Sample, "ExperimentSerialDilute New Test Chemical 3 (200 uL)"<>$SessionUUID],
+					SerialDilutionFactors -> {10},
+					NumberOfSerialDilutions -> 3,
+					FinalVolume -> {100 Microliter},
+					Output -> Options
+				];
+				batchOptions=ExperimentSerialDilute[
+					ConstantArray[Object[Sample, "ExperimentSerialDilute New Test Chemical 3 (200 uL)"<>$SessionUUID],5],
+					SerialDilutionFactors -> {10},
+					NumberOfSerialDilutions -> 3,
+					FinalVolume -> {100 Microliter},
+					Output -> Options
+				];
+				(* the batch options may be collapsed to the single series value or expanded to one value per series *)
+				MapThread[
+					MatchQ[#1,#2|{#2..}]&,
+					{
+						Lookup[batchOptions,{SerialDilutionFactors,TargetConcentrations,TransferAmounts,DiluentAmount}],
+						Lookup[singleOptions,{SerialDilutionFactors,TargetConcentrations,TransferAmounts,DiluentAmount}]
+					}
+				]
+			],
+			{True,True,True,True}
+		],
 		Test["Generate an Object[Protocol, ManualCellPreparation] if Preparation -> Manual and a cell-containing sample is used:",
 			ExperimentSerialDilute[
 				{Object[Sample,"ExperimentSerialDilute Test cell sample 1" <> $SessionUUID]},
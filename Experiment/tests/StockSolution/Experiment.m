@@ -472,6 +472,46 @@ DefineTests[
 				Experiment`Private`$StockSolutionUnitTestSearchName="Aspirin (tablet) in water"
 			}
 		],
+		Test["A new stock solution model uploaded with the protocol is added to UploadStockSolution's lookup of its formula:",
+			Module[{lookupKey,protocol},
+				lookupKey=Experiment`Private`stockSolutionFormulaKey[
+					Model[Sample,StockSolution],
+					Download[{Model[Sample,"Glycerol"],Model[Sample,"Milli-Q water"]},Object],
+					Null,
+					Download[Cases[{$Notebook},ObjectP[]],Object]
+				];
+
+				(* make sure a model exists for the formula, and let the lookup remember it *)
+				UploadStockSolution[
+					{
+						{3.7 Milliliter,Model[Sample,"Glycerol"]},
+						{96.3 Milliliter,Model[Sample,"Milli-Q water"]}
+					},
+					Name->"Formula lookup test glycerol solution 1 "<>$SessionUUID
+				];
+				Experiment`Private`stockSolutionFormulaLookup[lookupKey];
+
+				protocol=ExperimentStockSolution[
+					{
+						{3.7 Milliliter,Model[Sample,"Glycerol"]},
+						{96.3 Milliliter,Model[Sample,"Milli-Q water"]}
+					},
+					StockSolutionName->"Formula lookup test glycerol solution 2 "<>$SessionUUID
+				];
+
+				(* with Search blocked, the lookup can only answer from what it has remembered *)
+				Block[{Search},
+					MemberQ[Experiment`Private`stockSolutionFormulaLookup[lookupKey],Download[protocol,StockSolutionModels[[1]][Object]]]
+				]
+			],
+			True,
+			TimeConstraint -> 300,
+			Stubs :> {
+				Experiment`Private`$StockSolutionUnitTestFilterOutNewlyCreatedObjects=False
+			},
+			SetUp :> (ClearMemoization[]),
+			TearDown :> (ClearMemoization[])
+		],
 		Example[{Additional,"Matrix and Media solutions may also be prepared by ExperimentStockSolution:"},
 			ExperimentStockSolution[{Model[Sample,Media,"Salt Media (example)"],Model[Sample,Matrix,"Salt Matrix (example)"]}],
 			ObjectP[Object[Protocol,StockSolution]],
@@ -220,6 +220,52 @@ DefineTests[UploadStockSolution,
 				Upload[<|Object->Model[Sample, StockSolution, "Existing Solution of 10% v/v Methanol in Water"],ShelfLife->1Year,UnsealedShelfLife->1Year|>]
 			)
 		],
+		Test["Once a model has been found for a formula, the formula is looked up without searching, and models uploaded for it later are added to the lookup:",
+			Module[{lookupKey,firstModel,secondModel},
+				lookupKey=Experiment`Private`stockSolutionFormulaKey[
+					Model[Sample,StockSolution],
+					Download[{Model[Sample,"Glycerol"],Model[Sample,"Milli-Q water"]},Object],
+					Null,
+					Download[Cases[{$Notebook},ObjectP[]],Object]
+				];
+				firstModel=UploadStockSolution[
+					{
+						{3.7 Milliliter,Model[Sample,"Glycerol"]},
+						{96.3 Milliliter,Model[Sample,"Milli-Q water"]}
+					},
+					Name->"Formula lookup test glycerol solution 1 "<>$SessionUUID
+				];
+
+				(* this searches for the formula and finds (at least) the model we just uploaded *)
+				Experiment`Private`stockSolutionFormulaLookup[lookupKey];
+
+				secondModel=UploadStockSolution[
+					{
+						{7.4 Milliliter,Model[Sample,"Glycerol"]},
+						{192.6 Milliliter,Model[Sample,"Milli-Q water"]}
+					},
+					Name->"Formula lookup test glycerol solution 2 "<>$SessionUUID
+				];
+
+				(* with Search blocked, the lookup can only answer from what it has remembered *)
+				Block[{Search},
+					ContainsAll[Experiment`Private`stockSolutionFormulaLookup[lookupKey],Download[{firstModel,secondModel},Object]]
+				]
+			],
+			True,
+			Stubs:>{
+				Experiment`Private`$StockSolutionUnitTestFilterOutNewlyCreatedObjects=False
+			},
+			SetUp:>(
+				$CreatedObjects={};
+				ClearMemoization[]
+			),
+			TearDown:>(
+				EraseObject[PickList[$CreatedObjects,DatabaseMemberQ[$CreatedObjects]],Force->True,Verbose->False];
+				Unset[$CreatedObjects];
+				ClearMemoization[]
+			)
+		],
 		Example[{Additional,"Create a model for a solution in which a solid component is a tablet by specifying a particular count of tablets to be included in the mixture:"},
 			UploadStockSolution[
 				{
@@ -99,13 +99,14 @@ SampleUsage[myPrimitives:{SampleManipulationP..}, ops:OptionsPattern[]]:=Module[
 		primitiveKeyValidityRules, invalidKeyValuesPickList, primitivesWithInvalidKeys, fillToVolumePrimitives, sourceObjects,
 		transferPrimitiveObjs, resultTuplesWithNoNames, resultTuplesWithNames, sortedResultsTuples, transferPrimitiveObjsNoModel,
 		fillToVolumeObjs, fillToVolumeObjsNoModel, objsToTest, databaseMember, missingObjs, objsToUse, objsToUseWithAuthors, allFields,
-		allPackets, newCache, allPacketsNoNotebook, financerPackets, fillToVolumeRules, totalUsageList, samplePackets, modelToSampleReplaceRules,
+		allPackets, newCache, fastCache, allPacketsNoNotebook, financerPackets, fillToVolumeRules, totalUsageList, samplePackets, modelToSampleReplaceRules,
 		allModelPackets, notDisposalBool, disposalSamples, notDiscardedBool, discardedSamples, expiredBool, expiredSamples,
 		deprecatedSpecifiedModels, samplesWithDeprecatedModel, allAllowedNotebooks, samplesNotebook, notOwnedSamplesBools,
 		notOwnedSamples, modelsToSearch, searchConditions, typesToSearch, searchResults, allPacketsNew, groupedPackets, publicPackets,
 		ownedPackets, publicAmountPerModel, ownedAmountPerModel, waterModelReplaceRules, allModelReplaceRules, modelToAmountsReplaceRules,
 		sampleToModelReplaceRules, modelsOfObjsToDisplay, resultsToPlot, primitiveToUsageRules, updatedPrimitiveToUsageValues,
-		resolvedPrimitiveToUsageValues, updatedPrimitiveToUsageRules, sampleToInventoryRules, primitiveWithInsufficientSamples,
+		resolvedPrimitiveToUsageValues, updatedPrimitiveToUsageRules, sampleToInventoryRules, primitiveToUsageLookup, sampleInventoryLookup,
+		modelInventoryLookup, sampleToModelLookup, firstInsufficientPrimitiveLookup,
 		firstPrimitiveWithInsufficientSamples, positionsWithInsufficientSamples, inventoriedAmounts, usersInitialAmount, publicAmount,
 		amountPostManipulation, usersFinalAmount, usersFinalScaledAmount, additionalDefineReplaceRules, updatedDefineReplaceRules,
 		definedNameToRefRules, definedNameRulesNoWells, definedNameLookupRules, definedNameLookup, definedNameLookupAssociation,
@@ -469,18 +470,31 @@ SampleUsage[myPrimitives:{SampleManipulationP..}, ops:OptionsPattern[]]:=Module[
 	(* the unevaluated download form is used in the primitive instead. It will show correct form in primitive blobs in MM front end *)
 	(* we can get around this by creating a replace rule first with actual object reference first *)
 
-	(* get all objects from the primitives *)
-	allObjsFromPrimitives=Cases[resolvedPrimitives, ObjectP[], Infinity];
+	(* get all objects from the primitives. a large manipulation refers to the same few objects many times over, so only keep each one once *)
+	allObjsFromPrimitives=DeleteDuplicates[Cases[resolvedPrimitives, ObjectP[], Infinity]];
 
-	(* create a replace rules with object references *)
+	(* create a replace rules with object references, getting all of the references in one Download call *)
 	(* also support cases where missing object is specified *)
-	objRefReplaceRules=Quiet[DeleteDuplicates[Map[
-		If[MatchQ[Download[#, Object], $Failed],
-			# -> #,
-			# -> Download[#, Object]
-		]&,
-		allObjsFromPrimitives
-	]]];
+	objRefReplaceRules=Quiet[Module[{objRefs},
+		objRefs=Download[allObjsFromPrimitives, Object];
+		If[MatchQ[objRefs, _List] && Length[objRefs]==Length[allObjsFromPrimitives],
+			MapThread[
+				If[MatchQ[#2, $Failed],
+					#1 -> #1,
+					#1 -> #2
+				]&,
+				{allObjsFromPrimitives, objRefs}
+			],
+			(* if the Download of the whole list failed, fall back to getting the references one at a time *)
+			Map[
+				If[MatchQ[Download[#, Object], $Failed],
+					# -> #,
+					# -> Download[#, Object]
+				]&,
+				allObjsFromPrimitives
+			]
+		]
+	]];
 
 	(* turn all objects in the primitives into object references for ease of use downstream *)
 	resolvedPrimitivesWithRefs=Map[
@@ -538,13 +552,13 @@ SampleUsage[myPrimitives:{SampleManipulationP..}, ops:OptionsPattern[]]:=Module[
 	(* Collect all objects to download *)
 	objsToTest=DeleteDuplicates[Flatten[{transferPrimitiveObjsNoModel, fillToVolumeObjsNoModel}]];
 
-	(* Test to see if the objsToTest exist in the database (or the input cache) *)
-	databaseMember=Map[
-		If[DatabaseMemberQ[#],
+	(* Test to see if the objsToTest exist in the database (or the input cache), checking all of them in one DatabaseMemberQ call *)
+	databaseMember=MapThread[
+		If[#2,
 			True,
-			MemberQ[Lookup[cache, Object], #]
+			MemberQ[Lookup[cache, Object], #1]
 		]&,
-		objsToTest
+		{objsToTest, DatabaseMemberQ[objsToTest]}
 	];
 
 	(* Get the list of all missing objects *)
@@ -619,6 +633,9 @@ SampleUsage[myPrimitives:{SampleManipulationP..}, ops:OptionsPattern[]]:=Module[
 	(* make the new cache to use downstream *)
 	newCache=Experiment`Private`FlattenCachePackets[Cases[{cache, allPackets}, PacketP[], Infinity]];
 
+	(* index the cache by object so that getting a packet doesn't scan the whole cache, which adds up over thousands of primitives *)
+	fastCache=Experiment`Private`makeFastAssocFromCache[newCache];
+
 	(* Separate out the Notebook packet from the sample/model packets *)
 	{allPacketsNoNotebook, financerPackets}=TakeDrop[allPackets, Length[objsToUse]];
 
@@ -645,7 +662,7 @@ SampleUsage[myPrimitives:{SampleManipulationP..}, ops:OptionsPattern[]]:=Module[
 					0 * unit,
 
 					(* For all other object types, get the packet *)
-					packet=Experiment`Private`fetchPacketFromCache[destination, newCache];
+					packet=usagePacketLookup[destination, fastCache];
 
 					(* get the contents from the packet *)
 					contents=Flatten[Lookup[packet, Contents, {}]];
@@ -660,7 +677,7 @@ SampleUsage[myPrimitives:{SampleManipulationP..}, ops:OptionsPattern[]]:=Module[
 						_,
 						If[MatchQ[contents, {}],
 							0 * unit,
-							Lookup[Experiment`Private`fetchPacketFromCache[contents[[2]], newCache], Volume]
+							Lookup[usagePacketLookup[contents[[2]], fastCache], Volume]
 						]
 					]
 				];
@@ -729,8 +746,8 @@ SampleUsage[myPrimitives:{SampleManipulationP..}, ops:OptionsPattern[]]:=Module[
 			Module[{packet, allContents, content},
 				(* get the container's packet from cache *)
 				packet=Switch[input,
-					ObjectP[Object[Container]], Experiment`Private`fetchPacketFromCache[input, newCache],
-					_, Experiment`Private`fetchPacketFromCache[input[[1]], newCache]
+					ObjectP[Object[Container]], usagePacketLookup[input, fastCache],
+					_, usagePacketLookup[input[[1]], fastCache]
 				];
 				(* lookup the container's contents *)
 				allContents=Lookup[packet, Contents];
@@ -780,7 +797,7 @@ SampleUsage[myPrimitives:{SampleManipulationP..}, ops:OptionsPattern[]]:=Module[
 	totalUsageList=Values[sampleToAmountAssociation];
 
 	(* get the packets for objects that we will display in a table or return as association *)
-	objPacketsToUse=Experiment`Private`fetchPacketFromCache[#, newCache]& /@ objRefList;
+	objPacketsToUse=usagePacketLookup[#, fastCache]& /@ objRefList;
 
 	(* get the object name from the packets *)
 	objNamesToUse=Lookup[objPacketsToUse, Name];
@@ -826,13 +843,13 @@ SampleUsage[myPrimitives:{SampleManipulationP..}, ops:OptionsPattern[]]:=Module[
 	(* ------------------------------------ *)
 
 	(* Get the sample packets without their models *)
-	samplePackets=Experiment`Private`fetchPacketFromCache[#, newCache]& /@ Cases[objsToUse, ObjectP[Object[Sample]]];
+	samplePackets=usagePacketLookup[#, fastCache]& /@ Cases[objsToUse, ObjectP[Object[Sample]]];
 
 	(* Get the model packets of the user-specified samples *)
-	samplesModelPackets=Experiment`Private`fetchPacketFromCache[#, newCache]& /@ Cases[Lookup[samplePackets, Model], ObjectP[]];
+	samplesModelPackets=usagePacketLookup[#, fastCache]& /@ Cases[Lookup[samplePackets, Model], ObjectP[]];
 
 	(* Get the packets of the user-specified models *)
-	specifiedModelPackets=Experiment`Private`fetchPacketFromCache[#, newCache]& /@ Cases[objsToUse, ObjectP[Model[Sample]]];
+	specifiedModelPackets=usagePacketLookup[#, fastCache]& /@ Cases[objsToUse, ObjectP[Model[Sample]]];
 
 	(* combine user-specified model packets and sample's model packets *)
 	allModelPackets=Flatten[{samplesModelPackets, specifiedModelPackets}];
@@ -965,7 +982,7 @@ SampleUsage[myPrimitives:{SampleManipulationP..}, ops:OptionsPattern[]]:=Module[
 	(* create a list of models index matched to object list to display *)
 	modelList=Map[
 		Switch[#,
-			ObjectP[Object[Sample]], Lookup[Experiment`Private`fetchPacketFromCache[#, newCache], Model] /. x:ObjectP[] :> Download[x, Object],
+			ObjectP[Object[Sample]], Lookup[usagePacketLookup[#, fastCache], Model] /. x:ObjectP[] :> Download[x, Object],
 			_, #
 		]&,
 		objRefList
@@ -973,7 +990,7 @@ SampleUsage[myPrimitives:{SampleManipulationP..}, ops:OptionsPattern[]]:=Module[
 
 	(* create a list of model names index matched to object list to display *)
 	modelNameList=Map[
-		Lookup[Experiment`Private`fetchPacketFromCache[#, newCache], Name, "-"]&,
+		Lookup[usagePacketLookup[#, fastCache], Name, "-"]&,
 		modelList /. Null -> <||>
 	];
 
@@ -984,7 +1001,7 @@ SampleUsage[myPrimitives:{SampleManipulationP..}, ops:OptionsPattern[]]:=Module[
 	samplesAmountRules=Map[
 		Module[{packet, state, volume, mass, count, amount},
 			(* get the sample's packet *)
-			packet=Experiment`Private`fetchPacketFromCache[#, newCache];
+			packet=usagePacketLookup[#, fastCache];
 
 			(* get state, volume, mass, and count from the packet *)
 			{state, volume, mass, count}=Lookup[packet, {State, Volume, Mass, Count}, Null];
@@ -1135,7 +1152,7 @@ SampleUsage[myPrimitives:{SampleManipulationP..}, ops:OptionsPattern[]]:=Module[
 		Map[
 			Switch[#,
 				{}, {},
-				_, Experiment`Private`fetchPacketFromCache[Lookup[#[[1]], Model], newCache]
+				_, usagePacketLookup[Lookup[#[[1]], Model], fastCache]
 			]&,
 			publicPackets
 		]
@@ -1147,7 +1164,7 @@ SampleUsage[myPrimitives:{SampleManipulationP..}, ops:OptionsPattern[]]:=Module[
 		Map[
 			Switch[#,
 				{}, {},
-				_, Experiment`Private`fetchPacketFromCache[Lookup[#[[1]], Model], newCache]
+				_, usagePacketLookup[Lookup[#[[1]], Model], fastCache]
 			]&,
 			ownedPackets
 		]
@@ -1163,7 +1180,7 @@ SampleUsage[myPrimitives:{SampleManipulationP..}, ops:OptionsPattern[]]:=Module[
 	(* also assign unit to zero amount *)
 	modelToAmountsReplaceRules=MapThread[
 		Module[{state, unit, amountTuple, updatedAmountTuple},
-			state=Lookup[Experiment`Private`fetchPacketFromCache[#1, newCache], State];
+			state=Lookup[usagePacketLookup[#1, fastCache], State];
 
 			unit=Switch[state,
 				Liquid, Liter,
@@ -1288,7 +1305,7 @@ SampleUsage[myPrimitives:{SampleManipulationP..}, ops:OptionsPattern[]]:=Module[
 
 				ObjectP[Model[Sample]], #1,
 
-				_, Lookup[Experiment`Private`fetchPacketFromCache[#1, newCache], Model] /. x:ObjectP[] :> Download[x, Object]
+				_, Lookup[usagePacketLookup[#1, fastCache], Model] /. x:ObjectP[] :> Download[x, Object]
 			];
 
 			(* If the initial amount in inventory is N/A, set to Infinity as this is a water model *)
@@ -1300,26 +1317,37 @@ SampleUsage[myPrimitives:{SampleManipulationP..}, ops:OptionsPattern[]]:=Module[
 		{objRefList, usersInitialAmount}
 	];
 
+	(* look up the usage of each primitive, the amount of each sample and inventory, and the model of each sample by key rather than through replace rules, *)
+	(* so that tracking a few thousand primitives doesn't scan every rule for every primitive. The first rule for each primitive and sample wins, as with ReplaceAll *)
+	primitiveToUsageLookup=Association[Reverse[updatedPrimitiveToUsageRules]];
+	sampleInventoryLookup=Association[Reverse[sampleToInventoryRules]];
+	modelInventoryLookup=Association[Reverse[modelToInventoryRules]];
+	sampleToModelLookup=AssociationThread[objRefList, modelList];
+
 	(* map over our valid input primitives in original sequence and update volume in the user's inventory as if we are performing each manipulation *)
-	(* whenever the amount goes below zero, return object {reference -> primitive} *)
-	primitiveWithInsufficientSamples=Map[
+	(* amounts only ever go down, so the first primitive after which a sample's amount is below zero is the one where the sample ran out *)
+	firstInsufficientPrimitiveLookup=<||>;
+	Scan[
 		Function[primitive,
 			Module[{sampleToUsageAssociation, updatedAmountRules},
-				(* create a sample-amount lookup assocaition *)
-				sampleToUsageAssociation=primitive /. updatedPrimitiveToUsageRules;
+				(* get the sample-amount lookup association of the primitive *)
+				sampleToUsageAssociation=Lookup[primitiveToUsageLookup, Key[primitive], Null];
 
-				(* create replace rules to update sample's amount and inventory amount *)
+				(* create rules to update sample's amount and inventory amount *)
 				updatedAmountRules=If[MatchQ[sampleToUsageAssociation, _Association],
-					KeyValueMap[
+					Flatten[KeyValueMap[
 						Module[{sample, amount, model, sampleAmountUpdate, inventoryAmountUpdate},
 
 							{sample, amount}={#1, #2};
 
-							(* get the sample's model from the packet *)
-							model=Lookup[Experiment`Private`fetchPacketFromCache[sample, newCache], Model, sample] /. (x:ObjectP[] :> Download[x, Object]);
+							(* get the sample's model *)
+							model=If[KeyExistsQ[sampleToModelLookup, sample],
+								sampleToModelLookup[sample],
+								Lookup[usagePacketLookup[sample, fastCache], Model, sample] /. (x:ObjectP[] :> Download[x, Object])
+							];
 
 							(* make rule to update sample's amount *)
-							sampleAmountUpdate=sample -> (Lookup[sampleToInventoryRules, sample] - amount);
+							sampleAmountUpdate=sample -> (Lookup[sampleInventoryLookup, sample] - amount);
 
 							(* make rule to update inventory amount *)
 							inventoryAmountUpdate=Switch[sample,
@@ -1331,48 +1359,49 @@ SampleUsage[myPrimitives:{SampleManipulationP..}, ops:OptionsPattern[]]:=Module[
 									(* return Null if sample doesn't have a model *)
 									Null,
 									(* otherwise, return rule to update inventory amount *)
-									model -> (Lookup[modelToInventoryRules, model] - amount)
+									model -> (Lookup[modelInventoryLookup, model] - amount)
 								]
 							];
 
 							(* return amount update rules *)
-							DeleteDuplicates[Flatten[{sampleAmountUpdate, inventoryAmountUpdate}]]
+							DeleteDuplicates[Cases[{sampleAmountUpdate, inventoryAmountUpdate}, _Rule]]
 
 						]&,
 						sampleToUsageAssociation
-					]
+					]],
+					{}
 				];
 
-				(* update sample's amount and inventory amount in the rules we defined outside *)
-				If[!NullQ[updatedAmountRules],
-					sampleToInventoryRules=ReplaceRule[sampleToInventoryRules, Flatten[updatedAmountRules]];
-					modelToInventoryRules=ReplaceRule[modelToInventoryRules, Flatten[updatedAmountRules]]
-				];
+				(* update sample's amount and inventory amount *)
+				AssociateTo[sampleInventoryLookup, updatedAmountRules];
+				AssociateTo[modelInventoryLookup, updatedAmountRules];
 
-				(* if the sample's amount < 0, return sample -> primitive rule so that we know at which primitive that the sample ran out *)
-				KeyValueMap[
-					Function[{sample, amount},
-						If[MatchQ[amount, LessP[0 * Units[amount]]],
-							sample -> primitive,
-							Nothing
+				(* if an updated amount is now below zero for the first time, remember that this primitive is where the sample ran out *)
+				Map[
+					Function[{sample},
+						If[MatchQ[sampleInventoryLookup[sample], LessP[0 * Units[sampleInventoryLookup[sample]]]] && !KeyExistsQ[firstInsufficientPrimitiveLookup, sample],
+							AssociateTo[firstInsufficientPrimitiveLookup, sample -> primitive]
 						]
 					],
-					Association @@ sampleToInventoryRules
+					DeleteDuplicates[Keys[updatedAmountRules]]
 				]
 			]
 		],
 		resolvedPrimitivesWithRefs
 	];
 
+	(* bring the final inventory amounts back into rules for the lookups below *)
+	modelToInventoryRules=Normal[modelInventoryLookup];
+
 	(* create replace rules of sample to first manipulation with insufficient sample's amount *)
-	firstPrimitiveWithInsufficientSamples=MapThread[
-		Function[{sample, primitive},
-			If[MatchQ[primitive, SampleManipulationP],
-				sample -> primitive,
+	firstPrimitiveWithInsufficientSamples=Map[
+		Function[{sample},
+			If[KeyExistsQ[firstInsufficientPrimitiveLookup, sample],
+				sample -> firstInsufficientPrimitiveLookup[sample],
 				Nothing
 			]
 		],
-		{objRefList, objRefList /. Flatten[primitiveWithInsufficientSamples]}
+		objRefList
 	];
 
 	(* replace the primitive with their original user-specified positions *)
@@ -1485,6 +1514,15 @@ SampleUsage[myPrimitives:{SampleManipulationP..}, ops:OptionsPattern[]]:=Module[
 (*SampleUsage Helper Functions*)
 
 
+(* get a packet the way fetchPacketFromCache does, but from the association made by makeFastAssocFromCache *)
+(* Null stays Null, packets are returned as they are, and anything that isn't in the cache gets an empty packet *)
+usagePacketLookup[myObject_, myFastCache_Association]:=Switch[myObject,
+	Null, Null,
+	_Association, myObject,
+	ObjectP[], Replace[Experiment`Private`fetchPacketFromFastAssoc[myObject, myFastCache], {} -> <||>],
+	_, <||>
+];
+
 (* create a helper function to calculate total amount in user's/public inventory for each model *)
 (* empty list overload. return zero amount with unit based on the model's state *)
 totalAmountLookup[{}, modelPacket_]:=Switch[Lookup[modelPacket, State],
@@ -87,6 +87,25 @@ DefineTests[SampleUsage,
 			],
 			{_Association..}
 		],
+		Example[{Additional, "The usage of a sample over many manipulations is added up, and the sample is reported once:"},
+			Lookup[
+				SampleUsage[
+					Table[
+						Transfer[
+							Source -> Object[Sample, "SampleUsage Test Methanol Sample"],
+							Amount -> 1 * Microliter,
+							Destination -> Model[Container, Vessel, "50mL Tube"]
+						],
+						1000
+					],
+					OutputFormat -> Association,
+					InventoryComparison -> True
+				],
+				Usage
+			],
+			{1 * Milliliter},
+			EquivalenceFunction -> Equal
+		],
 
 		(* ---options--- *)
 		Example[{Options, Messages, "If Messages -> False, suppresses the all the messages thrown:"},
@@ -993,11 +993,14 @@ DefineUsage[OrderSamples,
 			}
 		}},
 		MoreInformation->{
-			"Placing an order for a given product or a model sample creates a transaction order to track its status through when the ordered item is received."
+			"Placing an order for a given product or a model sample creates a transaction order to track its status through when the ordered item is received.",
+			"When many objects are ordered at once, items from the same supplier with the same destination, shipping speed and notebook are merged into a single transaction order.",
+			"All of the orders from a single call are uploaded together under one upload transaction (see the Transaction option), such that the entire batch can be reverted with RollbackTransaction."
 		},
 		SeeAlso->{
 			"CancelTransaction",
-			"DropShipSamples"
+			"DropShipSamples",
+			"RollbackTransaction"
 		},
 		Author->{"lige.tonggu", "wyatt", "robert"}
 	}
@@ -10987,6 +10987,17 @@ DefineOptions[OrderSamples,
 			],
 			Category -> "Hidden"
 		},
+		{
+			OptionName -> Transaction,
+			Default -> Automatic,
+			Description -> "The upload transaction under which every order and status update generated by this call is uploaded, such that the entire batch of orders can be reverted with RollbackTransaction. If None, the orders are uploaded without opening a transaction of their own.",
+			ResolutionDescription -> "Automatically resolves to a new unique transaction ID if Upload is True, otherwise resolves to None.",
+			AllowNull -> False,
+			Widget -> Alternatives[
+				Widget[Type -> String, Pattern :> _String, Size -> Line],
+				Widget[Type -> Enumeration, Pattern :> Alternatives[None]]
+			]
+		},
 		EmailOption,
 		OutputOption,
 		UploadOption,
@@ -11039,7 +11050,8 @@ OrderSamples[myObjects:{(ObjectP[Object[Product]]|ObjectP[Model])...},myOrderAmo
 		mergedModelProductNotebooks,dependentProtPacks,expandedProductCreators,expandedModelCreators,mergedModelCreators,
 		possibleAuthors,
 		allInputContainers, modelContainerPackets, productContainerPackets, rackPackets, racks,
-		rackResult, invalidRackRules, noRackRules, invalidRacksTest, noRacksTest, resolvedSites
+		rackResult, invalidRackRules, noRackRules, invalidRacksTest, noRacksTest, resolvedSites,
+		resolvedTransaction, uploadTransaction
 	},
 
 	(* ------------- *)
@@ -11271,6 +11283,15 @@ OrderSamples[myObjects:{(ObjectP[Object[Product]]|ObjectP[Model])...},myOrderAmo
 		And[Lookup[safeOps,Upload], MemberQ[output, Result]]
 	];
 
+	(* -- Transaction -- *)
+
+	(* Resolve Transaction if Automatic: tag the single Upload of all orders with a fresh transaction ID so that the whole
+	batch can be reverted with RollbackTransaction if the caller needs to back it out *)
+	resolvedTransaction = If[MatchQ[Lookup[safeOps,Transaction], Automatic],
+		If[TrueQ[Lookup[safeOps,Upload]], CreateUUID[], None],
+		Lookup[safeOps,Transaction]
+	];
+
 	(* -- Site -- *)
 
 	resolvedSites = MapThread[
@@ -11297,7 +11318,8 @@ OrderSamples[myObjects:{(ObjectP[Object[Product]]|ObjectP[Model])...},myOrderAmo
 			Creator -> resolvedCreators,
 			InternalOrder -> resolvedInternalOrderQ,
 			Email -> resolvedEmailQ,
-			Destination-> resolvedSites
+			Destination-> resolvedSites,
+			Transaction -> resolvedTransaction
 		}
 	];
 
@@ -11962,10 +11984,30 @@ OrderSamples[myObjects:{(ObjectP[Object[Product]]|ObjectP[Model])...},myOrderAmo
 	(* Join all update packets *)
 	allUpdates = Join[productOrderPackets,modelOrderPackets,orderStatusUpdates];
 
-	(* Upload all the packets if Upload -> True and return the order IDs *)
+	(* If we have a transaction ID, open it around the upload (rather than passing it to Upload directly) so that any
+	transaction the caller already has open still covers these orders as well *)
+	uploadTransaction = If[TrueQ[Lookup[safeOps,Upload]] && MatchQ[resolvedTransaction, _String],
+		BeginUploadTransaction[resolvedTransaction],
+		None
+	];
+
+	(* BeginUploadTransaction has already thrown a message if this transaction is already open *)
+	If[MatchQ[uploadTransaction, $Failed],
+		Return[outputSpecification/.{Result -> $Failed, Tests -> allTests, Options -> RemoveHiddenOptions[OrderSamples,collapsedOptions], Preview -> Null}]
+	];
+
+	(* Upload all the packets in a single call if Upload -> True and return the order IDs *)
 	result = If[TrueQ[Lookup[safeOps,Upload]],
 		(
-			allUploads = Upload[allUpdates];
+			allUploads = If[MatchQ[uploadTransaction, _String],
+				(* Close the transaction even if the upload failed so it doesn't leak into any later uploads *)
+				Module[{uploadedObjects},
+					uploadedObjects = Upload[allUpdates];
+					EndUploadTransaction[];
+					uploadedObjects
+				],
+				Upload[allUpdates]
+			];
 			(*Only output order packets with Destinations*)
 			DeleteDuplicates[Cases[allUploads,ObjectP[Object[Transaction,Order],Destination]]]
 		),
@@ -16387,6 +16387,41 @@ DefineTests[OrderSamples,
             },
             Variables :> {transaction}
         ],
+        Example[{Options, Transaction, "All orders placed by a single call are uploaded under one upload transaction, which resolves to a new transaction ID if not specified:"},
+            {transaction, options} = OrderSamples[
+                {Object[Product, "Waters size exclusion column, 30 mm"], Object[Product, "Dishwashing rack"]},
+                {3, 1},
+                Output -> {Result, Options}
+            ];
+            Lookup[options, Transaction],
+            _String,
+            TearDown :> {
+                If[MatchQ[transaction, {ObjectP[Object[Transaction, Order]]..}],
+                    EraseObject[transaction, Force -> True],
+                    Print["The following objects: ", transaction, " did not erase in the database"]
+                ]
+            },
+            Variables :> {transaction, options}
+        ],
+        Example[{Options, Transaction, "Specify the upload transaction for a batch of orders so that the entire batch can later be reverted with RollbackTransaction:"},
+            (
+                transactionID = "OrderSamples batch " <> CreateUUID[];
+                transaction = OrderSamples[
+                    {Object[Product, "Waters size exclusion column, 30 mm"], Object[Product, "Dishwashing rack"]},
+                    {3, 1},
+                    Transaction -> transactionID
+                ];
+                RollbackTransaction[transactionID, Force -> True]
+            ),
+            _List,
+            TearDown :> {
+                If[MatchQ[transaction, {ObjectP[Object[Transaction, Order]]..}],
+                    EraseObject[PickList[transaction, DatabaseMemberQ[transaction]], Force -> True],
+                    Print["The following objects: ", transaction, " did not erase in the database"]
+                ]
+            },
+            Variables :> {transactionID, transaction}
+        ],
         Test["Specify a subset of the samples that will send to your work location after received by ECL:",
             transactions = OrderSamples[{Model[Sample, "Test Model Chemical for Order Inhouse Samples (A1)"], Model[Sample, "Test Model Chemical for Order Inhouse Samples (A2)"]}, {120 Gram, 100 Gram}, ShipToUser -> {True, False}, InternalOrder -> False];
             Download[transactions, {Status, ShipToUser, OrderQuantities, QuantitiesReceived}],
@@ -17269,6 +17304,18 @@ DefineTests[OrderSamples,
             Variables :> {order},
             TearDown :> (If[!MatchQ[order, $Failed], EraseObject[order, Force -> True]])
         ],
+        Example[{Messages, "TransactionAlreadyExists", "Nothing is uploaded if the specified Transaction is already open:"},
+            (
+                transactionID = BeginUploadTransaction["OrderSamples batch " <> CreateUUID[]];
+                order = OrderSamples[Object[Product, "Waters size exclusion column, 30 mm"], 3, Transaction -> transactionID];
+                EndUploadTransaction[];
+                order
+            ),
+            $Failed,
+            Messages :> {RollbackTransaction::TransactionAlreadyExists},
+            Variables :> {transactionID, order},
+            TearDown :> (If[!MatchQ[order, $Failed], EraseObject[order, Force -> True]])
+        ],
         Test[
             "If Emerald is the Supplier of the Product, InternalOrder MUST be True, even if Autogenerated->True:",
             order = OrderSamples[Object[Product, "Fake Product with ECL as Supplier"], 3, Autogenerated -> True];
@@ -99,6 +99,25 @@ DefineUsage[FastTrackOption,
 
 
 
+(* ::Subsubsection::Closed:: *)
+(*FailFastOption*)
+
+
+DefineUsage[FailFastOption,
+	{
+		BasicDefinitions -> {
+			{"FailFastOption", None, "adds the FailFast option to a ValidQ function's list of options."}
+		},
+		SeeAlso -> {
+			"VerboseOption",
+			"OutputFormatOption",
+			"RunUnitTest"
+		},
+		Author -> {"agent"}
+	}];
+
+
+
 (* ::Subsubsection::Closed:: *)
 (*UploadOption*)
 
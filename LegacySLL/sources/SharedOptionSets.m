@@ -48,6 +48,24 @@ DefineOptionSet[
 
 
 
+(* ::Subsubsection::Closed:: *)
+(*FailFastOption*)
+
+
+DefineOptionSet[
+	FailFastOption :> {
+		{
+			OptionName->FailFast,
+			Default->False,
+			AllowNull->False,
+			Widget->Widget[Type->Enumeration,Pattern:>BooleanP],
+			Description->"Indicates if the tests should stop at the first one which fails, reporting only the tests up to and including it and only checking the inputs with ValidObjectQ if no earlier test fails. The experiment still runs all of its own checks to generate its tests, so this shortens the report and can skip ValidObjectQ, but does not skip any of the experiment's checks."
+		}
+	}
+];
+
+
+
 (* ::Subsubsection::Closed:: *)
 (*NameOption*)
 
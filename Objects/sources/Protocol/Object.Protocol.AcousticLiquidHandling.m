@@ -50,6 +50,14 @@ DefineObjectType[Object[Protocol,AcousticLiquidHandling],{
 			Category -> "General",
 			Developer -> True
 		},
+		EstimatedTimeSavings -> {
+			Format -> Single,
+			Class -> Real,
+			Pattern :> GreaterEqualP[0 Minute],
+			Units -> Minute,
+			Description -> "The estimated instrument time saved by executing the manipulations in the order given by OptimizePrimitives instead of the order defined in the input primitives, based on the number of plate changes required by each order.",
+			Category -> "General"
+		},
 
 		(* ---------- Objects Fields ---------- *)
 		LiquidHandler->{
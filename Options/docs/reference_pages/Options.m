@@ -101,6 +101,40 @@ DefineUsage[OptionDefinition,
 ];
 
 
+
+(* ::Subsubsection:: *)
+(*OptionsSchema*)
+
+
+DefineUsage[OptionsSchema,
+	{
+		BasicDefinitions->{
+			{"OptionsSchema[function]", "schema", "returns a compact, JSON-exportable 'schema' of the options of the 'function'."},
+			{"OptionsSchema[functions]", "schemas", "returns the options 'schemas' of all of the 'functions', keyed by function name."}
+		},
+		MoreInformation->{
+			"The schema is keyed by option name. Each option Association has the following keys:",
+			"\"Default\" (_String): the default value of the option in InputForm.",
+			"\"Pattern\" (_String): the pattern the option must match in InputForm.",
+			"\"PatternTooltip\" (_String|Null): a human readable description of the pattern.",
+			"\"Category\" (_String|Null): the category the option is grouped under.",
+			"Since every value is a string, the schema can be written out with Export[file, OptionsSchema[functions], \"RawJSON\"]."
+		},
+		Input:>{
+			{"function",_Symbol,"Name of the symbol to summarize options for."},
+			{"functions",{___Symbol},"Names of the symbols to summarize options for."}
+		},
+		Output:>{
+			{"schema",_Association,"An Association of option name to the option's default, pattern, pattern tooltip and category."},
+			{"schemas",_Association,"An Association of function name to the schema of its options."}
+		},
+		SeeAlso->{"OptionDefinition","DefineOptions","OptionDefaults"},
+		Author->{"platform"},
+		Tutorials->{}
+	}
+];
+
+
 (* ::Subsection::Closed:: *)
 (*Option Parsing*)
 
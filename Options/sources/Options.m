@@ -1073,6 +1073,33 @@ OptionDefinition[symbol_Symbol]:=(
 
 
 
+(* ::Subsubsection::Closed:: *)
+(*OptionsSchema*)
+
+
+(* Compact summary of the options of each function, for clients outside of Mathematica which need to know the options
+of a function without loading it. Held values are stored as InputForm strings since they have no JSON equivalent. *)
+OptionsSchema[symbol_Symbol]:=Association[
+	Map[
+		Lookup[#, "OptionName"] -> <|
+			"Default" -> Replace[Lookup[#, "Default"], Hold[default_] :> ToString[Unevaluated[default], InputForm]],
+			"Pattern" -> Replace[Lookup[#, "Pattern"], Hold[pattern_] :> ToString[Unevaluated[pattern], InputForm]],
+			"PatternTooltip" -> Replace[Lookup[#, "PatternTooltip", Null], Except[_String] -> Null],
+			"Category" -> Replace[Lookup[#, "Category", Null], Except[_String] -> Null]
+		|>&,
+		OptionDefinition[symbol]
+	]
+];
+
+OptionsSchema[symbols:{___Symbol}]:=Association[
+	Map[
+		SymbolName[#] -> OptionsSchema[#]&,
+		symbols
+	]
+];
+
+
+
 
 
 (* ::Subsection::Closed:: *)
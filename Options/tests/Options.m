@@ -59,6 +59,46 @@ DefineTests[
 
 
 
+(* ::Subsubsection::Closed:: *)
+(*OptionsSchema*)
+
+
+DefineTests[
+	OptionsSchema,
+	{
+		Example[{Basic,"Summarize the options of a function:"},
+			Module[{func},
+				DefineOptions[func,Options:>{{A->2,_Integer,"An integer."},{B:>{"a","b","c"},{_String..},"A list of strings."}}];
+				Lookup[OptionsSchema[func],#][["Default"]]&/@{"A","B"}
+			],
+			{"2","{\"a\", \"b\", \"c\"}"}
+		],
+		Example[{Basic,"Patterns are given in InputForm:"},
+			Module[{func},
+				DefineOptions[func,Options:>{{A->2,_Integer,"An integer."}}];
+				OptionsSchema[func][["A","Pattern"]]
+			],
+			"_Integer"
+		],
+		Example[{Basic,"Summarize the options of several functions at once, keyed by function name:"},
+			Module[{func1,func2},
+				DefineOptions[func1,Options:>{{A->2,_Integer,"An integer."}}];
+				DefineOptions[func2,Options:>{{B->"b",_String,"A string."}}];
+				Keys/@Values[OptionsSchema[{func1,func2}]]
+			],
+			{{"A"},{"B"}}
+		],
+		Test["The schema can be exported as JSON:",
+			Module[{func},
+				DefineOptions[func,Options:>{{A->2,_Integer,"An integer."},{B:>{"a","b","c"},{_String..},"A list of strings."}}];
+				StringQ[ExportString[OptionsSchema[{func}],"RawJSON"]]
+			],
+			True
+		]
+	}
+];
+
+
 (* ::Subsubsection::Closed:: *)
 (*DefineOptions*)
 
@@ -0,0 +1,278 @@
+"""
+Benchmarks for the python bindings in functions.py.
+
+Measures, for a representative mix of functions (a small call, a heavy resolver call, numeric-heavy calls and a call
+with a large output):
+
+- import: the time to import functions.py in a fresh interpreter
+- overhead: the client-side time spent in ``.call(...)`` with the request stubbed out to return a typical result
+  (kwargs checks, hooks and, for cached functions, hashing the call and the cache lookups)
+- serialization: the time to encode each call into the request body sent to the server, and to decode a typical
+  result from the response body, using the same encoding as the calls sent by the latency benchmark
+- latency: end-to-end latency percentiles of ``.call(...)``, only with --latency. The calls are sent over HTTP, in the
+  protocol PyECLRequest speaks, to a local stand-in server (see mock_server.py) started for the run and answering each
+  call with its typical result, or to the server at --base-url if given.
+
+The results are written as JSON (to stdout, or to --output) so they can be compared between releases:
+
+	python benchmark.py --output benchmark.json
+	python benchmark.py --latency --server-latency 0.05 --jitter 0.01 --repeats 200 --output benchmark.json
+"""
+
+import argparse
+import json
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import time
+import urllib.request
+
+_DIRECTORY = os.path.dirname(os.path.abspath(__file__))
+
+
+def _numeric(rows, columns, seed):
+	generator = random.Random(seed)
+	return [[generator.random() for _ in range(columns)] for _ in range(rows)]
+
+
+# name -> (family, args, kwargs, typical result), kept deterministic so that runs are comparable
+def _cases():
+	return {
+		"UploadName": (
+			"small",
+			["Object[Sample, \"id:abc123\"]", "benchmark sample"],
+			{},
+			"Object[Sample, \"id:abc123\"]",
+		),
+		"ExperimentSamplePreparation": (
+			"resolver",
+			[[
+				{"Type": "Transfer", "Source": "Object[Sample, \"id:{}\"]".format(i), "Destination": "Model[Container, Vessel, \"2mL Tube\"]", "Amount": "100 Microliter"}
+				for i in range(500)
+			]],
+			{},
+			{"Protocol": "Object[Protocol, ManualSamplePreparation, \"id:def456\"]"},
+		),
+		"AnalyzeFit": (
+			"numeric",
+			[_numeric(10000, 2, 1), "Linear"],
+			{},
+			{"BestFitParameters": [[1.0, 0.1, 0.01], [2.0, 0.2, 0.02]], "BestFitResiduals": _numeric(10000, 1, 2)},
+		),
+		"SimulateKinetics": (
+			"numeric",
+			["{a + b \\[Equilibrium] c, 10^5 Molar^-1 Second^-1, 10^-3 Second^-1}", {"a": "1 Micromolar", "b": "1 Micromolar"}, "1 Hour"],
+			{},
+			{"Trajectory": _numeric(20000, 4, 3)},
+		),
+		"EmeraldListLinePlot": (
+			"large-output",
+			[_numeric(5000, 2, 4)],
+			{},
+			{"Graphics": "x" * (4 << 20)},
+		),
+	}
+
+
+def _percentiles(samples):
+	samples = sorted(samples)
+
+	def percentile(fraction):
+		return samples[min(len(samples) - 1, int(round(fraction * (len(samples) - 1))))]
+
+	return {
+		"min": samples[0],
+		"p50": percentile(0.5),
+		"p90": percentile(0.9),
+		"p99": percentile(0.99),
+		"max": samples[-1],
+		"mean": statistics.fmean(samples),
+	}
+
+
+def _time(function, repeats):
+	samples = []
+	for _ in range(repeats):
+		start = time.perf_counter()
+		function()
+		samples.append(time.perf_counter() - start)
+	return _percentiles(samples)
+
+
+def benchmark_import(repeats):
+	"""
+	Times a cold import of functions.py in a fresh interpreter, 'repeats' times.
+	"""
+	code = "import time; start = time.perf_counter(); import functions; print(time.perf_counter() - start)"
+	samples = []
+	for _ in range(repeats):
+		output = subprocess.run(
+			[sys.executable, "-c", code],
+			cwd=_DIRECTORY,
+			check=True,
+			capture_output=True,
+			text=True,
+		).stdout
+		samples.append(float(output.strip().splitlines()[-1]))
+	return _percentiles(samples)
+
+
+def _stubbed(cls, result):
+	# a subclass whose construction, the point at which pyecl sends the call, returns 'result' instead, so that
+	# .call(...) runs all of its client-side work against it without sending anything
+	return type(cls.__name__, (cls,), {"__new__": lambda stub, *args, **kwargs: result})
+
+
+class _Transport:
+	"""
+	Sends calls to the PyECL server at 'base_url' the way PyECLRequest does: a POST to "functions/<name>" with the call
+	as a JSON body and a bearer token, answered with the result as JSON.
+	"""
+
+	def __init__(self, base_url, token="benchmark"):
+		self.base_url = base_url if base_url.endswith("/") else base_url + "/"
+		self.token = token
+
+	@staticmethod
+	def encode(args, kwargs):
+		return json.dumps({"args": args, "kwargs": kwargs}, separators=(",", ":")).encode("utf-8")
+
+	@staticmethod
+	def decode(body):
+		return json.loads(body.decode("utf-8"))
+
+	def send(self, name, args, kwargs):
+		request = urllib.request.Request(
+			self.base_url + "functions/" + name,
+			data=self.encode(args, kwargs),
+			headers={"Authorization": "Bearer " + self.token, "Content-Type": "application/json", "Accept": "application/json"},
+			method="POST",
+		)
+		with urllib.request.urlopen(request) as response:
+			return self.decode(response.read())
+
+	def bind(self, cls):
+		# a subclass whose construction, the point at which pyecl sends the call, sends it through this transport instead
+		return type(cls.__name__, (cls,), {"__new__": lambda bound, *args, **kwargs: self.send(cls.__name__, list(args), kwargs)})
+
+
+def benchmark_overhead(functions, cases, repeats):
+	"""
+	Times the client-side work done by ``.call(...)``, with the request itself replaced by returning a typical result.
+	"""
+	results = {}
+	for name, (family, args, kwargs, result) in cases.items():
+		stub = _stubbed(getattr(functions, name), result)
+		results[name] = dict(family=family, seconds=_time(lambda: stub.call(*args, **kwargs), repeats))
+	return results
+
+
+def benchmark_serialization(cases, repeats):
+	"""
+	Times encoding each call into its request body and decoding its typical result from the response body, as they are
+	sent and received by the latency benchmark, and reports their sizes.
+	"""
+	results = {}
+	for name, (family, args, kwargs, result) in cases.items():
+		# the response body as the stand-in server sends it
+		response = json.dumps(result).encode("utf-8")
+		results[name] = dict(
+			family=family,
+			request_bytes=len(_Transport.encode(args, kwargs)),
+			response_bytes=len(response),
+			encode_seconds=_time(lambda: _Transport.encode(args, kwargs), repeats),
+			decode_seconds=_time(lambda: _Transport.decode(response), repeats),
+		)
+	return results
+
+
+def benchmark_latency(functions, cases, repeats, transport):
+	"""
+	Times complete ``.call(...)`` round trips through 'transport', recording the fraction of calls which raised.
+	"""
+	results = {}
+	for name, (family, args, kwargs, _) in cases.items():
+		cls = transport.bind(getattr(functions, name))
+		samples = []
+		errors = 0
+		for _ in range(repeats):
+			start = time.perf_counter()
+			try:
+				cls.call(*args, **kwargs)
+			except Exception:
+				errors += 1
+			samples.append(time.perf_counter() - start)
+		results[name] = dict(family=family, seconds=_percentiles(samples), error_rate=errors / repeats)
+	return results
+
+
+def run(repeats=50, import_repeats=10, latency=False, base_url=None, profile=None):
+	"""
+	Runs every benchmark and returns the report as a dict. With 'latency', the calls are sent to the server at
+	'base_url', or if that is None to a stand-in server started with the mock_server.Profile 'profile'.
+	"""
+	sys.path.insert(0, _DIRECTORY)
+	import functions
+
+	cases = _cases()
+	report = {
+		"python": platform.python_version(),
+		"platform": platform.platform(),
+		"timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+		"repeats": repeats,
+		"import": benchmark_import(import_repeats),
+		"overhead": benchmark_overhead(functions, cases, repeats),
+		"serialization": benchmark_serialization(cases, repeats),
+	}
+	if latency and base_url is not None:
+		report["latency"] = benchmark_latency(functions, cases, repeats, _Transport(base_url))
+	elif latency:
+		import mock_server
+		profile = profile or mock_server.Profile()
+		# answer every call with its typical result, so that the responses are the size they would be
+		profile.responses = {name: result for name, (_, _, _, result) in cases.items()}
+		server = mock_server.MockServer(profile=profile).start()
+		try:
+			report["latency"] = benchmark_latency(functions, cases, repeats, _Transport(server.url))
+			report["server"] = dict(url=server.url, latency=profile.latency, jitter=profile.jitter, error_rate=profile.error_rate, seed=profile.seed)
+		finally:
+			server.shutdown()
+			server.server_close()
+	return report
+
+
+def main(argv=None):
+	parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+	parser.add_argument("--repeats", type=int, default=50, help="the number of times each measurement is repeated")
+	parser.add_argument("--import-repeats", type=int, default=10, help="the number of fresh interpreters to time imports in")
+	parser.add_argument("--latency", action="store_true", help="also measure end-to-end latency by sending calls to a server")
+	parser.add_argument("--base-url", help="the server to send the latency calls to, instead of a local stand-in server")
+	parser.add_argument("--server-latency", type=float, default=0.0, help="seconds the stand-in server delays every response by")
+	parser.add_argument("--jitter", type=float, default=0.0, help="seconds the stand-in server's delay varies by either way")
+	parser.add_argument("--error-rate", type=float, default=0.0, help="the fraction of requests the stand-in server fails")
+	parser.add_argument("--seed", type=int, default=0, help="seed for the stand-in server's latency and error draws")
+	parser.add_argument("--output", help="the file to write the JSON report to, instead of stdout")
+	arguments = parser.parse_args(argv)
+
+	sys.path.insert(0, _DIRECTORY)
+	import mock_server
+	profile = mock_server.Profile(
+		latency=arguments.server_latency,
+		jitter=arguments.jitter,
+		error_rate=arguments.error_rate,
+		seed=arguments.seed,
+	)
+	report = run(arguments.repeats, arguments.import_repeats, arguments.latency, arguments.base_url, profile)
+	if arguments.output:
+		with open(arguments.output, "w", encoding="utf-8") as f:
+			json.dump(report, f, indent=4)
+	else:
+		json.dump(report, sys.stdout, indent=4)
+		sys.stdout.write("\n")
+
+
+if __name__ == "__main__":
+	main()
@@ -0,0 +1,243 @@
+"""
+Local stand-in for the PyECL server, for load testing PyECLRequest and the python bindings offline.
+
+It speaks the same protocol as PyECLRequest: GET requests for calls without a body and POST requests with a JSON (or
+WXF) body, a bearer token in the Authorization header, and JSON responses. "ping" answers "pong", and any path whose
+last segment is one of the functions in functions.json (e.g. "functions/ExperimentHPLC") answers with the canned result
+for that function given by --responses (a JSON file of function name -> result), or with a generic padded result for
+functions it does not list. Everything else answers {"result": "success"}. WXF bodies are answered with 415 Unsupported Media
+Type, so that PyECLRequest's fallback to JSON is exercised, unless --accept-wxf is given, in which case they are handled
+like any other body (the body itself is not decoded, and answers are always JSON).
+
+Latency, errors and response sizes are set by a profile. Every random choice for a request is drawn from a generator
+seeded with the profile's seed, the request's path and body, and how many times that same request has been made before,
+so that runs can be repeated exactly however the server's threads happen to interleave. Only the most recent
+MAX_TRACKED_REQUESTS distinct requests are counted; a request which has not been made since then starts over from its
+first draw.
+
+	python mock_server.py --port 8765 --latency 0.05 --jitter 0.01 --error-rate 0.02 --payload-bytes 100000 --seed 1 \
+		--responses responses.json
+
+and then, for example, PyECLRequest["functions/ExperimentHPLC", body, BaseURL -> "http://localhost:8765/"] or
+python benchmark.py --latency --base-url http://localhost:8765/.
+
+--max-in-flight limits the number of requests being handled at once; beyond it the server answers 503, as an
+overloaded backend would, so that retries and backpressure can be measured. Counts of the requests handled are served
+at "mock/stats".
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import random
+import threading
+import time
+from collections import OrderedDict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+_INDEX_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "functions.json")
+
+# the number of distinct requests whose attempts are counted, so that a long load test does not grow without bound
+MAX_TRACKED_REQUESTS = 100000
+
+
+class Profile:
+	"""
+	How the stand-in server behaves: every response is delayed by 'latency' seconds plus up to 'jitter' seconds either
+	way, a fraction 'error_rate' of requests fail with 'error_status', and at most 'max_in_flight' requests (no limit if
+	None) are handled at once. Functions answer with their result in 'responses' (function name -> result), or with a
+	generic result padded to 'payload_bytes' if they are not in it. WXF bodies are answered with 415 unless 'accept_wxf'
+	is True.
+	"""
+
+	def __init__(self, latency=0.0, jitter=0.0, error_rate=0.0, error_status=500, payload_bytes=0, max_in_flight=None, seed=0, accept_wxf=False, responses=None):
+		self.latency = latency
+		self.jitter = jitter
+		self.error_rate = error_rate
+		self.error_status = error_status
+		self.payload_bytes = payload_bytes
+		self.max_in_flight = max_in_flight
+		self.seed = seed
+		self.accept_wxf = accept_wxf
+		self.responses = dict(responses or {})
+
+
+class MockServer(ThreadingHTTPServer):
+	"""
+	The stand-in server. Runs until shutdown() is called, either with serve_forever() or in the background with start().
+	"""
+
+	daemon_threads = True
+
+	def __init__(self, address=("127.0.0.1", 0), profile=None):
+		super().__init__(address, _Handler)
+		self.profile = profile or Profile()
+		self.functions = self._load_functions()
+		self._lock = threading.Lock()
+		# (path, body digest) -> how many times that request has been made, for seeding the draws of each request, least
+		# recently made first and holding at most MAX_TRACKED_REQUESTS requests
+		self._attempts = OrderedDict()
+		self._in_flight = 0
+		self.stats = {"requests": 0, "errors": 0, "rejected": 0, "bytes_in": 0, "bytes_out": 0}
+
+	@property
+	def url(self):
+		host, port = self.server_address[:2]
+		return "http://{}:{}/".format(host, port)
+
+	def start(self):
+		"""
+		Serves requests on a background thread and returns the server.
+		"""
+		threading.Thread(target=self.serve_forever, daemon=True).start()
+		return self
+
+	@staticmethod
+	def _load_functions():
+		try:
+			with open(_INDEX_PATH, encoding="utf-8") as f:
+				return frozenset(json.load(f))
+		except FileNotFoundError:
+			return frozenset()
+
+	def _draw(self, path, body):
+		# the delay and whether to fail, drawn from a generator of this request's own, so that they only depend on the
+		# seed and the request and not on which other requests other threads are handling at the same time
+		digest = hashlib.sha256(body).hexdigest()
+		with self._lock:
+			attempt = self._attempts.pop((path, digest), 0)
+			self._attempts[(path, digest)] = attempt + 1
+			if len(self._attempts) > MAX_TRACKED_REQUESTS:
+				self._attempts.popitem(last=False)
+		generator = random.Random("{}:{}:{}:{}".format(self.profile.seed, path, digest, attempt))
+		delay = max(0.0, self.profile.latency + generator.uniform(-self.profile.jitter, self.profile.jitter))
+		fail = generator.random() < self.profile.error_rate
+		return delay, fail
+
+	def _enter(self):
+		with self._lock:
+			self.stats["requests"] += 1
+			if self.profile.max_in_flight is not None and self._in_flight >= self.profile.max_in_flight:
+				self.stats["rejected"] += 1
+				return False
+			self._in_flight += 1
+			return True
+
+	def _exit(self):
+		with self._lock:
+			self._in_flight -= 1
+
+	def _count(self, key, amount=1):
+		with self._lock:
+			self.stats[key] += amount
+
+	def respond(self, path, body):
+		"""
+		Returns the (status, content type, body) for a request to 'path'.
+		"""
+		segments = [segment for segment in path.split("?")[0].split("/") if segment]
+		if segments == ["ping"]:
+			return 200, "application/json", json.dumps("pong")
+		if segments == ["mock", "stats"]:
+			with self._lock:
+				return 200, "application/json", json.dumps(self.stats)
+		delay, fail = self._draw(path, body)
+		time.sleep(delay)
+		if fail:
+			self._count("errors")
+			return self.profile.error_status, "application/json", json.dumps({"error": "mock server error"})
+		name = segments[-1] if segments else ""
+		if name in self.profile.responses:
+			result = self.profile.responses[name]
+		elif name in self.functions:
+			result = {"function": name, "result": "success", "padding": "x" * self.profile.payload_bytes}
+		else:
+			result = {"result": "success"}
+		return 200, "application/json", json.dumps(result)
+
+
+class _Handler(BaseHTTPRequestHandler):
+	protocol_version = "HTTP/1.1"
+
+	def do_GET(self):
+		self._handle(b"")
+
+	def do_POST(self):
+		length = int(self.headers.get("Content-Length") or 0)
+		self._handle(self.rfile.read(length))
+
+	def _handle(self, body):
+		server = self.server
+		if not self.headers.get("Authorization", "").startswith("Bearer "):
+			self._send(401, "application/json", json.dumps({"error": "missing bearer token"}))
+			return
+		server._count("bytes_in", len(body))
+		if not server.profile.accept_wxf and self.headers.get("Content-Type", "").startswith("application/vnd.wolfram.wxf"):
+			self._send(415, "application/json", json.dumps({"error": "unsupported media type"}))
+			return
+		if not server._enter():
+			self._send(503, "application/json", json.dumps({"error": "mock server overloaded"}))
+			return
+		try:
+			status, content_type, payload = server.respond(self.path, body)
+		finally:
+			server._exit()
+		self._send(status, content_type, payload)
+
+	def _send(self, status, content_type, payload):
+		data = payload.encode("utf-8")
+		self.server._count("bytes_out", len(data))
+		self.send_response(status)
+		self.send_header("Content-Type", content_type)
+		self.send_header("Content-Length", str(len(data)))
+		self.end_headers()
+		self.wfile.write(data)
+
+	def log_message(self, format, *args):
+		# a load test would otherwise spend most of its time logging
+		pass
+
+
+def main(argv=None):
+	parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+	parser.add_argument("--host", default="127.0.0.1")
+	parser.add_argument("--port", type=int, default=8765)
+	parser.add_argument("--latency", type=float, default=0.0, help="seconds to delay every response by")
+	parser.add_argument("--jitter", type=float, default=0.0, help="seconds the delay varies by either way")
+	parser.add_argument("--error-rate", type=float, default=0.0, help="the fraction of requests which fail")
+	parser.add_argument("--error-status", type=int, default=500, help="the status code failed requests answer with")
+	parser.add_argument("--payload-bytes", type=int, default=0, help="bytes of padding in the generic function result")
+	parser.add_argument("--responses", help="a JSON file of function name -> the result that function answers with")
+	parser.add_argument("--max-in-flight", type=int, help="requests handled at once before answering 503")
+	parser.add_argument("--seed", type=int, default=0, help="seed for the latency and error draws")
+	parser.add_argument("--accept-wxf", action="store_true", help="handle WXF bodies instead of answering them with 415")
+	arguments = parser.parse_args(argv)
+
+	responses = None
+	if arguments.responses:
+		with open(arguments.responses, encoding="utf-8") as f:
+			responses = json.load(f)
+	profile = Profile(
+		latency=arguments.latency,
+		jitter=arguments.jitter,
+		error_rate=arguments.error_rate,
+		error_status=arguments.error_status,
+		payload_bytes=arguments.payload_bytes,
+		max_in_flight=arguments.max_in_flight,
+		seed=arguments.seed,
+		accept_wxf=arguments.accept_wxf,
+		responses=responses,
+	)
+	server = MockServer((arguments.host, arguments.port), profile)
+	print("Serving on {}".format(server.url), flush=True)
+	try:
+		server.serve_forever()
+	except KeyboardInterrupt:
+		pass
+	finally:
+		server.server_close()
+
+
+if __name__ == "__main__":
+	main()
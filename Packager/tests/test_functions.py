@@ -0,0 +1,184 @@
+"""
+Tests for the client-side parts of the python bindings in Packager/resources/functions.py. Nothing here talks to a
+server; the tests are skipped where pyecl is not installed.
+"""
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+pytest.importorskip("pyecl")
+
+_RESOURCES = os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, "resources")
+sys.path.insert(0, _RESOURCES)
+
+import functions  # noqa: E402
+
+
+class _SameRepr:
+	def __init__(self, value):
+		self.value = value
+
+	def __repr__(self):
+		return "_SameRepr(...)"
+
+
+def _cache(tmp_path=None, maxsize=8, max_bytes=1 << 20):
+	directory = None if tmp_path is None else str(tmp_path / "cache")
+	return functions._ResultCache("1", maxsize, directory, max_bytes)
+
+
+# --- keys ---
+
+def test_key_is_the_same_for_equal_calls():
+	cache = _cache()
+	assert cache.key("SimulateFreeEnergy", ("ATGC",), {"Temperature": 37, "Options": {"b": 1, "a": 2}}) == \
+		cache.key("SimulateFreeEnergy", ["ATGC"], {"Options": {"a": 2, "b": 1}, "Temperature": 37})
+
+
+def test_key_differs_between_calls():
+	cache = _cache()
+	keys = {
+		cache.key("SimulateFreeEnergy", ("ATGC",), {}),
+		cache.key("SimulateEnthalpy", ("ATGC",), {}),
+		cache.key("SimulateFreeEnergy", ("ATGG",), {}),
+		cache.key("SimulateFreeEnergy", ((1, 2),), {}),
+		cache.key("SimulateFreeEnergy", ([1, 2],), {}),
+		cache.key("SimulateFreeEnergy", ("1",), {}),
+		cache.key("SimulateFreeEnergy", (1,), {}),
+		functions._ResultCache("2", 8, None, 0).key("SimulateFreeEnergy", ("ATGC",), {}),
+	}
+	assert len(keys) == 8
+
+
+def test_values_without_a_stable_form_are_not_cached():
+	cache = _cache()
+	assert cache.key("SimulateFreeEnergy", (_SameRepr(1),), {}) is None
+	assert cache.key("SimulateFreeEnergy", (), {"Sequence": _SameRepr(2)}) is None
+	assert cache.key("SimulateFreeEnergy", (object(),), {}) is None
+
+
+def test_set_keys_are_the_same_in_every_process():
+	script = "import sys; sys.path.insert(0, {!r}); import functions; print(functions._ResultCache('1', 1, None, 0).key('SimulateFolding', ({{'a', 'b', 'c', 'd'}},), {{}}))".format(_RESOURCES)
+	keys = {
+		subprocess.run(
+			[sys.executable, "-c", script],
+			env=dict(os.environ, PYTHONHASHSEED=str(seed)),
+			stdout=subprocess.PIPE,
+			check=True,
+			universal_newlines=True,
+		).stdout.strip()
+		for seed in (1, 2, 3)
+	}
+	assert len(keys) == 1 and keys != {"None"}
+
+
+# --- memory tier ---
+
+def test_memory_tier_evicts_the_least_recently_used_result():
+	cache = _cache(maxsize=2)
+	cache.put("a", 1)
+	cache.put("b", 2)
+	assert cache.get("a") == (True, 1)
+	cache.put("c", 3)
+	assert cache.get("b") == (False, None)
+	assert cache.get("a") == (True, 1)
+	assert cache.get("c") == (True, 3)
+
+
+# --- disk tier ---
+
+def test_disk_tier_is_shared_with_later_caches(tmp_path):
+	key = _cache(tmp_path).key("SimulateFreeEnergy", ("ATGC",), {})
+	_cache(tmp_path).put(key, {"FreeEnergy": -1.5})
+	assert _cache(tmp_path).get(key) == (True, {"FreeEnergy": -1.5})
+
+
+def test_disk_tier_evicts_the_least_recently_used_entries(tmp_path):
+	cache = _cache(tmp_path, maxsize=1, max_bytes=2500)
+	for key in ("aa1", "bb2", "cc3"):
+		cache.put(key, "x" * 1000)
+	assert cache._disk_bytes <= 2500
+	assert cache.get("aa1") == (False, None)
+	assert cache.get("cc3") == (True, "x" * 1000)
+	assert sum(os.path.getsize(path) for path, _, _ in cache._entries()) == cache._disk_bytes
+
+
+def test_disk_tier_errors_do_not_fail_the_call(tmp_path, monkeypatch):
+	cache = _cache(tmp_path)
+
+	def full_disk(*args, **kwargs):
+		raise OSError(28, "No space left on device")
+
+	monkeypatch.setattr(functions.os, "replace", full_disk)
+	cache.put("aa1", 1)
+	assert cache.get("aa1") == (True, 1)
+	assert cache._disk_bytes == 0
+	assert not [file for _, _, files in os.walk(str(tmp_path)) for file in files]
+
+
+def test_clear_removes_both_tiers(tmp_path):
+	cache = _cache(tmp_path)
+	cache.put("aa1", 1)
+	cache.clear()
+	assert cache.get("aa1") == (False, None)
+	assert _cache(tmp_path).get("aa1") == (False, None)
+
+
+# --- calls ---
+
+def _counting(name):
+	# a subclass of the binding whose construction, where pyecl sends the call, returns its arguments instead
+	calls = []
+
+	def send(cls, *args, **kwargs):
+		calls.append((args, kwargs))
+		if "fail" in args:
+			raise RuntimeError("the server returned an error")
+		return {"args": list(args), "kwargs": kwargs}
+
+	return type(name, (getattr(functions, name),), {"__new__": send}), calls
+
+
+def test_call_uses_the_cache_for_pure_functions(tmp_path):
+	function, calls = _counting("SimulateFreeEnergy")
+	functions.enable_cache("1", directory=str(tmp_path))
+	try:
+		first = function.call("ATGC", Temperature=37)
+		second = function.call("ATGC", Temperature=37)
+	finally:
+		functions.disable_cache()
+	assert first == second == {"args": ["ATGC"], "kwargs": {"Temperature": 37}}
+	assert len(calls) == 1
+
+
+def test_hooks_see_every_call():
+	function, _ = _counting("SimulateFreeEnergy")
+	records = []
+	handle = functions.add_hooks(after=records.append)
+	try:
+		function.call("ATGC")
+	finally:
+		functions.remove_hooks(handle)
+	function.call("ATGC")
+	assert [record.name for record in records] == ["SimulateFreeEnergy"]
+	assert records[0].result == {"args": ["ATGC"], "kwargs": {}}
+
+
+def test_acall_and_batch_return_results_in_order():
+	import asyncio
+	function, _ = _counting("SimulateFreeEnergy")
+	assert asyncio.run(function.acall("ATGC")) == {"args": ["ATGC"], "kwargs": {}}
+	results = function.batch([(("A",), {}), (("fail",), {}), (("C",), {"Temperature": 37})])
+	assert results[0] == {"args": ["A"], "kwargs": {}}
+	assert isinstance(results[1], RuntimeError)
+	assert results[2] == {"args": ["C"], "kwargs": {"Temperature": 37}}
+
+
+def test_options_are_left_for_the_server_to_check():
+	function, calls = _counting("ExperimentHPLC")
+	assert function.call("sample", Colum="column") == {"args": ["sample"], "kwargs": {"Colum": "column"}}
+	assert calls == [(("sample",), {"Colum": "column"})]
+	assert not hasattr(functions, "options")
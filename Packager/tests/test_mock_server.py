@@ -0,0 +1,69 @@
+"""
+Tests for the local stand-in PyECL server in Packager/resources/mock_server.py.
+"""
+
+import json
+import os
+import sys
+import urllib.error
+import urllib.request
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, "resources"))
+
+import mock_server  # noqa: E402
+
+
+@pytest.fixture
+def server():
+	server = mock_server.MockServer(profile=mock_server.Profile(responses={"ExperimentHPLC": {"Protocol": "Object[Protocol, HPLC, \"id:abc\"]"}}))
+	server.functions = frozenset(("ExperimentHPLC", "ExperimentPCR"))
+	yield server
+	server.server_close()
+
+
+def test_functions_answer_with_their_canned_result(server):
+	status, _, body = server.respond("/functions/ExperimentHPLC", b"{}")
+	assert status == 200
+	assert json.loads(body) == {"Protocol": "Object[Protocol, HPLC, \"id:abc\"]"}
+
+
+def test_other_functions_answer_with_the_generic_result(server):
+	server.profile.payload_bytes = 10
+	assert json.loads(server.respond("/functions/ExperimentPCR", b"{}")[2]) == {"function": "ExperimentPCR", "result": "success", "padding": "x" * 10}
+	assert json.loads(server.respond("/other", b"{}")[2]) == {"result": "success"}
+
+
+def test_draws_only_depend_on_the_seed_and_the_request():
+	profiles = [mock_server.Profile(latency=1.0, jitter=0.5, error_rate=0.5, seed=1) for _ in range(2)]
+	first, second = (mock_server.MockServer(profile=profile) for profile in profiles)
+	try:
+		draws = [first._draw("/functions/ExperimentPCR", b"{}") for _ in range(3)]
+		second._draw("/functions/ExperimentHPLC", b"{}")
+		assert [second._draw("/functions/ExperimentPCR", b"{}") for _ in range(3)] == draws
+		assert len(set(draws)) == 3
+	finally:
+		first.server_close()
+		second.server_close()
+
+
+def test_only_the_most_recent_requests_are_tracked(server, monkeypatch):
+	monkeypatch.setattr(mock_server, "MAX_TRACKED_REQUESTS", 2)
+	for body in (b"1", b"2", b"1", b"3"):
+		server._draw("/functions/ExperimentPCR", body)
+	assert len(server._attempts) == 2
+	assert [body for (_, body) in server._attempts] == [mock_server.hashlib.sha256(body).hexdigest() for body in (b"1", b"3")]
+
+
+def test_requests_need_a_bearer_token(server):
+	server.start()
+	try:
+		with pytest.raises(urllib.error.HTTPError) as error:
+			urllib.request.urlopen(server.url + "ping")
+		assert error.value.code == 401
+		request = urllib.request.Request(server.url + "functions/ExperimentHPLC", data=b"{}", headers={"Authorization": "Bearer token"})
+		with urllib.request.urlopen(request) as response:
+			assert json.loads(response.read()) == {"Protocol": "Object[Protocol, HPLC, \"id:abc\"]"}
+	finally:
+		server.shutdown()